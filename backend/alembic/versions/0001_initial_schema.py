@@ -0,0 +1,267 @@
+"""Initial schema
+
+The models as of the move to Alembic. Databases created earlier by
+``SQLModel.metadata.create_all`` already have some of these tables, in
+whatever shape the models had then; only the missing tables are created
+here, and the following revisions bring the existing ones up to date.
+
+Revision ID: 0001
+Revises:
+Create Date: 2026-10-17 20:48:34.217628
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.migrations import has_table
+
+# revision identifiers, used by Alembic.
+revision: str = "0001"
+down_revision: Union[str, None] = None
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if not has_table("categories"):
+        op.create_table(
+            "categories",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("name", sa.Unicode(length=100), nullable=False),
+            sa.Column("description", sa.Unicode(length=500), nullable=True),
+            sa.Column("image_url", sa.Unicode(length=500), nullable=True),
+            sa.Column("is_active", sa.Boolean(), nullable=False),
+            sa.Column("sort_order", sa.Integer(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index(op.f("ix_categories_name"), "categories", ["name"], unique=True)
+
+    if not has_table("daily_revenue"):
+        op.create_table(
+            "daily_revenue",
+            sa.Column("revenue_date", sa.Date(), nullable=False),
+            sa.Column("status", sa.Enum("PENDING", "CONFIRMED", "PREPARING", "READY", "COMPLETED", "CANCELLED", name="orderstatus"), nullable=False),
+            sa.Column("payment_method", sa.Enum("CASH", "ONLINE", name="paymentmethod"), nullable=False),
+            sa.Column("order_count", sa.Integer(), nullable=False),
+            sa.Column("revenue", sa.Float(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint("revenue_date", "status", "payment_method"),
+        )
+
+    if not has_table("email_outbox"):
+        op.create_table(
+            "email_outbox",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("to_email", sa.Unicode(length=255), nullable=False),
+            sa.Column("subject", sa.Unicode(length=255), nullable=False),
+            sa.Column("text_body", sa.UnicodeText(), nullable=True),
+            sa.Column("html_body", sa.UnicodeText(), nullable=False),
+            sa.Column("status", sa.Enum("PENDING", "SENT", "FAILED", name="emailstatus"), nullable=False),
+            sa.Column("attempts", sa.Integer(), nullable=False),
+            sa.Column("last_error", sa.Unicode(length=500), nullable=True),
+            sa.Column("next_attempt_at", sa.DateTime(), nullable=False),
+            sa.Column("claim_token", sa.Unicode(length=32), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("sent_at", sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index(op.f("ix_email_outbox_claim_token"), "email_outbox", ["claim_token"], unique=False)
+        op.create_index(op.f("ix_email_outbox_next_attempt_at"), "email_outbox", ["next_attempt_at"], unique=False)
+        op.create_index(op.f("ix_email_outbox_status"), "email_outbox", ["status"], unique=False)
+
+    if not has_table("tables"):
+        op.create_table(
+            "tables",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("table_number", sa.Unicode(length=20), nullable=False),
+            sa.Column("capacity", sa.Integer(), nullable=False),
+            sa.Column("status", sa.Enum("AVAILABLE", "OCCUPIED", "RESERVED", name="tablestatus"), nullable=False),
+            sa.Column("location", sa.Unicode(length=100), nullable=True),
+            sa.Column("is_active", sa.Boolean(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index(op.f("ix_tables_table_number"), "tables", ["table_number"], unique=True)
+
+    if not has_table("users"):
+        op.create_table(
+            "users",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("email", sa.Unicode(length=255), nullable=False),
+            sa.Column("hashed_password", sa.Unicode(length=255), nullable=False),
+            sa.Column("full_name", sa.Unicode(length=255), nullable=False),
+            sa.Column("phone", sa.Unicode(length=20), nullable=True),
+            sa.Column("google_id", sa.Unicode(length=255), nullable=True),
+            sa.Column("google_email", sa.Unicode(length=255), nullable=True),
+            sa.Column("google_picture", sa.Unicode(length=500), nullable=True),
+            sa.Column("totp_secret", sa.Unicode(length=32), nullable=True),
+            sa.Column("is_2fa_enabled", sa.Boolean(), nullable=False),
+            sa.Column("role", sa.Enum("ADMIN", "STAFF", "STUDENT", name="userrole"), nullable=False),
+            sa.Column("is_active", sa.Boolean(), nullable=False),
+            sa.Column("is_superuser", sa.Boolean(), nullable=False),
+            sa.Column("token_version", sa.Integer(), nullable=False),
+            sa.Column("student_id", sa.Unicode(length=50), nullable=True),
+            sa.Column("class_name", sa.Unicode(length=100), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=True),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index(op.f("ix_users_email"), "users", ["email"], unique=True)
+        op.create_index(op.f("ix_users_google_id"), "users", ["google_id"], unique=False)
+        op.create_index(op.f("ix_users_student_id"), "users", ["student_id"], unique=False)
+
+    if not has_table("carts"):
+        op.create_table(
+            "carts",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("user_id", sa.Integer(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index(op.f("ix_carts_user_id"), "carts", ["user_id"], unique=True)
+
+    if not has_table("orders"):
+        op.create_table(
+            "orders",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("user_id", sa.Integer(), nullable=False),
+            sa.Column("table_id", sa.Integer(), nullable=True),
+            sa.Column("total_amount", sa.Float(), nullable=False),
+            sa.Column("status", sa.Enum("PENDING", "CONFIRMED", "PREPARING", "READY", "COMPLETED", "CANCELLED", name="orderstatus"), nullable=False),
+            sa.Column("payment_status", sa.Enum("UNPAID", "PAID", "REFUNDED", name="paymentstatus"), nullable=False),
+            sa.Column("payment_method", sa.Enum("CASH", "ONLINE", name="paymentmethod"), nullable=False),
+            sa.Column("bank_transfer_code", sa.Unicode(length=100), nullable=True),
+            sa.Column("bank_transfer_verified", sa.Boolean(), nullable=False),
+            sa.Column("notes", sa.Unicode(length=1000), nullable=True),
+            sa.Column("delivery_type", sa.Unicode(length=50), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=True),
+            sa.Column("completed_at", sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(["table_id"], ["tables.id"]),
+            sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index(op.f("ix_orders_created_at"), "orders", ["created_at"], unique=False)
+        op.create_index(op.f("ix_orders_status"), "orders", ["status"], unique=False)
+        op.create_index("ix_orders_status_completed_at", "orders", ["status", "completed_at"], unique=False)
+        op.create_index(op.f("ix_orders_table_id"), "orders", ["table_id"], unique=False)
+        op.create_index(op.f("ix_orders_user_id"), "orders", ["user_id"], unique=False)
+
+    if not has_table("products"):
+        op.create_table(
+            "products",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("name", sa.Unicode(length=255), nullable=False),
+            sa.Column("description", sa.Unicode(length=1000), nullable=True),
+            sa.Column("price", sa.Float(), nullable=False),
+            sa.Column("category_id", sa.Integer(), nullable=False),
+            sa.Column("image_url", sa.Unicode(length=500), nullable=True),
+            sa.Column("is_available", sa.Boolean(), nullable=False),
+            sa.Column("stock_quantity", sa.Integer(), nullable=True),
+            sa.Column("preparation_time", sa.Integer(), nullable=True),
+            sa.Column("calories", sa.Integer(), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(["category_id"], ["categories.id"]),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index(op.f("ix_products_category_id"), "products", ["category_id"], unique=False)
+        op.create_index(op.f("ix_products_name"), "products", ["name"], unique=False)
+
+    if not has_table("cart_items"):
+        op.create_table(
+            "cart_items",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("cart_id", sa.Integer(), nullable=False),
+            sa.Column("product_id", sa.Integer(), nullable=False),
+            sa.Column("quantity", sa.Integer(), nullable=False),
+            sa.Column("price_at_time", sa.Float(), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(["cart_id"], ["carts.id"]),
+            sa.ForeignKeyConstraint(["product_id"], ["products.id"]),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index(op.f("ix_cart_items_cart_id"), "cart_items", ["cart_id"], unique=False)
+        op.create_index(op.f("ix_cart_items_product_id"), "cart_items", ["product_id"], unique=False)
+
+    if not has_table("order_items"):
+        op.create_table(
+            "order_items",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("order_id", sa.Integer(), nullable=False),
+            sa.Column("product_id", sa.Integer(), nullable=False),
+            sa.Column("quantity", sa.Integer(), nullable=False),
+            sa.Column("price_at_time", sa.Float(), nullable=False),
+            sa.Column("subtotal", sa.Float(), nullable=False),
+            sa.Column("notes", sa.Unicode(length=500), nullable=True),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.ForeignKeyConstraint(["order_id"], ["orders.id"]),
+            sa.ForeignKeyConstraint(["product_id"], ["products.id"]),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index(op.f("ix_order_items_order_id"), "order_items", ["order_id"], unique=False)
+        op.create_index(op.f("ix_order_items_product_id"), "order_items", ["product_id"], unique=False)
+
+    if not has_table("table_reservations"):
+        op.create_table(
+            "table_reservations",
+            sa.Column("id", sa.Integer(), nullable=False),
+            sa.Column("table_id", sa.Integer(), nullable=False),
+            sa.Column("user_id", sa.Integer(), nullable=False),
+            sa.Column("order_id", sa.Integer(), nullable=True),
+            sa.Column("start_time", sa.DateTime(), nullable=False),
+            sa.Column("end_time", sa.DateTime(), nullable=False),
+            sa.Column("party_size", sa.Integer(), nullable=False),
+            sa.Column("notes", sa.Unicode(length=500), nullable=True),
+            sa.Column("status", sa.Enum("PENDING", "CONFIRMED", "ACTIVE", "COMPLETED", "CANCELLED", name="reservationstatus"), nullable=False),
+            sa.Column("created_at", sa.DateTime(), nullable=False),
+            sa.Column("updated_at", sa.DateTime(), nullable=True),
+            sa.ForeignKeyConstraint(["order_id"], ["orders.id"]),
+            sa.ForeignKeyConstraint(["table_id"], ["tables.id"]),
+            sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+            sa.PrimaryKeyConstraint("id"),
+        )
+        op.create_index(op.f("ix_table_reservations_end_time"), "table_reservations", ["end_time"], unique=False)
+        op.create_index(op.f("ix_table_reservations_order_id"), "table_reservations", ["order_id"], unique=False)
+        op.create_index(op.f("ix_table_reservations_start_time"), "table_reservations", ["start_time"], unique=False)
+        op.create_index(op.f("ix_table_reservations_status"), "table_reservations", ["status"], unique=False)
+        op.create_index(op.f("ix_table_reservations_table_id"), "table_reservations", ["table_id"], unique=False)
+        op.create_index(op.f("ix_table_reservations_user_id"), "table_reservations", ["user_id"], unique=False)
+
+    if not has_table("reservation_slots"):
+        op.create_table(
+            "reservation_slots",
+            sa.Column("table_id", sa.Integer(), nullable=False),
+            sa.Column("slot_start", sa.DateTime(), nullable=False),
+            sa.Column("reservation_id", sa.Integer(), nullable=False),
+            sa.ForeignKeyConstraint(["reservation_id"], ["table_reservations.id"]),
+            sa.ForeignKeyConstraint(["table_id"], ["tables.id"]),
+            sa.PrimaryKeyConstraint("table_id", "slot_start"),
+        )
+        op.create_index(op.f("ix_reservation_slots_reservation_id"), "reservation_slots", ["reservation_id"], unique=False)
+
+
+def downgrade() -> None:
+    for table in (
+        "reservation_slots",
+        "table_reservations",
+        "order_items",
+        "cart_items",
+        "products",
+        "orders",
+        "carts",
+        "users",
+        "tables",
+        "email_outbox",
+        "daily_revenue",
+        "categories",
+    ):
+        op.drop_table(table)
@@ -0,0 +1,36 @@
+"""Add 2FA fields to users
+
+Replaces migrations/add_2fa_fields.sql and migrate_2fa.py.
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 20:55:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.migrations import has_column
+
+# revision identifiers, used by Alembic.
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if not has_column("users", "totp_secret"):
+        op.add_column("users", sa.Column("totp_secret", sa.Unicode(length=32), nullable=True))
+    if not has_column("users", "is_2fa_enabled"):
+        op.add_column(
+            "users", sa.Column("is_2fa_enabled", sa.Boolean(), nullable=False, server_default=sa.false())
+        )
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("users") as batch_op:
+        batch_op.drop_column("is_2fa_enabled", mssql_drop_default=True)
+        batch_op.drop_column("totp_secret")
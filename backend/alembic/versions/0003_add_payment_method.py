@@ -0,0 +1,56 @@
+"""Add payment method and bank transfer fields to orders
+
+Replaces migrations/add_payment_method.sql and migrate_payment_method.py.
+The default is the enum name, CASH, which is what the ORM stores and reads
+back; the old scripts used the value, 'cash'. The idx_orders_* indexes
+come with the columns, as in the old scripts; the models do not declare
+them, so databases created from the models do not get them.
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 20:55:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.migrations import has_column, has_index
+
+# revision identifiers, used by Alembic.
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if not has_column("orders", "payment_method"):
+        op.add_column(
+            "orders",
+            sa.Column(
+                "payment_method",
+                sa.Enum("CASH", "ONLINE", name="paymentmethod"),
+                nullable=False,
+                server_default="CASH",
+            ),
+        )
+        op.create_index("idx_orders_payment_method", "orders", ["payment_method"])
+    if not has_column("orders", "bank_transfer_code"):
+        op.add_column("orders", sa.Column("bank_transfer_code", sa.Unicode(length=100), nullable=True))
+        op.create_index("idx_orders_bank_transfer_code", "orders", ["bank_transfer_code"])
+    if not has_column("orders", "bank_transfer_verified"):
+        op.add_column(
+            "orders", sa.Column("bank_transfer_verified", sa.Boolean(), nullable=False, server_default=sa.false())
+        )
+
+
+def downgrade() -> None:
+    for index in ("idx_orders_bank_transfer_code", "idx_orders_payment_method"):
+        if has_index("orders", index):
+            op.drop_index(index, table_name="orders")
+    with op.batch_alter_table("orders") as batch_op:
+        batch_op.drop_column("bank_transfer_verified", mssql_drop_default=True)
+        batch_op.drop_column("bank_transfer_code")
+        batch_op.drop_column("payment_method", mssql_drop_default=True)
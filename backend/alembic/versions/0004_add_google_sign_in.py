@@ -0,0 +1,71 @@
+"""Add Google sign-in columns, with google_id unique among non-NULL values
+
+The columns were added by hand following the Google OAuth setup guides.
+The index part replaces migrations/fix_google_id_unique.sql and
+migrate_google_id_fix.py: a SQL Server unique index allows a single NULL,
+so users without a Google account could not coexist, and uniqueness moves
+to a filtered index there. Other databases allow many NULLs in a unique
+index and get the plain index of the model.
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 20:55:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+from app.db.migrations import has_column, has_index
+
+# revision identifiers, used by Alembic.
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    for column, length in (("google_id", 255), ("google_email", 255), ("google_picture", 500)):
+        if not has_column("users", column):
+            op.add_column("users", sa.Column(column, sa.Unicode(length=length), nullable=True))
+    if op.get_bind().dialect.name != "mssql":
+        if not has_index("users", "ix_users_google_id"):
+            op.create_index("ix_users_google_id", "users", ["google_id"])
+        return
+    op.execute(
+        """
+        IF EXISTS (SELECT * FROM sys.indexes WHERE name = 'ix_users_google_id'
+                   AND object_id = OBJECT_ID('dbo.users') AND is_unique = 1)
+            DROP INDEX ix_users_google_id ON dbo.users
+        """
+    )
+    op.execute(
+        """
+        IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'ix_users_google_id'
+                       AND object_id = OBJECT_ID('dbo.users'))
+            CREATE NONCLUSTERED INDEX ix_users_google_id ON dbo.users (google_id)
+            WHERE google_id IS NOT NULL
+        """
+    )
+    op.execute(
+        """
+        IF NOT EXISTS (SELECT * FROM sys.indexes WHERE name = 'uq_users_google_id_notnull'
+                       AND object_id = OBJECT_ID('dbo.users'))
+            CREATE UNIQUE NONCLUSTERED INDEX uq_users_google_id_notnull ON dbo.users (google_id)
+            WHERE google_id IS NOT NULL
+        """
+    )
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "mssql":
+        return
+    op.execute(
+        """
+        IF EXISTS (SELECT * FROM sys.indexes WHERE name = 'uq_users_google_id_notnull'
+                   AND object_id = OBJECT_ID('dbo.users'))
+            DROP INDEX uq_users_google_id_notnull ON dbo.users
+        """
+    )
@@ -0,0 +1,97 @@
+"""Backfill the daily_revenue rollup
+
+Replaces migrations/backfill_daily_revenue.py. The table itself comes from
+0001; an empty rollup next to existing orders is rebuilt from the orders.
+Completed orders count on the day of completed_at, cancelled ones on the
+day of updated_at (created_at if unset), as in the app at this revision.
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 20:55:00.000000
+
+"""
+from typing import Sequence, Union
+
+from collections import defaultdict
+from datetime import datetime
+
+from alembic import op
+import sqlalchemy as sa
+
+# revision identifiers, used by Alembic.
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Tables as of this revision; enums are stored by name
+orders = sa.table(
+    "orders",
+    sa.column("id", sa.Integer),
+    sa.column("status", sa.String),
+    sa.column("payment_method", sa.String),
+    sa.column("total_amount", sa.Float),
+    sa.column("created_at", sa.DateTime),
+    sa.column("updated_at", sa.DateTime),
+    sa.column("completed_at", sa.DateTime),
+)
+daily_revenue = sa.table(
+    "daily_revenue",
+    sa.column("revenue_date", sa.Date),
+    sa.column("status", sa.String),
+    sa.column("payment_method", sa.String),
+    sa.column("order_count", sa.Integer),
+    sa.column("revenue", sa.Float),
+    sa.column("updated_at", sa.DateTime),
+)
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    if bind.execute(sa.select(daily_revenue.c.revenue_date).limit(1)).first() is not None:
+        return
+    if bind.execute(sa.select(orders.c.id).limit(1)).first() is None:
+        return
+
+    buckets = defaultdict(lambda: [0, 0.0])
+    rows = bind.execute(
+        sa.select(
+            orders.c.status,
+            orders.c.payment_method,
+            orders.c.total_amount,
+            orders.c.created_at,
+            orders.c.updated_at,
+            orders.c.completed_at,
+        )
+        .where(orders.c.status.in_(["COMPLETED", "CANCELLED"]))
+        .execution_options(yield_per=5000)
+    )
+    for status, payment_method, total, created_at, updated_at, completed_at in rows:
+        moment = completed_at if status == "COMPLETED" else updated_at or created_at
+        if moment is None:
+            continue
+        bucket = buckets[(moment.date(), status, payment_method or "CASH")]
+        bucket[0] += 1
+        bucket[1] += total or 0.0
+
+    now = datetime.utcnow()
+    if buckets:
+        op.bulk_insert(
+            daily_revenue,
+            [
+                {
+                    "revenue_date": revenue_date,
+                    "status": status,
+                    "payment_method": payment_method,
+                    "order_count": order_count,
+                    "revenue": revenue,
+                    "updated_at": now,
+                }
+                for (revenue_date, status, payment_method), (order_count, revenue) in buckets.items()
+            ],
+        )
+
+
+def downgrade() -> None:
+    pass
@@ -0,0 +1,30 @@
+"""Add the (status, completed_at) index to orders
+
+Replaces migrations/add_order_status_completed_index.sql and
+migrate_order_status_completed_index.py.
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 20:55:00.000000
+
+"""
+from typing import Sequence, Union
+
+from alembic import op
+
+from app.db.migrations import has_index
+
+# revision identifiers, used by Alembic.
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if not has_index("orders", "ix_orders_status_completed_at"):
+        op.create_index("ix_orders_status_completed_at", "orders", ["status", "completed_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_orders_status_completed_at", table_name="orders")
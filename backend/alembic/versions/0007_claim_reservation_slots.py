@@ -0,0 +1,90 @@
+"""Claim reservation slots for upcoming bookings
+
+Replaces migrations/migrate_reservation_slots.py. The table comes from
+0001; active reservations that hold no slots claim theirs. A reservation
+overlapping an earlier booking is skipped and logged. Slots are
+RESERVATION_SLOT_MINUTES cells of a grid anchored at datetime.min, as in
+the app at this revision.
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17 20:55:00.000000
+
+"""
+import logging
+from datetime import datetime, timedelta
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+from sqlalchemy.exc import IntegrityError
+
+from app.core.config import settings
+
+logger = logging.getLogger("alembic.runtime.migration")
+
+# revision identifiers, used by Alembic.
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+# Tables as of this revision; enums are stored by name
+table_reservations = sa.table(
+    "table_reservations",
+    sa.column("id", sa.Integer),
+    sa.column("table_id", sa.Integer),
+    sa.column("start_time", sa.DateTime),
+    sa.column("end_time", sa.DateTime),
+    sa.column("status", sa.String),
+)
+reservation_slots = sa.table(
+    "reservation_slots",
+    sa.column("table_id", sa.Integer),
+    sa.column("slot_start", sa.DateTime),
+    sa.column("reservation_id", sa.Integer),
+)
+
+
+def _slot_starts(start: datetime, end: datetime, step: timedelta):
+    slot = datetime.min + ((start - datetime.min) // step) * step
+    while slot < end:
+        yield slot
+        slot += step
+
+
+def upgrade() -> None:
+    bind = op.get_bind()
+    step = timedelta(minutes=settings.RESERVATION_SLOT_MINUTES)
+    held = sa.select(reservation_slots.c.reservation_id).distinct()
+    reservations = bind.execute(
+        sa.select(
+            table_reservations.c.id,
+            table_reservations.c.table_id,
+            table_reservations.c.start_time,
+            table_reservations.c.end_time,
+        )
+        .where(
+            table_reservations.c.status.in_(["PENDING", "CONFIRMED", "ACTIVE"]),
+            table_reservations.c.end_time > datetime.utcnow(),
+            table_reservations.c.id.not_in(held),
+        )
+        .order_by(table_reservations.c.id)
+    ).all()
+    for reservation_id, table_id, start_time, end_time in reservations:
+        try:
+            with bind.begin_nested():
+                bind.execute(
+                    sa.insert(reservation_slots),
+                    [
+                        {"table_id": table_id, "slot_start": slot_start, "reservation_id": reservation_id}
+                        for slot_start in _slot_starts(start_time, end_time, step)
+                    ],
+                )
+        except IntegrityError:
+            logger.warning("Reservation %s overlaps an earlier booking; slots not claimed", reservation_id)
+
+
+def downgrade() -> None:
+    pass
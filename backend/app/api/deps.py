@@ -1,44 +1,112 @@
 """API dependencies."""
+import hashlib
+import time
 from typing import Generator, Optional, List
 from fastapi import Depends, HTTPException, status
 from fastapi.security import OAuth2PasswordBearer
 from jose import jwt, JWTError
 from sqlmodel import Session
 
+from app.core.cache import TTLCache
 from app.core.config import settings
 from app.core.security import decode_token
 from app.db.session import get_db
 from app.crud.user import user as user_crud
 from app.models.user import User
 from app.schemas.token import TokenPayload
+from app.services.user_state import user_state
 from app.utils.enums import UserRole
 
 oauth2_scheme = OAuth2PasswordBearer(tokenUrl=f"{settings.API_V1_STR}/auth/login")
 
+# Recently verified access tokens, keyed by SHA-256 of the token. An entry
+# never outlives the token's ``exp``; revocation is still checked per request.
+verified_token_cache = TTLCache(
+    "verified_tokens",
+    ttl_seconds=settings.AUTH_TOKEN_CACHE_TTL_SECONDS,
+    maxsize=settings.AUTH_TOKEN_CACHE_MAX_ENTRIES,
+)
 
-def get_current_user(
-    db: Session = Depends(get_db),
-    token: str = Depends(oauth2_scheme)
-) -> User:
-    """Get current authenticated user."""
-    credentials_exception = HTTPException(
+
+def _credentials_exception() -> HTTPException:
+    return HTTPException(
         status_code=status.HTTP_401_UNAUTHORIZED,
         detail="Could not validate credentials",
         headers={"WWW-Authenticate": "Bearer"},
     )
-    
+
+
+def _decode_token_payload(token: str) -> TokenPayload:
+    """Verify ``token`` and parse its claims, reusing recent verifications."""
+    if settings.AUTH_TOKEN_CACHE_ENABLED:
+        key = hashlib.sha256(token.encode()).digest()
+        found, token_data = verified_token_cache.get(key)
+        if found:
+            return token_data
+
     try:
         payload = jwt.decode(
             token, settings.SECRET_KEY, algorithms=[settings.ALGORITHM]
         )
         token_data = TokenPayload(**payload)
-    except JWTError:
-        raise credentials_exception
-    
-    user = user_crud.get(db, id=int(token_data.sub))
-    if not user:
-        raise credentials_exception
-    
+        int(token_data.sub)
+    except (JWTError, ValueError, TypeError):
+        raise _credentials_exception()
+
+    if settings.AUTH_TOKEN_CACHE_ENABLED and "exp" in payload:
+        remaining = payload["exp"] - time.time()
+        if remaining > 0:
+            verified_token_cache.set(
+                key, token_data, ttl_seconds=min(remaining, settings.AUTH_TOKEN_CACHE_TTL_SECONDS)
+            )
+    return token_data
+
+
+def get_current_user(
+    db: Session = Depends(get_db),
+    token: str = Depends(oauth2_scheme)
+) -> User:
+    """
+    Get current authenticated user.
+
+    With AUTH_STATELESS enabled and a token carrying user claims, the user
+    is rebuilt from the claims once its token version is confirmed against
+    the user state cache, without loading the row. That user is not
+    attached to the session and only has the claimed fields set; endpoints
+    that read other profile fields or modify the user depend on
+    ``get_current_user_from_db`` instead.
+    """
+    token_data = _decode_token_payload(token)
+    user_id = int(token_data.sub)
+
+    if settings.AUTH_STATELESS and token_data.role is not None:
+        state = user_state.get(db, user_id)
+        if state is None or state.token_version != token_data.ver:
+            raise _credentials_exception()
+        return User(
+            id=user_id,
+            role=token_data.role,
+            is_active=token_data.act,
+            is_superuser=token_data.su,
+            token_version=token_data.ver,
+        )
+
+    return _load_token_user(db, user_id, token_data)
+
+
+def get_current_user_from_db(
+    db: Session = Depends(get_db),
+    token: str = Depends(oauth2_scheme)
+) -> User:
+    """Get current authenticated user, always loaded from the database."""
+    token_data = _decode_token_payload(token)
+    return _load_token_user(db, int(token_data.sub), token_data)
+
+
+def _load_token_user(db: Session, user_id: int, token_data: TokenPayload) -> User:
+    user = user_crud.get(db, id=user_id)
+    if not user or user.token_version != token_data.ver:
+        raise _credentials_exception()
     return user
 
 
@@ -54,6 +122,13 @@ def get_current_active_user(
     return current_user
 
 
+def get_current_active_user_from_db(
+    current_user: User = Depends(get_current_user_from_db),
+) -> User:
+    """Get current active user, always loaded from the database."""
+    return get_current_active_user(current_user)
+
+
 def get_current_active_superuser(
     current_user: User = Depends(get_current_user),
 ) -> User:
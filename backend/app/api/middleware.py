@@ -0,0 +1,115 @@
+"""ASGI middleware."""
+import logging
+import time
+
+from starlette.datastructures import MutableHeaders
+from starlette.types import ASGIApp, Message, Receive, Scope, Send
+
+from app.core.config import settings
+from app.core.metrics import RequestMetrics, request_metrics
+from app.db.query_stats import QueryStats, request_stats
+
+logger = logging.getLogger(__name__)
+
+
+class MetricsMiddleware:
+    """
+    Record each request in ``request_metrics``: in-flight count, status and latency.
+
+    Requests are labelled by route template (``/api/v1/orders/{order_id}``),
+    not by raw path, so labels stay bounded; requests no route matched share
+    one label. Latency runs to the start of the response.
+    """
+
+    UNMATCHED_ROUTE = "<unmatched>"
+
+    def __init__(self, app: ASGIApp, metrics: RequestMetrics = request_metrics) -> None:
+        self.app = app
+        self.metrics = metrics
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        elapsed = None
+        status_code = 500
+
+        async def send_with_status(message: Message) -> None:
+            nonlocal elapsed, status_code
+            if message["type"] == "http.response.start":
+                elapsed = time.perf_counter() - started
+                status_code = message["status"]
+            await send(message)
+
+        self.metrics.in_progress += 1
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            self.metrics.in_progress -= 1
+            route = scope.get("route")
+            self.metrics.observe(
+                scope["method"],
+                route.path if route is not None else self.UNMATCHED_ROUTE,
+                status_code,
+                elapsed if elapsed is not None else time.perf_counter() - started,
+            )
+
+
+class QueryStatsMiddleware:
+    """
+    Count each request's SQL statements and database time.
+
+    Adds a ``Server-Timing`` header (``db`` with the statement count, and
+    ``app`` for the whole handler) and logs requests that exceed the
+    SLOW_REQUEST_* thresholds or repeat one statement N_PLUS_ONE_THRESHOLD
+    times, which usually means a per-row lookup in a loop. Durations run to
+    the start of the response, so long-lived streams are not reported as slow.
+    """
+
+    def __init__(self, app: ASGIApp) -> None:
+        self.app = app
+
+    async def __call__(self, scope: Scope, receive: Receive, send: Send) -> None:
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+
+        started = time.perf_counter()
+        elapsed_ms = None
+
+        with request_stats() as stats:
+            async def send_with_timing(message: Message) -> None:
+                nonlocal elapsed_ms
+                if message["type"] == "http.response.start":
+                    elapsed_ms = (time.perf_counter() - started) * 1000
+                    if settings.SERVER_TIMING_ENABLED:
+                        MutableHeaders(scope=message).append(
+                            "Server-Timing",
+                            f'db;dur={stats.duration_ms:.1f};desc="{stats.count} queries", app;dur={elapsed_ms:.1f}',
+                        )
+                await send(message)
+
+            await self.app(scope, receive, send_with_timing)
+
+        if elapsed_ms is None:
+            elapsed_ms = (time.perf_counter() - started) * 1000
+        self._log_if_slow(scope, stats, elapsed_ms)
+
+    @staticmethod
+    def _log_if_slow(scope: Scope, stats: QueryStats, elapsed_ms: float) -> None:
+        repeated = stats.repeated(settings.N_PLUS_ONE_THRESHOLD) if stats.count >= settings.N_PLUS_ONE_THRESHOLD else []
+        if not (
+            repeated
+            or elapsed_ms > settings.SLOW_REQUEST_MS
+            or stats.duration_ms > settings.SLOW_REQUEST_DB_MS
+            or stats.count > settings.SLOW_REQUEST_QUERIES
+        ):
+            return
+        message = "%s %s took %.0f ms: %d queries, %.0f ms in the database"
+        args = [scope["method"], scope["path"], elapsed_ms, stats.count, stats.duration_ms]
+        for shape, count in repeated[:3]:
+            message += "\n  repeated %d times: %s"
+            args += [count, shape[:300]]
+        logger.warning(message, *args)
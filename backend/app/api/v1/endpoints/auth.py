@@ -1,20 +1,24 @@
 """Authentication endpoints."""
+import math
 from datetime import timedelta
 from typing import Any
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
 from fastapi.security import OAuth2PasswordRequestForm
 from fastapi.responses import RedirectResponse
+from starlette.concurrency import run_in_threadpool
 from sqlmodel import Session
 
 from app.core.config import settings
-from app.core.security import create_access_token
+from app.core.security import PasswordHasherBusy, create_access_token, verify_password_async
 from app.crud.user import user as user_crud
 from app.db.session import get_db
 from app.schemas.token import Token
 from app.schemas.user import User, UserCreate
-from app.api.deps import get_current_active_user
+from app.api.deps import get_current_active_user_from_db
 from app.services.google_oauth_service import google_oauth_service
+from app.services.rate_limiter import LOGIN, TWO_FACTOR, attempt_succeeded, check_attempt
 from app.services.totp_service import totp_service
+from app.services.user_state import user_state
 
 router = APIRouter()
 
@@ -45,16 +49,45 @@ def register(
     return user
 
 
+def _check_rate_limit(kind: str, request: Request, account: Any) -> None:
+    """Reject the attempt with 429 when its IP or account is out of attempts."""
+    client_ip = request.client.host if request.client else None
+    retry_after = check_attempt(kind, client_ip, account)
+    if retry_after:
+        raise HTTPException(
+            status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+            detail="Too many sign-in attempts, please try again later",
+            headers={"Retry-After": str(math.ceil(retry_after))},
+        )
+
+
 @router.post("/login", response_model=Token)
-def login(
+async def login(
+    request: Request,
     db: Session = Depends(get_db),
     form_data: OAuth2PasswordRequestForm = Depends()
 ) -> Any:
-    """OAuth2 compatible token login."""
-    user = user_crud.authenticate(
-        db, email=form_data.username, password=form_data.password
-    )
-    if not user:
+    """
+    OAuth2 compatible token login.
+
+    Runs on the event loop: the user lookup goes to the threadpool and the
+    bcrypt check to the password hasher pool, so a burst of logins does not
+    tie up the request threads other endpoints need. Attempts over the
+    rate limit are rejected before either.
+    """
+    _check_rate_limit(LOGIN, request, form_data.username)
+    user = await run_in_threadpool(user_crud.get_by_email, db, email=form_data.username)
+    try:
+        authenticated = user is not None and await verify_password_async(
+            form_data.password, user.hashed_password
+        )
+    except PasswordHasherBusy:
+        raise HTTPException(
+            status_code=status.HTTP_503_SERVICE_UNAVAILABLE,
+            detail="Too many sign-ins in progress, please try again",
+            headers={"Retry-After": "1"},
+        )
+    if not authenticated:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Incorrect email or password",
@@ -64,6 +97,7 @@ def login(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Inactive user"
         )
+    attempt_succeeded(LOGIN, form_data.username)
     
     # Check if 2FA is enabled
     if user.is_2fa_enabled:
@@ -78,7 +112,9 @@ def login(
     
     access_token_expires = timedelta(minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES)
     access_token = create_access_token(
-        subject=user.id, expires_delta=access_token_expires
+        subject=user.id,
+        expires_delta=access_token_expires,
+        claims=user_state.claims_for(user),
     )
     
     return {
@@ -90,7 +126,7 @@ def login(
 
 @router.get("/me", response_model=User)
 def read_users_me(
-    current_user: User = Depends(get_current_active_user),
+    current_user: User = Depends(get_current_active_user_from_db),
 ) -> Any:
     """Get current user."""
     return current_user
@@ -163,7 +199,9 @@ async def google_callback(
             minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
         )
         access_token = create_access_token(
-            subject=user.id, expires_delta=access_token_expires
+            subject=user.id,
+            expires_delta=access_token_expires,
+            claims=user_state.claims_for(user),
         )
         
         logger.info(f"✅ Token created for user: {user.email}")
@@ -190,7 +228,7 @@ async def google_callback(
 
 @router.post("/2fa/setup")
 def setup_2fa(
-    current_user: User = Depends(get_current_active_user),
+    current_user: User = Depends(get_current_active_user_from_db),
     db: Session = Depends(get_db),
 ) -> Any:
     """
@@ -219,7 +257,7 @@ def setup_2fa(
 @router.post("/2fa/enable")
 def enable_2fa(
     token: str,
-    current_user: User = Depends(get_current_active_user),
+    current_user: User = Depends(get_current_active_user_from_db),
     db: Session = Depends(get_db),
 ) -> Any:
     """
@@ -251,6 +289,7 @@ def enable_2fa(
 
 @router.post("/2fa/verify")
 def verify_2fa(
+    request: Request,
     user_id: int,
     token: str,
     db: Session = Depends(get_db),
@@ -259,6 +298,8 @@ def verify_2fa(
     Verify 2FA token and issue access token.
     Called after login when requires_2fa is True.
     """
+    _check_rate_limit(TWO_FACTOR, request, user_id)
+    
     # Get user
     user = user_crud.get(db, id=user_id)
     if not user:
@@ -280,13 +321,16 @@ def verify_2fa(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid 2FA code"
         )
+    attempt_succeeded(TWO_FACTOR, user_id)
     
     # Create access token
     access_token_expires = timedelta(
         minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
     )
     access_token = create_access_token(
-        subject=user.id, expires_delta=access_token_expires
+        subject=user.id,
+        expires_delta=access_token_expires,
+        claims=user_state.claims_for(user),
     )
     
     return {
@@ -298,7 +342,7 @@ def verify_2fa(
 @router.post("/2fa/disable")
 def disable_2fa(
     password: str,
-    current_user: User = Depends(get_current_active_user),
+    current_user: User = Depends(get_current_active_user_from_db),
     db: Session = Depends(get_db),
 ) -> Any:
     """
@@ -326,7 +370,7 @@ def disable_2fa(
 
 @router.get("/2fa/status")
 def get_2fa_status(
-    current_user: User = Depends(get_current_active_user),
+    current_user: User = Depends(get_current_active_user_from_db),
 ) -> Any:
     """Get 2FA status for current user."""
     return {
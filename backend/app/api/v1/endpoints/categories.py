@@ -1,26 +1,35 @@
 """Category endpoints."""
 from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException, status
+from fastapi import APIRouter, Depends, HTTPException, Request, status
+from pydantic import TypeAdapter
 from sqlmodel import Session
 
 from app.api.deps import get_current_active_superuser, get_current_active_user
 from app.crud.category import category as category_crud
-from app.db.session import get_db
+from app.db.session import DatabaseReader, get_db, get_db_reader
 from app.models.user import User
 from app.schemas.category import Category, CategoryCreate, CategoryUpdate
+from app.services.catalog_cache import catalog_cache
 
 router = APIRouter()
 
+_category_list_adapter = TypeAdapter(List[Category])
+
 
 @router.get("/", response_model=List[Category])
-def read_categories(
-    db: Session = Depends(get_db),
+async def read_categories(
+    request: Request,
+    reader: DatabaseReader = Depends(get_db_reader),
     skip: int = 0,
     limit: int = 100,
 ) -> Any:
     """Retrieve categories."""
-    categories = category_crud.get_active(db, skip=skip, limit=limit)
-    return categories
+    entry = await catalog_cache.aget_or_load(
+        ("categories:active", skip, limit),
+        lambda: reader.run(category_crud.get_active, skip=skip, limit=limit),
+        _category_list_adapter,
+    )
+    return catalog_cache.response(request, entry)
 
 
 @router.post("/", response_model=Category, status_code=status.HTTP_201_CREATED)
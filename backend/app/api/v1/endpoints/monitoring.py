@@ -0,0 +1,31 @@
+"""Runtime metrics endpoints (admin only)."""
+from typing import Any
+from fastapi import APIRouter, Depends
+
+from app.api.deps import get_current_active_superuser, verified_token_cache
+from app.core.security import password_hasher
+from app.db.session import async_engine_metrics, engine_metrics
+from app.models.user import User
+from app.services.rate_limiter import rate_limiter
+from app.services.user_state import user_state
+
+router = APIRouter()
+
+
+@router.get("/runtime")
+def get_runtime_metrics(
+    current_user: User = Depends(get_current_active_superuser),
+) -> Any:
+    """In-process counters of this worker: password hashing, auth caches, sign-in rate limits and DB pools."""
+    return {
+        "password_hasher": password_hasher.stats(),
+        "auth": {
+            "verified_tokens": verified_token_cache.stats(),
+            "user_state": user_state.stats(),
+        },
+        "rate_limits": rate_limiter.stats(),
+        "database": {
+            "sync": engine_metrics.stats(),
+            "async": async_engine_metrics.stats() if async_engine_metrics else None,
+        },
+    }
@@ -1,41 +1,119 @@
 """Order endpoints."""
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from typing import Any, List, Optional, Tuple, Union
+from fastapi import APIRouter, Depends, Header, HTTPException, Response, status, Query
+from fastapi.responses import StreamingResponse
 from sqlmodel import Session
-from pydantic import BaseModel
+from pydantic import BaseModel, TypeAdapter
 
 from app.api.deps import get_current_active_user, get_current_active_superuser, get_current_active_admin_or_staff
 from app.crud.order import order as order_crud
-from app.db.session import get_db
+from app.crud.daily_revenue import daily_revenue as daily_revenue_crud
+from app.db.session import DatabaseReader, get_db, get_db_reader
 from app.models.user import User
-from app.schemas.order import Order, OrderCreate, OrderUpdate, OrderStatusUpdate
-from app.utils.enums import OrderStatus, PaymentStatus
+from app.schemas.order import (
+    Order,
+    OrderBoard,
+    OrderCreate,
+    OrderStatusUpdate,
+    OrderSummary,
+    OrderUpdate,
+)
+from app.utils.enums import OrderStatus, OrderView, PaymentStatus
+from app.services.order_events import order_event_hub
 from app.services.order_service import order_service
+from app.utils.pagination import NEXT_CURSOR_HEADER
 
 
 router = APIRouter()
 
 
-@router.get("/", response_model=List[Order])
-def read_orders(
-    db: Session = Depends(get_db),
+_order_list_adapters = {
+    OrderView.SUMMARY: TypeAdapter(List[OrderSummary]),
+    OrderView.STAFF_BOARD: TypeAdapter(List[OrderBoard]),
+    OrderView.FULL: TypeAdapter(List[Order]),
+}
+
+
+@router.get("/", response_model=Union[List[Order], List[OrderBoard], List[OrderSummary]])
+async def read_orders(
+    reader: DatabaseReader = Depends(get_db_reader),
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = Query(
+        None, description=f"Opaque cursor from the {NEXT_CURSOR_HEADER} header of the previous page"
+    ),
     status_filter: OrderStatus = Query(None, description="Filter by order status"),
+    view: OrderView = Query(
+        OrderView.FULL,
+        description="summary: order row only; staff-board: adds table and item names; full: everything",
+    ),
     current_user: User = Depends(get_current_active_user),
 ) -> Any:
-    """Retrieve orders."""
+    """
+    Retrieve orders, newest first.
+
+    Without ``skip`` the list is paginated by keyset: the next page's cursor
+    is returned in the X-Next-Cursor header. ``skip`` keeps the old offset
+    pagination. ``view`` picks how much of each order is loaded and returned.
+    """
     # Admin and staff can see all orders, customers can only see their own
     from app.utils.enums import UserRole
     if current_user.is_superuser or current_user.role == UserRole.STAFF:
-        if status_filter:
-            orders = order_crud.get_by_status(db, status=status_filter, skip=skip, limit=limit)
+        user_id, order_status = None, status_filter
+    else:
+        user_id, order_status = current_user.id, None
+
+    try:
+        body, next_cursor = await reader.run(
+            _load_orders_json,
+            skip=skip,
+            cursor=cursor,
+            limit=limit,
+            user_id=user_id,
+            order_status=order_status,
+            view=view,
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+    return Response(
+        content=body,
+        media_type="application/json",
+        headers={NEXT_CURSOR_HEADER: next_cursor} if next_cursor else None,
+    )
+
+
+def _load_orders_json(
+    db: Session,
+    *,
+    skip: int,
+    cursor: Optional[str],
+    limit: int,
+    user_id: Optional[int],
+    order_status: Optional[OrderStatus],
+    view: OrderView,
+) -> Tuple[bytes, Optional[str]]:
+    """One page of orders serialized with the view's schema, and the next cursor."""
+    next_cursor = None
+    if skip and not cursor:
+        if user_id is not None:
+            orders = order_crud.get_by_user(db, user_id=user_id, skip=skip, limit=limit, view=view)
+        elif order_status:
+            orders = order_crud.get_by_status(db, status=order_status, skip=skip, limit=limit, view=view)
         else:
-            orders = order_crud.get_multi(db, skip=skip, limit=limit)
+            orders = order_crud.get_multi(db, skip=skip, limit=limit, view=view)
     else:
-        orders = order_crud.get_by_user(db, user_id=current_user.id, skip=skip, limit=limit)
-    
-    return orders
+        orders, next_cursor = order_crud.get_page(
+            db, cursor=cursor, limit=limit, user_id=user_id, status=order_status, view=view
+        )
+
+    # Serialize with the view's schema directly; validating a lean row
+    # against the full schema would lazy-load what the view skipped.
+    # Done here, with the session, since the full view may still lazy-load.
+    adapter = _order_list_adapters[view]
+    return adapter.dump_json(adapter.validate_python(orders, from_attributes=True)), next_cursor
 
 
 @router.post("/", response_model=Order, status_code=status.HTTP_201_CREATED)
@@ -50,6 +128,26 @@ def create_order(
     return order
 
 
+@router.get("/events")
+async def stream_order_events(
+    cursor: Optional[int] = Query(None, description="Last event ID received"),
+    last_event_id: Optional[int] = Header(None),
+    current_user: User = Depends(get_current_active_admin_or_staff),
+) -> Any:
+    """
+    Live order board feed as Server-Sent Events (admin and staff only).
+
+    Emits ``order.created``, ``order.status_changed`` and ``order.deleted``
+    events. Reconnecting clients send ``Last-Event-ID`` (or ``cursor``) to
+    receive the events they missed; a ``reset`` event means the cursor is
+    too old and the board should be reloaded from ``GET /orders``.
+    """
+    return StreamingResponse(
+        order_event_hub.stream(last_event_id if last_event_id is not None else cursor),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
 
 @router.get("/{order_id}", response_model=Order)
 def read_order(
@@ -95,6 +193,10 @@ def update_order(
     if order_in.status:
         return order_service.update_order_status(db, order_id=order_id, new_status=order_in.status)
 
+    if order_in.payment_method and order_in.payment_method != order.payment_method:
+        daily_revenue_crud.change_payment_method(
+            db, order=order, payment_method=order_in.payment_method
+        )
     order = order_crud.update(db, db_obj=order, obj_in=order_in)
     return order
 
@@ -176,7 +278,9 @@ def delete_order(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Order not found",
         )
+    daily_revenue_crud.remove_order(db, order=order)
     order = order_crud.delete(db, id=order_id)
+    order_event_hub.publish_order("order.deleted", order)
     return order
 
 
@@ -1,45 +1,89 @@
 """Product endpoints."""
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Request, status, Query
+from pydantic import TypeAdapter
 from sqlmodel import Session
 
 from app.api.deps import get_current_active_superuser, get_current_active_user
 from app.crud.product import product as product_crud
-from app.db.session import get_db
+from app.db.session import DatabaseReader, get_db, get_db_reader
 from app.models.user import User
 from app.schemas.product import Product, ProductCreate, ProductUpdate
+from app.services.catalog_cache import catalog_cache
+from app.utils.pagination import NEXT_CURSOR_HEADER
 
 router = APIRouter()
 
+_product_adapter = TypeAdapter(Product)
+_product_list_adapter = TypeAdapter(List[Product])
+
 
 @router.get("/", response_model=List[Product])
-def read_products(
-    db: Session = Depends(get_db),
+async def read_products(
+    request: Request,
+    reader: DatabaseReader = Depends(get_db_reader),
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = Query(
+        None, description=f"Opaque cursor from the {NEXT_CURSOR_HEADER} header of the previous page"
+    ),
     category_id: int = Query(None, description="Filter by category ID"),
     available_only: bool = Query(True, description="Show only available products"),
 ) -> Any:
-    """Retrieve products."""
-    if category_id:
-        products = product_crud.get_by_category(db, category_id=category_id, skip=skip, limit=limit)
-    elif available_only:
-        products = product_crud.get_available(db, skip=skip, limit=limit)
-    else:
-        products = product_crud.get_multi(db, skip=skip, limit=limit)
-    return products
+    """
+    Retrieve products.
+
+    Without ``skip`` the list is paginated by keyset and the next page's
+    cursor is returned in the X-Next-Cursor header. Cache hits are served
+    on the event loop; misses query through ``reader``.
+    """
+    if skip and not cursor:
+        if category_id:
+            key = ("products:category", category_id, skip, limit)
+            loader = lambda: reader.run(product_crud.get_by_category, category_id=category_id, skip=skip, limit=limit)
+        elif available_only:
+            key = ("products:available", skip, limit)
+            loader = lambda: reader.run(product_crud.get_available, skip=skip, limit=limit)
+        else:
+            key = ("products:all", skip, limit)
+            loader = lambda: reader.run(product_crud.get_multi, skip=skip, limit=limit)
+        entry = await catalog_cache.aget_or_load(key, loader, _product_list_adapter)
+        return catalog_cache.response(request, entry)
+
+    # Category listings keep their previous semantics and ignore availability
+    available = available_only and not category_id
+    try:
+        entry = await catalog_cache.aget_or_load_page(
+            ("products:page", category_id, available, cursor, limit),
+            lambda: reader.run(
+                product_crud.get_page,
+                cursor=cursor, limit=limit, category_id=category_id, available_only=available,
+            ),
+            _product_list_adapter,
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+    return catalog_cache.response(request, entry)
 
 
 @router.get("/search", response_model=List[Product])
 def search_products(
+    request: Request,
     db: Session = Depends(get_db),
     q: str = Query(..., min_length=1, description="Search query"),
     skip: int = 0,
     limit: int = 100,
 ) -> Any:
     """Search products by name."""
-    products = product_crud.search_by_name(db, name=q, skip=skip, limit=limit)
-    return products
+    entry = catalog_cache.get_or_load(
+        ("products:search", q, skip, limit),
+        lambda: product_crud.search_by_name(db, name=q, skip=skip, limit=limit),
+        _product_list_adapter,
+    )
+    return catalog_cache.response(request, entry)
 
 
 @router.post("/", response_model=Product, status_code=status.HTTP_201_CREATED)
@@ -57,16 +101,21 @@ def create_product(
 @router.get("/{product_id}", response_model=Product)
 def read_product(
     product_id: int,
+    request: Request,
     db: Session = Depends(get_db),
 ) -> Any:
     """Get product by ID."""
-    product = product_crud.get(db, id=product_id)
-    if not product:
+    entry = catalog_cache.get_or_load(
+        ("product", product_id),
+        lambda: product_crud.get(db, id=product_id),
+        _product_adapter,
+    )
+    if not entry:
         raise HTTPException(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="Product not found",
         )
-    return product
+    return catalog_cache.response(request, entry)
 
 
 @router.put("/{product_id}", response_model=Product)
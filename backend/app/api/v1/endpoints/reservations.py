@@ -6,14 +6,18 @@ from fastapi import APIRouter, Depends, HTTPException, status, Query
 from sqlmodel import Session
 
 from app.api.deps import get_current_active_user, get_db
-from app.crud.reservation import reservation as reservation_crud
+from app.core.config import settings
+from app.crud.reservation import is_slot_boundary, reservation as reservation_crud
 from app.crud.table import table as table_crud
 from app.models.user import User
 from app.schemas.reservation import (
+    AvailabilityGrid,
     Reservation,
     ReservationCreate,
     ReservationSummary,
+    TableAvailability,
 )
+from app.services.reservation_index import reservation_index
 from app.utils.enums import ReservationStatus
 
 
@@ -21,6 +25,12 @@ router = APIRouter()
 
 
 def _validate_time_window(start_time: datetime, end_time: datetime) -> None:
+    # Reservation times are stored as naive restaurant-local times
+    if start_time.tzinfo is not None or end_time.tzinfo is not None:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Reservation times must be local times without a UTC offset",
+        )
     if end_time <= start_time:
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
@@ -37,6 +47,11 @@ def _validate_time_window(start_time: datetime, end_time: datetime) -> None:
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Reservation cannot exceed 4 hours",
         )
+    if not (is_slot_boundary(start_time) and is_slot_boundary(end_time)):
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail=f"Reservations start and end on {settings.RESERVATION_SLOT_MINUTES}-minute boundaries",
+        )
 
 
 @router.get("/", response_model=List[Reservation])
@@ -76,7 +91,12 @@ def create_reservation(
 
     _validate_time_window(reservation_in.start_time, reservation_in.end_time)
 
-    if reservation_crud.has_conflict(
+    # The in-memory index rejects most conflicts without a query; a hit is
+    # confirmed against the database in case the index is stale.
+    reservation_index.ensure_fresh(db)
+    if reservation_index.has_conflict(
+        reservation_in.table_id, reservation_in.start_time, reservation_in.end_time
+    ) and reservation_crud.has_conflict(
         db,
         table_id=reservation_in.table_id,
         start=reservation_in.start_time,
@@ -87,15 +107,50 @@ def create_reservation(
             detail="Time slot already reserved",
         )
 
+    # Guarded insert: fails if a conflicting booking was committed meanwhile
     reservation = reservation_crud.create_for_user(
         db,
         obj_in=reservation_in,
         user_id=current_user.id,
         status=ReservationStatus.CONFIRMED,
     )
+    if reservation is None:
+        raise HTTPException(
+            status_code=status.HTTP_409_CONFLICT,
+            detail="Time slot already reserved",
+        )
     return reservation
 
 
+@router.get("/availability", response_model=AvailabilityGrid)
+def get_availability_grid(
+    *,
+    date_param: date = Query(default=date.today(), alias="date", lt=date.max),
+    db: Session = Depends(get_db),
+    current_user: User = Depends(get_current_active_user),
+) -> Any:
+    """Return the free/busy slot bitmap of every active table for a day."""
+    step = timedelta(minutes=settings.RESERVATION_SLOT_MINUTES)
+    slot_count = timedelta(days=1) // step
+    day_start = datetime.combine(date_param, datetime.min.time())
+
+    tables = table_crud.get_active(db)
+    reservation_index.ensure_fresh(db)
+    return AvailabilityGrid(
+        date=date_param,
+        slot_minutes=settings.RESERVATION_SLOT_MINUTES,
+        tables=[
+            TableAvailability(
+                table_id=table.id,
+                table_number=table.table_number,
+                capacity=table.capacity,
+                slots=reservation_index.busy_slots(table.id, day_start, step, slot_count),
+            )
+            for table in tables
+        ],
+    )
+
+
 @router.get("/availability/{table_id}", response_model=List[ReservationSummary])
 def get_table_availability(
     *,
@@ -104,7 +159,7 @@ def get_table_availability(
     db: Session = Depends(get_db),
     current_user: User = Depends(get_current_active_user),
 ) -> Any:
-    """Return reservations for a table on a given day."""
+    """Return active reservations for a table on a given day."""
     table = table_crud.get(db, id=table_id)
     if not table:
         raise HTTPException(
@@ -115,7 +170,8 @@ def get_table_availability(
     start = datetime.combine(date_param, datetime.min.time())
     end = datetime.combine(date_param, datetime.max.time())
 
-    reservations = reservation_crud.get_for_table(db, table_id=table_id, start=start, end=end)
+    reservation_index.ensure_fresh(db)
+    reservations = reservation_index.overlapping(table_id, start, end)
     summaries = [
         ReservationSummary(
             start_time=r.start_time,
@@ -1,24 +1,64 @@
 """Statistics endpoints."""
-from datetime import datetime, timedelta
-from typing import Optional
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import func, extract, and_
+from collections import defaultdict
+from datetime import date, datetime, timedelta
+from typing import Callable, Dict, Iterable, List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Query, status
+from sqlalchemy import and_, case, extract, func, true
 from sqlmodel import Session, select
 
 from app.api.deps import get_current_active_user, get_db, require_role
+from app.crud.daily_revenue import daily_revenue as daily_revenue_crud
+from app.models.daily_revenue import DailyRevenue
 from app.models.user import User
 from app.models.order import Order
 from app.models.reservation import TableReservation
+from app.services.statistics_cache import statistics_cache
 from app.utils.enums import OrderStatus, ReservationStatus, UserRole
 
 router = APIRouter()
 
 
+def _group_revenue(
+    rows: Iterable[DailyRevenue], key: Callable[[date], int]
+) -> Dict[int, dict]:
+    """Sum rollup rows into ``{key: {"revenue", "order_count"}}``, sorted by key."""
+    totals: Dict[int, List[float]] = defaultdict(lambda: [0.0, 0])
+    for row in rows:
+        bucket = totals[key(row.revenue_date)]
+        bucket[0] += row.revenue
+        bucket[1] += row.order_count
+    return {
+        k: {"revenue": round(revenue, 2), "order_count": order_count}
+        for k, (revenue, order_count) in sorted(totals.items())
+        if order_count
+    }
+
+
+def _period_range(year: int, month: Optional[int] = None) -> Tuple[datetime, datetime]:
+    """Half-open ``[start, end)`` range covering a year or one of its months.
+
+    Filtering with ``column >= start AND column < end`` keeps the predicate
+    sargable, unlike ``extract('year', column) == year``.
+    """
+    if month is None:
+        return datetime(year, 1, 1), datetime(year + 1, 1, 1)
+    if month == 12:
+        return datetime(year, 12, 1), datetime(year + 1, 1, 1)
+    return datetime(year, month, 1), datetime(year, month + 1, 1)
+
+
+def _rollup_rows(db: Session, year: int, month: Optional[int] = None) -> List[DailyRevenue]:
+    start, end = _period_range(year, month)
+    return daily_revenue_crud.get_range(db, start=start.date(), end=end.date())
+
+
 @router.get("/overview")
 def get_statistics_overview(
     *,
     db: Session = Depends(get_db),
-    current_user: User = Depends(require_role([UserRole.ADMIN, UserRole.STAFF]))
+    current_user: User = Depends(require_role([UserRole.ADMIN, UserRole.STAFF])),
+    date_from: Optional[date] = Query(None, description="First day to include (UTC)"),
+    date_to: Optional[date] = Query(None, lt=date.max, description="Last day to include (UTC)")
 ):
     """
     Get overview statistics:
@@ -27,37 +67,84 @@ def get_statistics_overview(
     - Total revenue (from completed orders)
     - Total reservations
     - Active reservations
+    
+    With ``date_from``/``date_to``, orders and reservations are limited to
+    those created in the window and completed orders/revenue to orders
+    completed in it.
     """
-    # Count total orders
-    total_orders = db.exec(select(func.count(Order.id))).one()
+    if date_from and date_to and date_from > date_to:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="date_from must not be after date_to",
+        )
+    return statistics_cache.get_or_load(
+        "overview",
+        (date_from, date_to),
+        lambda: _overview_statistics(db, date_from, date_to),
+    )
+
+
+def _overview_statistics(
+    db: Session, date_from: Optional[date] = None, date_to: Optional[date] = None
+) -> dict:
+    """Compute every overview counter in a single round-trip."""
+    start = datetime.combine(date_from, datetime.min.time()) if date_from else None
+    end = datetime.combine(date_to + timedelta(days=1), datetime.min.time()) if date_to else None
     
-    # Count completed orders
-    completed_orders = db.exec(
-        select(func.count(Order.id))
-        .where(func.upper(Order.status) == 'COMPLETED')
-    ).one()
+    def window(column, lower, upper) -> list:
+        filters = []
+        if lower is not None:
+            filters.append(column >= lower)
+        if upper is not None:
+            filters.append(column < upper)
+        return filters
     
-    # Calculate total revenue from completed orders
-    total_revenue = db.exec(
-        select(func.sum(Order.total_amount))
-        .where(func.upper(Order.status) == 'COMPLETED')
-    ).one() or 0.0
+    orders = (
+        select(func.count(Order.id).label("total_orders"))
+        .where(*window(Order.created_at, start, end))
+        .subquery()
+    )
     
-    # Count total reservations
-    total_reservations = db.exec(select(func.count(TableReservation.id))).one()
+    # Completed orders and their revenue come from the daily rollup
+    completed = (
+        select(
+            func.coalesce(func.sum(DailyRevenue.order_count), 0).label("completed_orders"),
+            func.coalesce(func.sum(DailyRevenue.revenue), 0.0).label("total_revenue"),
+        )
+        .where(
+            DailyRevenue.status == OrderStatus.COMPLETED,
+            *window(
+                DailyRevenue.revenue_date,
+                start.date() if start else None,
+                end.date() if end else None,
+            ),
+        )
+        .subquery()
+    )
     
-    # Count active reservations (confirmed and active)
-    active_reservations = db.exec(
-        select(func.count(TableReservation.id))
-        .where(TableReservation.status.in_([ReservationStatus.CONFIRMED, ReservationStatus.ACTIVE]))
+    # Total and active (confirmed and active) reservations in one scan
+    is_active = TableReservation.status.in_([ReservationStatus.CONFIRMED, ReservationStatus.ACTIVE])
+    reservations = (
+        select(
+            func.count(TableReservation.id).label("total_reservations"),
+            func.coalesce(func.sum(case((is_active, 1), else_=0)), 0).label("active_reservations"),
+        )
+        .where(*window(TableReservation.created_at, start, end))
+        .subquery()
+    )
+    
+    row = db.exec(
+        select(orders, completed, reservations).select_from(
+            orders.join(completed, true()).join(reservations, true())
+        )
     ).one()
     
     return {
-        "total_orders": total_orders,
-        "completed_orders": completed_orders,
-        "total_revenue": round(total_revenue, 2),
-        "total_reservations": total_reservations,
-        "active_reservations": active_reservations
+        "total_orders": row.total_orders,
+        "completed_orders": row.completed_orders,
+        "total_revenue": round(row.total_revenue, 2),
+        "total_reservations": row.total_reservations,
+        "active_reservations": row.active_reservations
     }
 
 
@@ -66,7 +153,7 @@ def get_revenue_statistics(
     *,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_role([UserRole.ADMIN, UserRole.STAFF])),
-    year: Optional[int] = Query(None, description="Year to filter (e.g., 2024)"),
+    year: Optional[int] = Query(None, ge=1, le=9998, description="Year to filter (e.g., 2024)"),
     month: Optional[int] = Query(None, ge=1, le=12, description="Month to filter (1-12)")
 ):
     """
@@ -80,32 +167,12 @@ def get_revenue_statistics(
     current_year = datetime.utcnow().year
     target_year = year or current_year
     
-    # Base query - only completed orders
-    base_query = select(Order).where(Order.status == OrderStatus.COMPLETED)
-    
     if month is not None:
         # Daily revenue for specific month
-        query = select(
-            extract('day', Order.completed_at).label('day'),
-            func.sum(Order.total_amount).label('revenue'),
-            func.count(Order.id).label('order_count')
-        ).where(
-            and_(
-                func.upper(Order.status) == 'COMPLETED',
-                extract('year', Order.completed_at) == target_year,
-                extract('month', Order.completed_at) == month
-            )
-        ).group_by(extract('day', Order.completed_at)).order_by(extract('day', Order.completed_at))
-        
-        results = db.exec(query).all()
-        
+        rows = _rollup_rows(db, target_year, month)
         data = [
-            {
-                "day": int(row.day),
-                "revenue": round(row.revenue, 2),
-                "order_count": row.order_count
-            }
-            for row in results
+            {"day": day, **totals}
+            for day, totals in _group_revenue(rows, lambda d: d.day).items()
         ]
         
         return {
@@ -116,26 +183,10 @@ def get_revenue_statistics(
         }
     else:
         # Monthly revenue for year
-        query = select(
-            extract('month', Order.completed_at).label('month'),
-            func.sum(Order.total_amount).label('revenue'),
-            func.count(Order.id).label('order_count')
-        ).where(
-            and_(
-                func.upper(Order.status) == 'COMPLETED',
-                extract('year', Order.completed_at) == target_year
-            )
-        ).group_by(extract('month', Order.completed_at)).order_by(extract('month', Order.completed_at))
-        
-        results = db.exec(query).all()
-        
+        rows = _rollup_rows(db, target_year)
         data = [
-            {
-                "month": int(row.month),
-                "revenue": round(row.revenue, 2),
-                "order_count": row.order_count
-            }
-            for row in results
+            {"month": month_num, **totals}
+            for month_num, totals in _group_revenue(rows, lambda d: d.month).items()
         ]
         
         return {
@@ -150,7 +201,7 @@ def get_orders_statistics(
     *,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_role([UserRole.ADMIN, UserRole.STAFF])),
-    year: Optional[int] = Query(None, description="Year to filter (e.g., 2024)"),
+    year: Optional[int] = Query(None, ge=1, le=9998, description="Year to filter (e.g., 2024)"),
     month: Optional[int] = Query(None, ge=1, le=12, description="Month to filter (1-12)")
 ):
     """
@@ -160,13 +211,20 @@ def get_orders_statistics(
     - If only year provided: Statistics for that year
     - If neither: Statistics for current year
     """
-    current_year = datetime.utcnow().year
-    target_year = year or current_year
-    
+    target_year = year or datetime.utcnow().year
+    return statistics_cache.get_or_load(
+        "orders",
+        (target_year, month),
+        lambda: _orders_statistics(db, target_year, month),
+        year=target_year,
+        month=month,
+    )
+
+
+def _orders_statistics(db: Session, target_year: int, month: Optional[int]) -> dict:
     # Build filter conditions
-    filters = [extract('year', Order.created_at) == target_year]
-    if month is not None:
-        filters.append(extract('month', Order.created_at) == month)
+    start, end = _period_range(target_year, month)
+    filters = [Order.created_at >= start, Order.created_at < end]
     
     # Get order counts by status
     query = select(
@@ -196,7 +254,7 @@ def get_reservations_statistics(
     *,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_role([UserRole.ADMIN, UserRole.STAFF])),
-    year: Optional[int] = Query(None, description="Year to filter (e.g., 2024)"),
+    year: Optional[int] = Query(None, ge=1, le=9998, description="Year to filter (e.g., 2024)"),
     month: Optional[int] = Query(None, ge=1, le=12, description="Month to filter (1-12)")
 ):
     """
@@ -206,13 +264,20 @@ def get_reservations_statistics(
     - If only year provided: Statistics for that year
     - If neither: Statistics for current year
     """
-    current_year = datetime.utcnow().year
-    target_year = year or current_year
-    
+    target_year = year or datetime.utcnow().year
+    return statistics_cache.get_or_load(
+        "reservations",
+        (target_year, month),
+        lambda: _reservations_statistics(db, target_year, month),
+        year=target_year,
+        month=month,
+    )
+
+
+def _reservations_statistics(db: Session, target_year: int, month: Optional[int]) -> dict:
     # Build filter conditions
-    filters = [extract('year', TableReservation.created_at) == target_year]
-    if month is not None:
-        filters.append(extract('month', TableReservation.created_at) == month)
+    start, end = _period_range(target_year, month)
+    filters = [TableReservation.created_at >= start, TableReservation.created_at < end]
     
     # Get reservation counts by status
     query = select(
@@ -253,7 +318,8 @@ def get_reservations_statistics(
             extract('month', TableReservation.start_time).label('month'),
             func.count(TableReservation.id).label('count')
         ).where(
-            extract('year', TableReservation.start_time) == target_year
+            TableReservation.start_time >= start,
+            TableReservation.start_time < end,
         ).group_by(extract('month', TableReservation.start_time)).order_by(extract('month', TableReservation.start_time))
         
         breakdown_results = db.exec(breakdown_query).all()
@@ -279,39 +345,32 @@ def get_revenue_by_month(
     *,
     db: Session = Depends(get_db),
     current_user: User = Depends(require_role([UserRole.ADMIN, UserRole.STAFF])),
-    year: int = Query(..., description="Year to get monthly revenue")
+    year: int = Query(..., ge=1, le=9998, description="Year to get monthly revenue")
 ):
     """
     Get monthly revenue for a specific year.
     Returns data for all 12 months (0 if no revenue).
     Only counts completed orders.
     """
-    query = select(
-        extract('month', Order.completed_at).label('month'),
-        func.sum(Order.total_amount).label('revenue'),
-        func.count(Order.id).label('order_count')
-    ).where(
-        and_(
-            func.upper(Order.status) == 'COMPLETED',
-            extract('year', Order.completed_at) == year
-        )
-    ).group_by(extract('month', Order.completed_at))
-    
-    results = db.exec(query).all()
+    rows = _rollup_rows(db, year)
     
     # Create dict with all 12 months
     monthly_data = {i: {"month": i, "revenue": 0.0, "order_count": 0} for i in range(1, 13)}
     
     # Fill in actual data
-    for row in results:
-        month_num = int(row.month)
-        monthly_data[month_num] = {
-            "month": month_num,
-            "revenue": round(row.revenue, 2),
-            "order_count": row.order_count
-        }
+    for month_num, totals in _group_revenue(rows, lambda d: d.month).items():
+        monthly_data[month_num] = {"month": month_num, **totals}
     
     return {
         "year": year,
         "data": list(monthly_data.values())
     }
+
+
+@router.get("/cache")
+def get_statistics_cache_metrics(
+    *,
+    current_user: User = Depends(require_role([UserRole.ADMIN]))
+):
+    """Hit/miss counters of the statistics result cache (admin only)."""
+    return statistics_cache.stats()
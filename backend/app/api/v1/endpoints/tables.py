@@ -1,47 +1,94 @@
 """Table endpoints."""
 from datetime import datetime
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException, status, Query
+from typing import Any, List, Optional, Tuple
+from fastapi import APIRouter, Depends, HTTPException, Response, status, Query
 from sqlmodel import Session
 
 from app.api.deps import get_current_active_superuser
 from app.crud.table import table as table_crud
-from app.db.session import get_db
+from app.db.session import DatabaseReader, get_db, get_db_reader
 from app.models.user import User
 from app.schemas.table import Table, TableCreate, TableUpdate
 from app.utils.enums import TableStatus
 from app.services.table_status_service import annotate_tables_with_reservations
+from app.utils.pagination import NEXT_CURSOR_HEADER
 
 router = APIRouter()
 
 
 @router.get("/", response_model=List[Table])
-def read_tables(
-    db: Session = Depends(get_db),
+async def read_tables(
+    response: Response,
+    reader: DatabaseReader = Depends(get_db_reader),
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = Query(
+        None, description=f"Opaque cursor from the {NEXT_CURSOR_HEADER} header of the previous page"
+    ),
     status_filter: TableStatus = Query(None, description="Filter by table status"),
     date: datetime = Query(None, description="Target date for availability check"),
     start_time: str = Query(None, description="Start time HH:MM"),
     end_time: str = Query(None, description="End time HH:MM"),
 ) -> Any:
-    """Retrieve tables."""
-    if status_filter:
-        tables = table_crud.get_by_status(db, status=status_filter, skip=skip, limit=limit)
-    else:
-        tables = table_crud.get_multi(db, skip=skip, limit=limit)
+    """
+    Retrieve tables.
 
+    Without ``skip`` the list is paginated by keyset and the next page's
+    cursor is returned in the X-Next-Cursor header.
+    """
     target_start = target_end = None
     if date and start_time and end_time:
         target_start = datetime.combine(date.date(), datetime.strptime(start_time, "%H:%M").time())
         target_end = datetime.combine(date.date(), datetime.strptime(end_time, "%H:%M").time())
 
-    return annotate_tables_with_reservations(
+    try:
+        tables, next_cursor = await reader.run(
+            _load_tables,
+            skip=skip,
+            cursor=cursor,
+            limit=limit,
+            status_filter=status_filter,
+            target_start=target_start,
+            target_end=target_end,
+        )
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor"
+        )
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    return tables
+
+
+def _load_tables(
+    db: Session,
+    *,
+    skip: int,
+    cursor: Optional[str],
+    limit: int,
+    status_filter: Optional[TableStatus],
+    target_start: Optional[datetime],
+    target_end: Optional[datetime],
+) -> Tuple[List[Table], Optional[str]]:
+    """One page of tables with their reservation status, and the next cursor."""
+    next_cursor = None
+    if skip and not cursor:
+        if status_filter:
+            tables = table_crud.get_by_status(db, status=status_filter, skip=skip, limit=limit)
+        else:
+            tables = table_crud.get_multi(db, skip=skip, limit=limit)
+    else:
+        tables, next_cursor = table_crud.get_page(
+            db, cursor=cursor, limit=limit, status=status_filter
+        )
+    tables = annotate_tables_with_reservations(
         db,
         tables,
         target_start=target_start,
         target_end=target_end,
     )
+    return tables, next_cursor
 
 
 @router.get("/available", response_model=List[Table])
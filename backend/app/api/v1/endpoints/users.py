@@ -1,6 +1,6 @@
 """User endpoints."""
-from typing import Any, List
-from fastapi import APIRouter, Depends, HTTPException, status
+from typing import Any, List, Optional
+from fastapi import APIRouter, Depends, HTTPException, Query, Response, status
 from sqlmodel import Session
 
 from app.api.deps import get_current_active_superuser, get_current_active_user
@@ -8,20 +8,41 @@ from app.crud.user import user as user_crud
 from app.db.session import get_db
 from app.models.user import User
 from app.schemas.user import User as UserSchema, UserCreate, UserUpdate, PasswordChange
-from app.core.security import verify_password
+from app.core.security import create_access_token, verify_password
+from app.services.user_state import user_state
+from app.utils.pagination import NEXT_CURSOR_HEADER
 
 router = APIRouter()
 
 
 @router.get("/", response_model=List[UserSchema])
 def read_users(
+    response: Response,
     db: Session = Depends(get_db),
     skip: int = 0,
     limit: int = 100,
+    cursor: Optional[str] = Query(
+        None, description=f"Opaque cursor from the {NEXT_CURSOR_HEADER} header of the previous page"
+    ),
     current_user: User = Depends(get_current_active_superuser),
 ) -> Any:
-    """Retrieve users (admin only)."""
-    users = user_crud.get_multi(db, skip=skip, limit=limit)
+    """
+    Retrieve users (admin only).
+
+    Without ``skip`` the list is paginated by keyset and the next page's
+    cursor is returned in the X-Next-Cursor header.
+    """
+    if skip and not cursor:
+        return user_crud.get_multi(db, skip=skip, limit=limit)
+    try:
+        users, next_cursor = user_crud.get_page(db, cursor=cursor, limit=limit)
+    except ValueError:
+        raise HTTPException(
+            status_code=status.HTTP_400_BAD_REQUEST,
+            detail="Invalid cursor",
+        )
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
     return users
 
 
@@ -56,7 +77,7 @@ def read_user_by_id(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found",
         )
-    if user == current_user:
+    if user.id == current_user.id:
         return user
     if not user_crud.is_superuser(current_user):
         raise HTTPException(
@@ -81,7 +102,7 @@ def update_user(
             status_code=status.HTTP_404_NOT_FOUND,
             detail="User not found",
         )
-    if user != current_user and not user_crud.is_superuser(current_user):
+    if user.id != current_user.id and not user_crud.is_superuser(current_user):
         raise HTTPException(
             status_code=status.HTTP_403_FORBIDDEN,
             detail="Not enough permissions",
@@ -106,7 +127,7 @@ def change_password(
             detail="User not found",
         )
 
-    is_self = user == current_user
+    is_self = user.id == current_user.id
     is_admin = user_crud.is_superuser(current_user)
 
     if not is_self and not is_admin:
@@ -127,13 +148,20 @@ def change_password(
             detail="Mật khẩu mới phải khác mật khẩu hiện tại",
         )
 
-    user_crud.update(
+    user = user_crud.update(
         db,
         db_obj=user,
         obj_in=UserUpdate(password=password_in.new_password),
     )
 
-    return {"message": "Password updated successfully"}
+    response = {"message": "Password updated successfully"}
+    if is_self:
+        # The change revoked the caller's token; hand back a fresh one
+        response["access_token"] = create_access_token(
+            subject=user.id, claims=user_state.claims_for(user)
+        )
+        response["token_type"] = "bearer"
+    return response
 
 
 @router.delete("/{user_id}", response_model=UserSchema)
@@ -11,6 +11,7 @@ from app.api.v1.endpoints import (
     tables,
     reservations,
     statistics,
+    monitoring,
 )
 
 api_router = APIRouter()
@@ -24,3 +25,4 @@ api_router.include_router(orders.router, prefix="/orders", tags=["orders"])
 api_router.include_router(tables.router, prefix="/tables", tags=["tables"])
 api_router.include_router(reservations.router, prefix="/reservations", tags=["reservations"])
 api_router.include_router(statistics.router, prefix="/statistics", tags=["statistics"])
+api_router.include_router(monitoring.router, prefix="/monitoring", tags=["monitoring"])
@@ -0,0 +1,139 @@
+"""In-process caching primitives."""
+import threading
+import time
+import weakref
+from collections import OrderedDict
+from typing import Any, Awaitable, Callable, Dict, Hashable, List, Optional, Tuple
+
+
+class TTLCache:
+    """
+    Thread-safe, size-bounded LRU cache with per-entry expiry.
+
+    Every ``invalidate()`` or ``delete()`` bumps a version counter. Values
+    loaded through ``get_or_load`` are only stored if no invalidation
+    happened while the loader ran, so a slow reader cannot put pre-invalidation data back.
+    The cache is local to the worker process; the TTL bounds how stale other
+    workers can be after a write.
+    """
+
+    _instances: "weakref.WeakSet[TTLCache]" = weakref.WeakSet()
+
+    def __init__(self, name: str, *, ttl_seconds: float, maxsize: int = 1024) -> None:
+        self.name = name
+        self.ttl_seconds = ttl_seconds
+        self.maxsize = maxsize
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._lock = threading.Lock()
+        self._version = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.invalidations = 0
+        TTLCache._instances.add(self)
+
+    @classmethod
+    def instances(cls) -> List["TTLCache"]:
+        """Every live cache, for exporting metrics."""
+        return sorted(cls._instances, key=lambda cache: cache.name)
+
+    @property
+    def version(self) -> int:
+        return self._version
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Return ``(found, value)`` for ``key``, counting a hit or a miss."""
+        with self._lock:
+            entry = self._data.get(key)
+            if entry is not None:
+                expires_at, value = entry
+                if expires_at > time.monotonic():
+                    self._data.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                del self._data[key]
+            self.misses += 1
+            return False, None
+
+    def set(
+        self,
+        key: Hashable,
+        value: Any,
+        *,
+        version: Optional[int] = None,
+        ttl_seconds: Optional[float] = None,
+    ) -> bool:
+        """Store ``value``; skipped if ``version`` is given and is no longer current."""
+        ttl = self.ttl_seconds if ttl_seconds is None else ttl_seconds
+        with self._lock:
+            if version is not None and version != self._version:
+                return False
+            self._data[key] = (time.monotonic() + ttl, value)
+            self._data.move_to_end(key)
+            while len(self._data) > self.maxsize:
+                self._data.popitem(last=False)
+                self.evictions += 1
+            return True
+
+    def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Any],
+        *,
+        ttl_seconds: Optional[float] = None,
+    ) -> Any:
+        """Read-through lookup. ``None`` results are returned but not cached."""
+        found, value = self.get(key)
+        if found:
+            return value
+        version = self._version
+        value = loader()
+        if value is not None:
+            self.set(key, value, version=version, ttl_seconds=ttl_seconds)
+        return value
+
+    async def aget_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        *,
+        ttl_seconds: Optional[float] = None,
+    ) -> Any:
+        """``get_or_load`` for a coroutine loader."""
+        found, value = self.get(key)
+        if found:
+            return value
+        version = self._version
+        value = await loader()
+        if value is not None:
+            self.set(key, value, version=version, ttl_seconds=ttl_seconds)
+        return value
+
+    def delete(self, key: Hashable) -> None:
+        """Drop one entry and bump the version."""
+        with self._lock:
+            self._data.pop(key, None)
+            self._version += 1
+
+    def invalidate(self) -> None:
+        """Drop every entry and bump the version."""
+        with self._lock:
+            self._data.clear()
+            self._version += 1
+            self.invalidations += 1
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for monitoring."""
+        with self._lock:
+            lookups = self.hits + self.misses
+            return {
+                "name": self.name,
+                "size": len(self._data),
+                "maxsize": self.maxsize,
+                "version": self._version,
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "invalidations": self.invalidations,
+                "hit_ratio": round(self.hits / lookups, 4) if lookups else 0.0,
+            }
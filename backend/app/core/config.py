@@ -36,12 +36,42 @@ class Settings(BaseSettings):
     # Database Settings
     DATABASE_URL: str
     DATABASE_NAME: str = "WebOrderDB"
+    DATABASE_ASYNC_ENABLED: bool = False  # Serve the hot read endpoints through the async engine
+    ASYNC_DATABASE_URL: Optional[str] = None  # Defaults to DATABASE_URL with its async driver
+    DATABASE_ECHO: bool = False  # Log every SQL statement
+    DATABASE_POOL_SIZE: int = 10  # Connections kept open per engine and worker
+    DATABASE_MAX_OVERFLOW: int = 20  # Extra connections opened under load, closed when returned
+    DATABASE_POOL_TIMEOUT: float = 30  # Seconds to wait for a free connection before failing
+    DATABASE_POOL_RECYCLE: int = 1800  # Reopen connections older than this many seconds (-1: never)
+    DATABASE_POOL_PRE_PING: bool = True  # Test connections on checkout; off relies on recycle alone
+    # On worker start: "migrate" (DDL + superuser, one process only), "check" (revision only) or "skip"
+    DATABASE_STARTUP_MODE: str = "migrate"
     
     # Security Settings
     SECRET_KEY: str
     ALGORITHM: str = "HS256"
     ACCESS_TOKEN_EXPIRE_MINUTES: int = 30
     REFRESH_TOKEN_EXPIRE_DAYS: int = 7
+    AUTH_STATELESS: bool = False  # Authorize from signed token claims instead of loading the user
+    AUTH_USER_STATE_TTL_SECONDS: int = 30  # How long a worker trusts its cached token version
+    AUTH_USER_STATE_MAX_ENTRIES: int = 10000
+    AUTH_TOKEN_CACHE_ENABLED: bool = True  # Skip re-verifying recently seen tokens
+    AUTH_TOKEN_CACHE_TTL_SECONDS: int = 300  # Never beyond the token's own expiry
+    AUTH_TOKEN_CACHE_MAX_ENTRIES: int = 4096
+    PASSWORD_HASH_WORKERS: int = 2  # Threads running bcrypt, i.e. cores password checks may use
+    PASSWORD_HASH_MAX_QUEUE: int = 64  # Logins waiting beyond this are rejected with 503
+    
+    # Sign-in Rate Limit Settings (token buckets per client IP and per account)
+    RATE_LIMIT_ENABLED: bool = True
+    RATE_LIMIT_STORAGE: str = "memory"  # "memory" (per worker) or "sqlite" (shared by the host's workers)
+    RATE_LIMIT_SQLITE_PATH: str = "rate_limits.db"
+    RATE_LIMIT_MAX_BUCKETS: int = 100000  # memory storage only
+    LOGIN_RATE_LIMIT_IP_CAPACITY: int = 30  # Burst of attempts per IP, login and 2FA each
+    LOGIN_RATE_LIMIT_IP_PER_MINUTE: float = 10
+    LOGIN_RATE_LIMIT_ACCOUNT_CAPACITY: int = 5  # Failed logins before an email is throttled
+    LOGIN_RATE_LIMIT_ACCOUNT_PER_MINUTE: float = 1
+    TWO_FACTOR_RATE_LIMIT_CAPACITY: int = 5  # Failed codes before a user is throttled
+    TWO_FACTOR_RATE_LIMIT_PER_MINUTE: float = 1
     
     # Admin Settings
     FIRST_SUPERUSER_EMAIL: str = "admin@weborder.com"
@@ -65,6 +95,23 @@ class Settings(BaseSettings):
     
     # Logging
     LOG_LEVEL: str = "INFO"
+    QUERY_STATS_ENABLED: bool = True  # Count SQL statements and database time per request
+    SERVER_TIMING_ENABLED: bool = True  # Report them in a Server-Timing response header
+    SLOW_REQUEST_MS: float = 1000  # Log requests slower than this
+    SLOW_REQUEST_DB_MS: float = 500  # Log requests spending longer than this in the database
+    SLOW_REQUEST_QUERIES: int = 50  # Log requests running more statements than this
+    N_PLUS_ONE_THRESHOLD: int = 10  # Log requests running one statement shape this many times
+    
+    # Metrics Settings (Prometheus text format on /metrics, per worker process)
+    METRICS_ENABLED: bool = True
+    METRICS_BEARER_TOKEN: Optional[str] = None  # Require "Authorization: Bearer <token>" to scrape
+    
+    # Readiness Probe Settings (/health/ready)
+    READINESS_CACHE_SECONDS: float = 5  # Reuse a probe result this long, so probes add no DB load
+    READINESS_DB_TIMEOUT_SECONDS: float = 2  # Unready when SELECT 1 takes longer
+    READINESS_POOL_SATURATION: float = 0.9  # Unready when this share of pool + overflow is checked out
+    READINESS_OUTBOX_MAX_PENDING: int = 500  # Degraded above this many undelivered emails
+    READINESS_OUTBOX_MAX_AGE_SECONDS: int = 900  # Degraded when the oldest pending email is older
     
     # Email Settings
     SMTP_HOST: Optional[str] = None
@@ -75,6 +122,38 @@ class Settings(BaseSettings):
     SMTP_FROM_NAME: Optional[str] = "School Food Order"
     SMTP_STARTTLS: bool = True
     SMTP_USE_SSL: bool = False
+    SMTP_TIMEOUT_SECONDS: int = 10
+    SMTP_IDLE_TIMEOUT_SECONDS: int = 60  # Close the reused connection after this idle time
+    
+    # Email Outbox Settings
+    EMAIL_OUTBOX_ENABLED: bool = True  # Run the background delivery worker in this process
+    EMAIL_OUTBOX_POLL_INTERVAL_SECONDS: float = 2.0
+    EMAIL_OUTBOX_BATCH_SIZE: int = 20
+    EMAIL_OUTBOX_MAX_ATTEMPTS: int = 5
+    EMAIL_OUTBOX_BACKOFF_SECONDS: int = 30  # Doubled after each failed attempt
+    EMAIL_OUTBOX_LEASE_SECONDS: int = 120
+    
+    # Catalog Cache Settings (products & categories)
+    CATALOG_CACHE_ENABLED: bool = True
+    CATALOG_CACHE_TTL_SECONDS: int = 300
+    CATALOG_CACHE_MAX_ENTRIES: int = 512
+    SEARCH_INDEX_REFRESH_SECONDS: int = 300  # Rebuild the product search index after this age
+    
+    # Reservation Settings
+    RESERVATION_SLOT_MINUTES: int = 15  # Booking granularity used for slot locking; must divide 60
+    RESERVATION_INDEX_REFRESH_SECONDS: int = 60  # Reload the in-memory index after this age
+    
+    # Live Order Board Settings (Server-Sent Events)
+    ORDER_EVENTS_BUFFER_SIZE: int = 1000  # Recent events kept for reconnecting clients
+    ORDER_EVENTS_QUEUE_SIZE: int = 100  # Pending events per subscriber before it is dropped
+    ORDER_EVENTS_KEEPALIVE_SECONDS: float = 15.0
+    ORDER_EVENTS_RETRY_MILLISECONDS: int = 3000  # Reconnect delay suggested to clients
+    
+    # Statistics Cache Settings (admin dashboards)
+    STATISTICS_CACHE_ENABLED: bool = True
+    STATISTICS_CACHE_TTL_SECONDS: int = 30  # Current period and overview
+    STATISTICS_CACHE_CLOSED_TTL_SECONDS: int = 86400  # Months/years that have ended
+    STATISTICS_CACHE_MAX_ENTRIES: int = 256
     
     # Google OAuth Settings
     GOOGLE_CLIENT_ID: Optional[str] = None
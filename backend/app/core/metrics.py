@@ -0,0 +1,152 @@
+"""In-process metric primitives."""
+import bisect
+import threading
+from typing import Any, Dict, List, Optional, Sequence, Tuple
+
+
+class Histogram:
+    """
+    Thread-safe fixed-bucket histogram.
+
+    ``observe`` costs a bisect and an increment under a lock, so it can sit
+    on hot paths. Buckets are reported cumulatively, like Prometheus
+    ``le`` buckets, with a final ``+Inf`` bucket equal to ``count``.
+    """
+
+    def __init__(self, buckets: Sequence[float]) -> None:
+        self.bounds: List[float] = sorted(buckets)
+        self._counts = [0] * (len(self.bounds) + 1)
+        self._sum = 0.0
+        self._lock = threading.Lock()
+
+    def observe(self, value: float) -> None:
+        index = bisect.bisect_left(self.bounds, value)
+        with self._lock:
+            self._counts[index] += 1
+            self._sum += value
+
+    def snapshot(self) -> Dict[str, Any]:
+        """``count``, ``sum`` and cumulative ``buckets`` as ``[{"le": bound, "count": n}]``."""
+        with self._lock:
+            counts = list(self._counts)
+            total = self._sum
+        buckets = []
+        running = 0
+        for bound, count in zip(self.bounds + [float("inf")], counts):
+            running += count
+            buckets.append({"le": "+Inf" if bound == float("inf") else bound, "count": running})
+        return {"count": running, "sum": round(total, 6), "buckets": buckets}
+
+
+# Seconds from request to response start
+REQUEST_DURATION_BUCKETS = (0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1, 2.5, 5, 10)
+
+
+class _RouteStats:
+    __slots__ = ("buckets", "sum", "statuses")
+
+    def __init__(self, size: int) -> None:
+        self.buckets = [0] * size
+        self.sum = 0.0
+        self.statuses: Dict[int, int] = {}
+
+
+class RequestMetrics:
+    """
+    Request counts by status and latency histograms per ``(method, route)``.
+
+    Only MetricsMiddleware writes these, always on the event loop thread,
+    so updates are plain increments with no lock; the ``/metrics`` handler
+    reads them on the same thread and so sees a consistent snapshot.
+    """
+
+    def __init__(self, buckets: Sequence[float] = REQUEST_DURATION_BUCKETS) -> None:
+        self.bounds: List[float] = sorted(buckets)
+        self.in_progress = 0
+        self._routes: Dict[Tuple[str, str], _RouteStats] = {}
+
+    def observe(self, method: str, route: str, status: int, seconds: float) -> None:
+        stats = self._routes.get((method, route))
+        if stats is None:
+            stats = self._routes[(method, route)] = _RouteStats(len(self.bounds) + 1)
+        stats.buckets[bisect.bisect_left(self.bounds, seconds)] += 1
+        stats.sum += seconds
+        stats.statuses[status] = stats.statuses.get(status, 0) + 1
+
+    def snapshot(self) -> List[Tuple[str, str, Dict[int, int], List[int], float]]:
+        """``(method, route, counts by status, per-bucket counts, sum)`` per route."""
+        return [
+            (method, route, dict(stats.statuses), list(stats.buckets), stats.sum)
+            for (method, route), stats in sorted(self._routes.items())
+        ]
+
+
+request_metrics = RequestMetrics()
+
+
+def _format_value(value: float) -> str:
+    if value == float("inf"):
+        return "+Inf"
+    if isinstance(value, bool):
+        return "1" if value else "0"
+    if isinstance(value, int) or float(value).is_integer():
+        return str(int(value))
+    return repr(float(value))
+
+
+def _escape(value: Any) -> str:
+    return str(value).replace("\\", "\\\\").replace("\n", "\\n").replace('"', '\\"')
+
+
+def _format_labels(labels: Optional[Dict[str, Any]]) -> str:
+    if not labels:
+        return ""
+    return "{" + ",".join(f'{name}="{_escape(value)}"' for name, value in labels.items()) + "}"
+
+
+class PrometheusText:
+    """Builder for the Prometheus text exposition format (version 0.0.4)."""
+
+    CONTENT_TYPE = "text/plain; version=0.0.4; charset=utf-8"
+
+    def __init__(self) -> None:
+        self._lines: List[str] = []
+
+    def declare(self, name: str, kind: str, help_text: str) -> None:
+        """Start metric family ``name``; ``kind`` is counter, gauge or histogram."""
+        self._lines.append(f"# HELP {name} {help_text}")
+        self._lines.append(f"# TYPE {name} {kind}")
+
+    def sample(self, name: str, value: float, labels: Optional[Dict[str, Any]] = None) -> None:
+        self._lines.append(f"{name}{_format_labels(labels)} {_format_value(value)}")
+
+    def histogram(
+        self,
+        name: str,
+        bounds: Sequence[float],
+        counts: Sequence[int],
+        total: float,
+        labels: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Samples of one histogram from per-bucket (non-cumulative) ``counts``, the last being +Inf."""
+        labels = labels or {}
+        running = 0
+        for bound, count in zip(list(bounds) + [float("inf")], counts):
+            running += count
+            self.sample(f"{name}_bucket", running, {**labels, "le": _format_value(bound)})
+        self.sample(f"{name}_sum", total, labels)
+        self.sample(f"{name}_count", running, labels)
+
+    def histogram_snapshot(
+        self, name: str, snapshot: Dict[str, Any], scale: float = 1.0, labels: Optional[Dict[str, Any]] = None
+    ) -> None:
+        """Samples from ``Histogram.snapshot()``, multiplying bounds and sum by ``scale``."""
+        labels = labels or {}
+        for bucket in snapshot["buckets"]:
+            le = bucket["le"] if bucket["le"] == "+Inf" else _format_value(bucket["le"] * scale)
+            self.sample(f"{name}_bucket", bucket["count"], {**labels, "le": le})
+        self.sample(f"{name}_sum", snapshot["sum"] * scale, labels)
+        self.sample(f"{name}_count", snapshot["count"], labels)
+
+    def render(self) -> str:
+        return "\n".join(self._lines) + "\n"
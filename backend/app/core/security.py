@@ -1,6 +1,10 @@
 """Security utilities for authentication and authorization."""
+import asyncio
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
 from datetime import datetime, timedelta
-from typing import Optional, Union, Any
+from typing import Any, Callable, Dict, Optional, Union
 from jose import jwt, JWTError
 from passlib.context import CryptContext
 
@@ -10,11 +14,96 @@ from app.core.config import settings
 pwd_context = CryptContext(schemes=["bcrypt_sha256"], deprecated="auto")
 
 
+class PasswordHasherBusy(RuntimeError):
+    """Raised when the password hasher queue is full."""
+
+
+class PasswordHasher:
+    """
+    Run bcrypt on a dedicated, size-limited thread pool.
+
+    bcrypt releases the GIL, so PASSWORD_HASH_WORKERS bounds the CPU that
+    password checks can take, however many arrive at once. The async
+    methods used by login do not hold a request thread while they wait and
+    are rejected with PasswordHasherBusy once PASSWORD_HASH_MAX_QUEUE jobs
+    are waiting. The blocking methods used by registration and password
+    changes always wait their turn.
+    """
+
+    def __init__(self, workers: int, max_queue: int) -> None:
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="password-hash")
+        self._lock = threading.Lock()
+        self._queued = 0
+        self._running = 0
+        self.peak_queued = 0
+        self.completed = 0
+        self.rejected = 0
+        self.total_wait_seconds = 0.0
+        self.max_wait_seconds = 0.0
+
+    def _submit(self, fn: Callable[..., Any], *args: Any, reject: bool) -> Future:
+        with self._lock:
+            if reject and self._queued >= self.max_queue:
+                self.rejected += 1
+                raise PasswordHasherBusy("Password hasher queue is full")
+            self._queued += 1
+            self.peak_queued = max(self.peak_queued, self._queued)
+        queued_at = time.perf_counter()
+
+        def run() -> Any:
+            wait = time.perf_counter() - queued_at
+            with self._lock:
+                self._queued -= 1
+                self._running += 1
+                self.total_wait_seconds += wait
+                self.max_wait_seconds = max(self.max_wait_seconds, wait)
+            try:
+                return fn(*args)
+            finally:
+                with self._lock:
+                    self._running -= 1
+                    self.completed += 1
+
+        return self._executor.submit(run)
+
+    def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return self._submit(pwd_context.verify, plain_password, hashed_password, reject=False).result()
+
+    def hash(self, password: str) -> str:
+        return self._submit(pwd_context.hash, password, reject=False).result()
+
+    async def verify_async(self, plain_password: str, hashed_password: str) -> bool:
+        return await asyncio.wrap_future(
+            self._submit(pwd_context.verify, plain_password, hashed_password, reject=True)
+        )
+
+    def stats(self) -> dict:
+        with self._lock:
+            started = self.completed + self._running
+            return {
+                "workers": self.workers,
+                "max_queue": self.max_queue,
+                "queued": self._queued,
+                "running": self._running,
+                "peak_queued": self.peak_queued,
+                "completed": self.completed,
+                "rejected": self.rejected,
+                "avg_wait_ms": round(self.total_wait_seconds / started * 1000, 2) if started else 0.0,
+                "max_wait_ms": round(self.max_wait_seconds * 1000, 2),
+            }
+
+
+password_hasher = PasswordHasher(settings.PASSWORD_HASH_WORKERS, settings.PASSWORD_HASH_MAX_QUEUE)
+
+
 def create_access_token(
     subject: Union[str, Any],
-    expires_delta: Optional[timedelta] = None
+    expires_delta: Optional[timedelta] = None,
+    claims: Optional[Dict[str, Any]] = None,
 ) -> str:
-    """Create JWT access token."""
+    """Create JWT access token, with optional extra ``claims``."""
     if expires_delta:
         expire = datetime.utcnow() + expires_delta
     else:
@@ -22,7 +111,7 @@ def create_access_token(
             minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
         )
     
-    to_encode = {"exp": expire, "sub": str(subject)}
+    to_encode = {**(claims or {}), "exp": expire, "sub": str(subject)}
     encoded_jwt = jwt.encode(
         to_encode,
         settings.SECRET_KEY,
@@ -33,12 +122,17 @@ def create_access_token(
 
 def verify_password(plain_password: str, hashed_password: str) -> bool:
     """Verify a password against a hash."""
-    return pwd_context.verify(plain_password, hashed_password)
+    return password_hasher.verify(plain_password, hashed_password)
 
 
 def get_password_hash(password: str) -> str:
     """Hash a password."""
-    return pwd_context.hash(password)
+    return password_hasher.hash(password)
+
+
+async def verify_password_async(plain_password: str, hashed_password: str) -> bool:
+    """Verify a password without blocking the event loop. May raise PasswordHasherBusy."""
+    return await password_hasher.verify_async(plain_password, hashed_password)
 
 
 def decode_token(token: str) -> Optional[str]:
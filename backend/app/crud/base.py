@@ -1,9 +1,12 @@
 """Base CRUD operations."""
-from typing import Any, Dict, Generic, List, Optional, Type, TypeVar, Union
+from typing import Any, Dict, Generic, List, Optional, Tuple, Type, TypeVar, Union
 from fastapi.encoders import jsonable_encoder
 from pydantic import BaseModel
+from sqlalchemy import and_, or_
 from sqlmodel import Session, SQLModel, select
 
+from app.utils.pagination import decode_cursor, encode_cursor
+
 ModelType = TypeVar("ModelType", bound=SQLModel)
 CreateSchemaType = TypeVar("CreateSchemaType", bound=BaseModel)
 UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
@@ -12,6 +15,10 @@ UpdateSchemaType = TypeVar("UpdateSchemaType", bound=BaseModel)
 class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
     """Base class for CRUD operations."""
 
+    # Sort key for keyset pagination; the last column must be unique.
+    cursor_columns: Tuple[str, ...] = ("id",)
+    cursor_descending: bool = False
+
     def __init__(self, model: Type[ModelType]):
         """Initialize CRUD object with model."""
         self.model = model
@@ -27,6 +34,66 @@ class CRUDBase(Generic[ModelType, CreateSchemaType, UpdateSchemaType]):
         statement = select(self.model).order_by(self.model.id).offset(skip).limit(limit)
         return db.exec(statement).all()
 
+    def get_page(
+        self, db: Session, *, cursor: Optional[str] = None, limit: int = 100
+    ) -> Tuple[List[ModelType], Optional[str]]:
+        """Get one keyset page of records and the cursor of the next page."""
+        return self.paginate(db, select(self.model), cursor=cursor, limit=limit)
+
+    def paginate(
+        self, db: Session, statement, *, cursor: Optional[str] = None, limit: int = 100
+    ) -> Tuple[List[ModelType], Optional[str]]:
+        """Apply keyset pagination to ``statement``.
+
+        Rows are ordered by ``cursor_columns`` and the page starts right
+        after the row encoded in ``cursor``, so the database seeks through
+        the index instead of counting past skipped rows. Returns the page and
+        the cursor for the next one (None on the last page). Raises
+        ValueError for a malformed cursor.
+        """
+        if limit <= 0:
+            return [], None
+        columns = [getattr(self.model, name) for name in self.cursor_columns]
+        if cursor:
+            values = decode_cursor(cursor)
+            if len(values) != len(columns) or not all(map(self._fits_column, columns, values)):
+                raise ValueError("Invalid cursor")
+            statement = statement.where(self._seek(columns, values))
+
+        order = [column.desc() if self.cursor_descending else column for column in columns]
+        rows = db.exec(statement.order_by(*order).limit(limit + 1)).all()
+        if len(rows) <= limit:
+            return rows, None
+        rows = rows[:limit]
+        last = rows[-1]
+        return rows, encode_cursor([getattr(last, name) for name in self.cursor_columns])
+
+    @staticmethod
+    def _fits_column(column: Any, value: Any) -> bool:
+        """Whether a decoded cursor value has the type of its sort column."""
+        python_type = column.type.python_type
+        if isinstance(value, bool) and python_type is not bool:
+            return False
+        return isinstance(value, python_type)
+
+    def _seek(self, columns: List[Any], values: List[Any]):
+        """``(c1, c2, ...) > (v1, v2, ...)`` spelled out for databases without row values.
+
+        The redundant bound on the first column gives the planner an index
+        range to seek on; without it the OR is often evaluated as a scan.
+        """
+        if self.cursor_descending:
+            after = lambda column, value: column < value  # noqa: E731
+            bound = columns[0] <= values[0]
+        else:
+            after = lambda column, value: column > value  # noqa: E731
+            bound = columns[0] >= values[0]
+        clauses = []
+        for position, (column, value) in enumerate(zip(columns, values)):
+            equal = [columns[i] == values[i] for i in range(position)]
+            clauses.append(and_(*equal, after(column, value)))
+        return and_(bound, or_(*clauses))
+
     def create(self, db: Session, *, obj_in: CreateSchemaType) -> ModelType:
         """Create a new record."""
         obj_in_data = jsonable_encoder(obj_in)
@@ -1,5 +1,6 @@
 """CRUD operations for Cart model."""
 from typing import Optional
+from sqlalchemy import delete
 from sqlmodel import Session, select
 
 from app.crud.base import CRUDBase
@@ -77,13 +78,11 @@ class CRUDCart(CRUDBase[Cart, CartCreate, dict]):
             return True
         return False
 
-    def clear_cart(self, db: Session, *, cart_id: int) -> bool:
+    def clear_cart(self, db: Session, *, cart_id: int, commit: bool = True) -> bool:
         """Clear all items from cart."""
-        statement = select(CartItem).where(CartItem.cart_id == cart_id)
-        items = db.exec(statement).all()
-        for item in items:
-            db.delete(item)
-        db.commit()
+        db.execute(delete(CartItem).where(CartItem.cart_id == cart_id))
+        if commit:
+            db.commit()
         return True
 
 
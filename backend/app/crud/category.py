@@ -1,15 +1,40 @@
 """CRUD operations for Category model."""
-from typing import Optional
+from typing import Any, Dict, Optional, Union
 from sqlmodel import Session, select
 
 from app.crud.base import CRUDBase
 from app.models.category import Category
 from app.schemas.category import CategoryCreate, CategoryUpdate
+from app.services.catalog_cache import catalog_cache
 
 
 class CRUDCategory(CRUDBase[Category, CategoryCreate, CategoryUpdate]):
     """CRUD operations for Category model."""
 
+    def create(self, db: Session, *, obj_in: CategoryCreate) -> Category:
+        """Create a category and invalidate the catalog cache."""
+        db_obj = super().create(db, obj_in=obj_in)
+        catalog_cache.invalidate()
+        return db_obj
+
+    def update(
+        self,
+        db: Session,
+        *,
+        db_obj: Category,
+        obj_in: Union[CategoryUpdate, Dict[str, Any]]
+    ) -> Category:
+        """Update a category and invalidate the catalog cache."""
+        db_obj = super().update(db, db_obj=db_obj, obj_in=obj_in)
+        catalog_cache.invalidate()
+        return db_obj
+
+    def delete(self, db: Session, *, id: int) -> Category:
+        """Delete a category and invalidate the catalog cache."""
+        obj = super().delete(db, id=id)
+        catalog_cache.invalidate()
+        return obj
+
     def get_by_name(self, db: Session, *, name: str) -> Optional[Category]:
         """Get category by name."""
         statement = select(Category).where(Category.name == name)
@@ -0,0 +1,224 @@
+"""CRUD operations for the daily revenue rollup."""
+from collections import defaultdict
+from datetime import date, datetime
+from typing import Dict, List, Optional, Tuple
+
+from sqlalchemy import delete, update
+from sqlalchemy.exc import IntegrityError
+from sqlmodel import Session, select
+
+from app.crud.base import CRUDBase
+from app.models.daily_revenue import DailyRevenue
+from app.models.order import Order
+from app.utils.enums import OrderStatus, PaymentMethod
+
+ROLLUP_STATUSES = (OrderStatus.COMPLETED, OrderStatus.CANCELLED)
+
+BucketKey = Tuple[date, OrderStatus, PaymentMethod]
+
+
+def rollup_date(
+    status: OrderStatus,
+    completed_at: Optional[datetime],
+    updated_at: Optional[datetime],
+    created_at: Optional[datetime] = None,
+) -> Optional[date]:
+    """Day an order is counted on for a given status, or None if not rolled up."""
+    if status == OrderStatus.COMPLETED:
+        moment = completed_at
+    elif status == OrderStatus.CANCELLED:
+        moment = updated_at or created_at
+    else:
+        return None
+    return moment.date() if moment else None
+
+
+class CRUDDailyRevenue(CRUDBase[DailyRevenue, DailyRevenue, dict]):
+    """CRUD operations for DailyRevenue model."""
+
+    def apply(
+        self,
+        db: Session,
+        *,
+        revenue_date: date,
+        status: OrderStatus,
+        payment_method: PaymentMethod,
+        order_count: int,
+        revenue: float,
+    ) -> None:
+        """Add deltas to one rollup bucket, creating it if needed. Does not commit."""
+        now = datetime.utcnow()
+        bucket = (
+            DailyRevenue.revenue_date == revenue_date,
+            DailyRevenue.status == status,
+            DailyRevenue.payment_method == payment_method,
+        )
+        increment = (
+            update(DailyRevenue)
+            .where(*bucket)
+            .values(
+                order_count=DailyRevenue.order_count + order_count,
+                revenue=DailyRevenue.revenue + revenue,
+                updated_at=now,
+            )
+            .execution_options(synchronize_session=False)
+        )
+        if db.execute(increment).rowcount:
+            return
+
+        try:
+            with db.begin_nested():
+                db.add(
+                    DailyRevenue(
+                        revenue_date=revenue_date,
+                        status=status,
+                        payment_method=payment_method,
+                        order_count=order_count,
+                        revenue=revenue,
+                        updated_at=now,
+                    )
+                )
+        except IntegrityError:
+            # Another transaction created the bucket first
+            db.execute(increment)
+
+    def record_transition(
+        self,
+        db: Session,
+        *,
+        order: Order,
+        previous_status: OrderStatus,
+        previous_completed_at: Optional[datetime],
+        previous_updated_at: Optional[datetime],
+    ) -> None:
+        """Move an order between rollup buckets after a status change. Does not commit."""
+        payment_method = order.payment_method or PaymentMethod.CASH
+        total = order.total_amount or 0.0
+
+        previous_date = rollup_date(
+            previous_status, previous_completed_at, previous_updated_at, order.created_at
+        )
+        if previous_date:
+            self.apply(
+                db,
+                revenue_date=previous_date,
+                status=previous_status,
+                payment_method=payment_method,
+                order_count=-1,
+                revenue=-total,
+            )
+
+        current_date = rollup_date(
+            order.status, order.completed_at, order.updated_at, order.created_at
+        )
+        if current_date:
+            self.apply(
+                db,
+                revenue_date=current_date,
+                status=order.status,
+                payment_method=payment_method,
+                order_count=1,
+                revenue=total,
+            )
+
+    def remove_order(self, db: Session, *, order: Order) -> None:
+        """Take a deleted order out of the rollup. Does not commit."""
+        revenue_date = rollup_date(
+            order.status, order.completed_at, order.updated_at, order.created_at
+        )
+        if revenue_date:
+            self.apply(
+                db,
+                revenue_date=revenue_date,
+                status=order.status,
+                payment_method=order.payment_method or PaymentMethod.CASH,
+                order_count=-1,
+                revenue=-(order.total_amount or 0.0),
+            )
+
+    def change_payment_method(
+        self, db: Session, *, order: Order, payment_method: PaymentMethod
+    ) -> None:
+        """Move a finished order to another payment method bucket. Does not commit."""
+        revenue_date = rollup_date(
+            order.status, order.completed_at, order.updated_at, order.created_at
+        )
+        if not revenue_date:
+            return
+        self.remove_order(db, order=order)
+        self.apply(
+            db,
+            revenue_date=revenue_date,
+            status=order.status,
+            payment_method=payment_method,
+            order_count=1,
+            revenue=order.total_amount or 0.0,
+        )
+
+    def get_range(
+        self,
+        db: Session,
+        *,
+        start: date,
+        end: date,
+        status: Optional[OrderStatus] = OrderStatus.COMPLETED,
+    ) -> List[DailyRevenue]:
+        """Rollup rows with ``start <= revenue_date < end``."""
+        statement = select(DailyRevenue).where(
+            DailyRevenue.revenue_date >= start,
+            DailyRevenue.revenue_date < end,
+        )
+        if status is not None:
+            statement = statement.where(DailyRevenue.status == status)
+        return db.exec(statement.order_by(DailyRevenue.revenue_date)).all()
+
+    def get_all(
+        self, db: Session, *, status: Optional[OrderStatus] = OrderStatus.COMPLETED
+    ) -> List[DailyRevenue]:
+        """All rollup rows, optionally for one status."""
+        statement = select(DailyRevenue)
+        if status is not None:
+            statement = statement.where(DailyRevenue.status == status)
+        return db.exec(statement).all()
+
+    def rebuild(self, db: Session, *, batch_size: int = 5000) -> int:
+        """Recompute the whole rollup from the orders table and commit. Returns bucket count."""
+        buckets: Dict[BucketKey, List[float]] = defaultdict(lambda: [0, 0.0])
+        statement = (
+            select(
+                Order.status,
+                Order.payment_method,
+                Order.total_amount,
+                Order.created_at,
+                Order.updated_at,
+                Order.completed_at,
+            )
+            .where(Order.status.in_(ROLLUP_STATUSES))
+            .execution_options(yield_per=batch_size)
+        )
+        for status, payment_method, total, created_at, updated_at, completed_at in db.exec(statement):
+            revenue_date = rollup_date(status, completed_at, updated_at, created_at)
+            if not revenue_date:
+                continue
+            bucket = buckets[(revenue_date, status, payment_method or PaymentMethod.CASH)]
+            bucket[0] += 1
+            bucket[1] += total or 0.0
+
+        now = datetime.utcnow()
+        db.execute(delete(DailyRevenue))
+        db.add_all(
+            DailyRevenue(
+                revenue_date=revenue_date,
+                status=status,
+                payment_method=payment_method,
+                order_count=order_count,
+                revenue=revenue,
+                updated_at=now,
+            )
+            for (revenue_date, status, payment_method), (order_count, revenue) in buckets.items()
+        )
+        db.commit()
+        return len(buckets)
+
+
+daily_revenue = CRUDDailyRevenue(DailyRevenue)
@@ -0,0 +1,130 @@
+"""CRUD operations for the email outbox."""
+import secrets
+from datetime import datetime, timedelta
+from typing import List, Optional, Tuple
+
+from sqlalchemy import func, update
+from sqlmodel import Session, select
+
+from app.crud.base import CRUDBase
+from app.models.email_outbox import EmailOutbox
+from app.utils.enums import EmailStatus
+
+
+class CRUDEmailOutbox(CRUDBase[EmailOutbox, EmailOutbox, dict]):
+    """CRUD operations for EmailOutbox model."""
+
+    def enqueue(
+        self,
+        db: Session,
+        *,
+        to_email: str,
+        subject: str,
+        html_body: str,
+        text_body: Optional[str] = None,
+        commit: bool = True,
+    ) -> EmailOutbox:
+        """Queue an email for background delivery."""
+        message = EmailOutbox(
+            to_email=to_email,
+            subject=subject,
+            html_body=html_body,
+            text_body=text_body,
+        )
+        db.add(message)
+        if commit:
+            db.commit()
+            db.refresh(message)
+        return message
+
+    def claim_due(
+        self, db: Session, *, limit: int, lease_seconds: int
+    ) -> List[EmailOutbox]:
+        """
+        Lease up to ``limit`` due messages to the caller.
+
+        Claimed rows get a fresh claim token and have next_attempt_at pushed out
+        by the lease, so other workers skip them until the lease expires.
+        """
+        now = datetime.utcnow()
+        due_ids = db.exec(
+            select(EmailOutbox.id)
+            .where(
+                EmailOutbox.status == EmailStatus.PENDING,
+                EmailOutbox.next_attempt_at <= now,
+            )
+            .order_by(EmailOutbox.next_attempt_at)
+            .limit(limit)
+        ).all()
+        if not due_ids:
+            return []
+
+        token = secrets.token_hex(16)
+        db.execute(
+            update(EmailOutbox)
+            .where(
+                EmailOutbox.id.in_(due_ids),
+                EmailOutbox.status == EmailStatus.PENDING,
+                EmailOutbox.next_attempt_at <= now,
+            )
+            .values(
+                claim_token=token,
+                next_attempt_at=now + timedelta(seconds=lease_seconds),
+            )
+            .execution_options(synchronize_session=False)
+        )
+        db.commit()
+
+        statement = (
+            select(EmailOutbox)
+            .where(EmailOutbox.claim_token == token)
+            .order_by(EmailOutbox.id)
+        )
+        return db.exec(statement).all()
+
+    def mark_sent(self, db: Session, *, message: EmailOutbox) -> None:
+        """Record a successful delivery. Does not commit."""
+        message.status = EmailStatus.SENT
+        message.attempts += 1
+        message.sent_at = datetime.utcnow()
+        message.claim_token = None
+        message.last_error = None
+        db.add(message)
+
+    def mark_failed(
+        self,
+        db: Session,
+        *,
+        message: EmailOutbox,
+        error: str,
+        max_attempts: int,
+        backoff_seconds: int,
+    ) -> None:
+        """Schedule a retry with exponential backoff, or give up. Does not commit."""
+        message.attempts += 1
+        message.last_error = error[:500]
+        message.claim_token = None
+        if message.attempts >= max_attempts:
+            message.status = EmailStatus.FAILED
+        else:
+            delay = backoff_seconds * 2 ** (message.attempts - 1)
+            message.next_attempt_at = datetime.utcnow() + timedelta(seconds=delay)
+        db.add(message)
+
+    def count_pending(self, db: Session) -> int:
+        """Number of messages still waiting for delivery."""
+        statement = select(func.count(EmailOutbox.id)).where(
+            EmailOutbox.status == EmailStatus.PENDING
+        )
+        return db.exec(statement).one()
+
+    def pending_backlog(self, db: Session) -> Tuple[int, Optional[datetime]]:
+        """Number of messages waiting for delivery and when the oldest was queued."""
+        statement = select(func.count(EmailOutbox.id), func.min(EmailOutbox.created_at)).where(
+            EmailOutbox.status == EmailStatus.PENDING
+        )
+        count, oldest = db.exec(statement).one()
+        return count, oldest
+
+
+email_outbox = CRUDEmailOutbox(EmailOutbox)
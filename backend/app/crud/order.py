@@ -1,18 +1,47 @@
 """CRUD operations for Order model."""
-from typing import List, Optional
+from collections import defaultdict
+from typing import Any, Dict, List, Optional, Tuple
 from datetime import datetime
+from sqlalchemy import update
 from sqlalchemy.orm import selectinload
 from sqlmodel import Session, select
 
 from app.crud.base import CRUDBase
 from app.models.order import Order, OrderItem
+from app.models.product import Product
+from app.models.table import Table
 from app.schemas.order import OrderCreate
-from app.utils.enums import OrderStatus, PaymentMethod
+from app.services.statistics_cache import statistics_cache
+from app.utils.enums import OrderStatus, OrderView, PaymentMethod
+
+
+_SUMMARY_COLUMNS = (
+    Order.id,
+    Order.user_id,
+    Order.table_id,
+    Order.status,
+    Order.payment_status,
+    Order.total_amount,
+    Order.created_at,
+)
+_BOARD_COLUMNS = _SUMMARY_COLUMNS + (
+    Order.delivery_type,
+    Order.notes,
+    Order.updated_at,
+    Table.table_number,
+    Table.location,
+)
+
+# Stay well below SQL Server's 2100 bind parameters per statement
+_IN_CHUNK_SIZE = 500
 
 
 class CRUDOrder(CRUDBase[Order, OrderCreate, dict]):
     """CRUD operations for Order model."""
 
+    cursor_columns = ("created_at", "id")
+    cursor_descending = True
+
     def _with_related(self, statement):
         """Ensure table, user, and items are eager-loaded."""
         return statement.options(
@@ -22,46 +51,148 @@ class CRUDOrder(CRUDBase[Order, OrderCreate, dict]):
             selectinload(Order.reservation),
         )
 
+    def _select(self, view: OrderView = OrderView.FULL):
+        """Select what ``view`` renders.
+
+        The lean views select plain columns instead of ORM entities, which
+        skips identity-map bookkeeping and the eager loads of the full view.
+        """
+        if view == OrderView.SUMMARY:
+            return select(*_SUMMARY_COLUMNS)
+        if view == OrderView.STAFF_BOARD:
+            return select(*_BOARD_COLUMNS).outerjoin(Table, Order.table_id == Table.id)
+        return self._with_related(select(Order))
+
+    def _finish(self, db: Session, rows: List[Any], view: OrderView) -> List[Any]:
+        """Attach the item lines to staff-board rows; other views pass through."""
+        if view != OrderView.STAFF_BOARD:
+            return rows
+
+        order_ids = [row.id for row in rows]
+        items: Dict[int, List[dict]] = defaultdict(list)
+        for start in range(0, len(order_ids), _IN_CHUNK_SIZE):
+            statement = (
+                select(
+                    OrderItem.order_id,
+                    OrderItem.id,
+                    OrderItem.product_id,
+                    OrderItem.quantity,
+                    OrderItem.notes,
+                    Product.name,
+                )
+                .join(Product, OrderItem.product_id == Product.id)
+                .where(OrderItem.order_id.in_(order_ids[start:start + _IN_CHUNK_SIZE]))
+                .order_by(OrderItem.id)
+            )
+            for item in db.exec(statement):
+                items[item.order_id].append({
+                    "id": item.id,
+                    "product_id": item.product_id,
+                    "quantity": item.quantity,
+                    "notes": item.notes,
+                    "product": {"id": item.product_id, "name": item.name},
+                })
+
+        orders = []
+        for row in rows:
+            order = dict(row._mapping)
+            table_number = order.pop("table_number")
+            location = order.pop("location")
+            order["table"] = (
+                {"id": row.table_id, "table_number": table_number, "location": location}
+                if row.table_id is not None else None
+            )
+            order["items"] = items.get(row.id, [])
+            orders.append(order)
+        return orders
+
     def get_multi(
-        self, db: Session, *, skip: int = 0, limit: int = 100
+        self,
+        db: Session,
+        *,
+        skip: int = 0,
+        limit: int = 100,
+        view: OrderView = OrderView.FULL,
     ) -> List[Order]:
         statement = (
-            self._with_related(select(Order))
+            self._select(view)
             .order_by(Order.created_at.desc())
             .offset(skip)
             .limit(limit)
         )
-        return db.exec(statement).all()
+        return self._finish(db, db.exec(statement).all(), view)
+
+    def get_page(
+        self,
+        db: Session,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        user_id: Optional[int] = None,
+        status: Optional[OrderStatus] = None,
+        view: OrderView = OrderView.FULL,
+    ) -> Tuple[List[Order], Optional[str]]:
+        """Get a keyset page of orders, newest first, optionally filtered.
+
+        Lean views return rows (summary) or dicts (staff board) shaped like
+        their response schemas instead of Order instances.
+        """
+        statement = self._select(view)
+        if user_id is not None:
+            statement = statement.where(Order.user_id == user_id)
+        if status is not None:
+            statement = statement.where(Order.status == status)
+        rows, next_cursor = self.paginate(db, statement, cursor=cursor, limit=limit)
+        return self._finish(db, rows, view), next_cursor
 
     def get(self, db: Session, id: int) -> Optional[Order]:
         statement = self._with_related(select(Order).where(Order.id == id))
         return db.exec(statement).first()
 
     def get_by_user(
-        self, db: Session, *, user_id: int, skip: int = 0, limit: int = 100
+        self,
+        db: Session,
+        *,
+        user_id: int,
+        skip: int = 0,
+        limit: int = 100,
+        view: OrderView = OrderView.FULL,
     ) -> List[Order]:
         """Get orders by user."""
         statement = (
-            self._with_related(select(Order))
+            self._select(view)
             .where(Order.user_id == user_id)
             .order_by(Order.created_at.desc())
             .offset(skip)
             .limit(limit)
         )
-        return db.exec(statement).all()
+        return self._finish(db, db.exec(statement).all(), view)
 
     def get_by_status(
-        self, db: Session, *, status: OrderStatus, skip: int = 0, limit: int = 100
+        self,
+        db: Session,
+        *,
+        status: OrderStatus,
+        skip: int = 0,
+        limit: int = 100,
+        view: OrderView = OrderView.FULL,
     ) -> List[Order]:
         """Get orders by status."""
         statement = (
-            self._with_related(select(Order))
+            self._select(view)
             .where(Order.status == status)
             .order_by(Order.created_at.desc())
             .offset(skip)
             .limit(limit)
         )
-        return db.exec(statement).all()
+        return self._finish(db, db.exec(statement).all(), view)
+
+    def delete(self, db: Session, *, id: int) -> Order:
+        """Delete an order and drop the statistics it contributed to."""
+        obj = db.get(self.model, id)
+        if obj:
+            statistics_cache.order_changed(db, obj)
+        return super().delete(db, id=id)
 
     def create_with_items(
         self,
@@ -70,10 +201,14 @@ class CRUDOrder(CRUDBase[Order, OrderCreate, dict]):
         user_id: int,
         obj_in: OrderCreate,
         items: List[dict],
-        total_amount: float
+        total_amount: float,
+        commit: bool = True,
     ) -> Order:
-        """Create order with items."""
-        # Create order
+        """Create order with items.
+
+        The order and all of its items are written in one flush. Pass
+        ``commit=False`` to leave the transaction open for the caller.
+        """
         order = Order(
             user_id=user_id,
             table_id=obj_in.table_id,
@@ -82,42 +217,59 @@ class CRUDOrder(CRUDBase[Order, OrderCreate, dict]):
             delivery_type=obj_in.delivery_type,
             payment_method=obj_in.payment_method or PaymentMethod.CASH,
         )
-        db.add(order)
-        db.commit()
-        db.refresh(order)
-
-        # Create order items
-        for item_data in items:
-            order_item = OrderItem(
-                order_id=order.id,
+        order.items = [
+            OrderItem(
                 product_id=item_data["product_id"],
                 quantity=item_data["quantity"],
                 price_at_time=item_data["price_at_time"],
                 subtotal=item_data["subtotal"],
                 notes=item_data.get("notes"),
             )
-            db.add(order_item)
+            for item_data in items
+        ]
+        db.add(order)
+        statistics_cache.order_changed(db, order)
 
-        db.commit()
-        db.refresh(order)
+        if commit:
+            db.commit()
+            db.refresh(order)
+        else:
+            db.flush()
         return order
 
     def update_status(
-        self, db: Session, *, order_id: int, status: OrderStatus
+        self,
+        db: Session,
+        *,
+        order_id: int,
+        status: OrderStatus,
+        previous_status: Optional[OrderStatus] = None,
+        commit: bool = True,
     ) -> Optional[Order]:
-        """Update order status."""
+        """Update order status.
+
+        With ``previous_status`` the UPDATE only applies while the order still
+        has that status, so of two concurrent identical transitions only one
+        takes effect. Returns None if the order is missing or was changed
+        meanwhile.
+        """
+        now = datetime.utcnow()
+        values = {"status": status, "updated_at": now}
+        if status == OrderStatus.COMPLETED:
+            values["completed_at"] = now
+        statement = update(Order).where(Order.id == order_id)
+        if previous_status is not None:
+            statement = statement.where(Order.status == previous_status)
+        statement = statement.values(**values).execution_options(synchronize_session=False)
+        if db.execute(statement).rowcount != 1:
+            return None
+
         order = super().get(db, id=order_id)
-        if order:
-            order.status = status
-            order.updated_at = datetime.utcnow()
-            
-            if status == OrderStatus.COMPLETED:
-                order.completed_at = datetime.utcnow()
-            
-            db.add(order)
+        db.refresh(order)
+        statistics_cache.order_changed(db, order)
+        if commit:
             db.commit()
             db.refresh(order)
         return order
 
-
 order = CRUDOrder(Order)
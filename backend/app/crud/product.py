@@ -1,15 +1,99 @@
 """CRUD operations for Product model."""
-from typing import List
+from typing import Any, Dict, Iterable, List, Optional, Tuple, Union
+from sqlalchemy import case, update
 from sqlmodel import Session, select
 
 from app.crud.base import CRUDBase
 from app.models.product import Product
 from app.schemas.product import ProductCreate, ProductUpdate
+from app.services.catalog_cache import catalog_cache
+from app.services.product_search import product_search_index
 
 
 class CRUDProduct(CRUDBase[Product, ProductCreate, ProductUpdate]):
     """CRUD operations for Product model."""
 
+    def create(self, db: Session, *, obj_in: ProductCreate) -> Product:
+        """Create a product and refresh the catalog cache and search index."""
+        db_obj = super().create(db, obj_in=obj_in)
+        catalog_cache.invalidate()
+        product_search_index.upsert(db_obj)
+        return db_obj
+
+    def update(
+        self,
+        db: Session,
+        *,
+        db_obj: Product,
+        obj_in: Union[ProductUpdate, Dict[str, Any]]
+    ) -> Product:
+        """Update a product and refresh the catalog cache and search index."""
+        db_obj = super().update(db, db_obj=db_obj, obj_in=obj_in)
+        catalog_cache.invalidate()
+        product_search_index.upsert(db_obj)
+        return db_obj
+
+    def delete(self, db: Session, *, id: int) -> Product:
+        """Delete a product and refresh the catalog cache and search index."""
+        obj = super().delete(db, id=id)
+        catalog_cache.invalidate()
+        product_search_index.remove(id)
+        return obj
+
+    def get_by_ids(self, db: Session, *, ids: Iterable[int]) -> Dict[int, Product]:
+        """Load several products in one query, keyed by ID."""
+        ids = list(set(ids))
+        if not ids:
+            return {}
+        statement = select(Product).where(Product.id.in_(ids))
+        return {product.id: product for product in db.exec(statement).all()}
+
+    def decrement_stock(self, db: Session, *, quantities: Dict[int, int]) -> int:
+        """
+        Decrement stock for tracked products with a single conditional UPDATE.
+
+        Products without stock tracking (NULL stock_quantity) and products whose
+        stock would go negative are left untouched. Does not commit; returns the
+        number of rows updated so the caller can detect a lost race. Callers
+        invalidate the catalog cache once the transaction commits.
+        """
+        if not quantities:
+            return 0
+        quantity = case(quantities, value=Product.id)
+        statement = (
+            update(Product)
+            .where(
+                Product.id.in_(list(quantities)),
+                Product.stock_quantity.is_not(None),
+                Product.stock_quantity >= quantity,
+            )
+            .values(stock_quantity=Product.stock_quantity - quantity)
+            .execution_options(synchronize_session=False)
+        )
+        return db.execute(statement).rowcount
+
+    def restore_stock(self, db: Session, *, quantities: Dict[int, int]) -> int:
+        """
+        Give stock back to tracked products with a single UPDATE.
+
+        The counterpart of ``decrement_stock`` for cancelled orders. Products
+        without stock tracking are left untouched. Does not commit; returns
+        the number of rows updated.
+        """
+        if not quantities:
+            return 0
+        quantity = case(quantities, value=Product.id)
+        statement = (
+            update(Product)
+            .where(
+                Product.id.in_(list(quantities)),
+                Product.stock_quantity.is_not(None),
+            )
+            .values(stock_quantity=Product.stock_quantity + quantity)
+            .execution_options(synchronize_session=False)
+        )
+        return db.execute(statement).rowcount
+
     def get_by_category(
         self, db: Session, *, category_id: int, skip: int = 0, limit: int = 100
     ) -> List[Product]:
@@ -36,18 +120,31 @@ class CRUDProduct(CRUDBase[Product, ProductCreate, ProductUpdate]):
         )
         return db.exec(statement).all()
 
+    def get_page(
+        self,
+        db: Session,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        category_id: Optional[int] = None,
+        available_only: bool = False,
+    ) -> Tuple[List[Product], Optional[str]]:
+        """Get a keyset page of products by ID, optionally filtered."""
+        statement = select(Product)
+        if category_id is not None:
+            statement = statement.where(Product.category_id == category_id)
+        if available_only:
+            statement = statement.where(Product.is_available == True)  # noqa: E712
+        return self.paginate(db, statement, cursor=cursor, limit=limit)
+
     def search_by_name(
         self, db: Session, *, name: str, skip: int = 0, limit: int = 100
     ) -> List[Product]:
-        """Search products by name."""
-        statement = (
-            select(Product)
-            .where(Product.name.contains(name))
-            .order_by(Product.id)
-            .offset(skip)
-            .limit(limit)
-        )
-        return db.exec(statement).all()
+        """Search products by name and description, ignoring accents and small typos."""
+        product_search_index.ensure_fresh(db)
+        ids = product_search_index.search(name, limit=skip + limit)[skip:]
+        products = self.get_by_ids(db, ids=ids)
+        return [products[product_id] for product_id in ids if product_id in products]
 
 
 product = CRUDProduct(Product)
@@ -1,12 +1,17 @@
 """CRUD helpers for table reservations."""
-from datetime import datetime
+from datetime import datetime, timedelta
 from typing import List, Optional
 
+from sqlalchemy import delete, exists, insert, literal
+from sqlalchemy.exc import IntegrityError
 from sqlmodel import Session, select
 
+from app.core.config import settings
 from app.crud.base import CRUDBase
-from app.models.reservation import TableReservation
+from app.models.reservation import ReservationSlot, TableReservation
 from app.schemas.reservation import ReservationCreate, ReservationUpdate
+from app.services.reservation_index import reservation_index
+from app.services.statistics_cache import statistics_cache
 from app.utils.enums import ReservationStatus
 
 
@@ -17,6 +22,35 @@ ACTIVE_STATUSES = (
 )
 
 
+class ReservationConflict(Exception):
+    """A reservation cannot become active: another booking holds its time slots."""
+
+    def __init__(self, reservation_id: int) -> None:
+        super().__init__(f"Reservation {reservation_id} overlaps another booking")
+        self.reservation_id = reservation_id
+
+
+def is_slot_boundary(value: datetime) -> bool:
+    """Whether ``value`` starts a RESERVATION_SLOT_MINUTES slot.
+
+    Bookings must start and end on slot boundaries: slots are whole, so an
+    unaligned end would claim the slot the next back-to-back booking starts in.
+    """
+    step = timedelta(minutes=settings.RESERVATION_SLOT_MINUTES)
+    return (value - datetime.min) % step == timedelta(0)
+
+
+def slot_starts(start: datetime, end: datetime) -> List[datetime]:
+    """Start times of the RESERVATION_SLOT_MINUTES slots covering ``[start, end)``."""
+    step = timedelta(minutes=settings.RESERVATION_SLOT_MINUTES)
+    slot = datetime.min + ((start - datetime.min) // step) * step
+    slots = []
+    while slot < end:
+        slots.append(slot)
+        slot += step
+    return slots
+
+
 class CRUDReservation(CRUDBase[TableReservation, ReservationCreate, ReservationUpdate]):
     """Reservation specific helpers."""
 
@@ -27,16 +61,91 @@ class CRUDReservation(CRUDBase[TableReservation, ReservationCreate, ReservationU
         obj_in: ReservationCreate,
         user_id: int,
         status: ReservationStatus = ReservationStatus.CONFIRMED,
-    ) -> TableReservation:
+    ) -> Optional[TableReservation]:
+        """Insert a reservation unless the table is already booked for that window.
+
+        The reservation is written with an INSERT ... SELECT ... WHERE NOT
+        EXISTS overlap guard and claims its time slots in the same
+        transaction; the slot primary key makes concurrent overlapping
+        bookings fail at the database. Returns None when the window is taken.
+        """
         data = obj_in.model_dump()
         data["user_id"] = user_id
         data["status"] = status
-        reservation = TableReservation(**data)
-        db.add(reservation)
+        data["created_at"] = datetime.utcnow()
+        columns = list(data)
+
+        overlapping = (
+            select(TableReservation.id)
+            .where(
+                TableReservation.table_id == data["table_id"],
+                TableReservation.status.in_(ACTIVE_STATUSES),
+                TableReservation.start_time < data["end_time"],
+                TableReservation.end_time > data["start_time"],
+            )
+        )
+        values = select(
+            *(literal(value, type_=TableReservation.__table__.c[name].type) for name, value in data.items())
+        ).where(~exists(overlapping))
+        statement = (
+            insert(TableReservation)
+            .from_select(columns, values)
+            .returning(TableReservation.id)
+        )
+        reservation_id = db.execute(statement).scalar_one_or_none()
+        if reservation_id is None:
+            db.rollback()
+            return None
+
+        reservation = db.get(TableReservation, reservation_id)
+        try:
+            self.claim_slots(db, reservation)
+        except IntegrityError:
+            db.rollback()
+            return None
+
+        statistics_cache.reservation_changed(db, reservation)
+        reservation_index.track(db, reservation)
         db.commit()
         db.refresh(reservation)
         return reservation
 
+    def claim_slots(self, db: Session, reservation: TableReservation) -> None:
+        """Insert the reservation's slot rows. Raises IntegrityError if any is taken."""
+        db.execute(
+            insert(ReservationSlot),
+            [
+                {
+                    "table_id": reservation.table_id,
+                    "slot_start": slot_start,
+                    "reservation_id": reservation.id,
+                }
+                for slot_start in slot_starts(reservation.start_time, reservation.end_time)
+            ],
+        )
+
+    def release_slots(self, db: Session, reservation_id: int) -> None:
+        db.execute(delete(ReservationSlot).where(ReservationSlot.reservation_id == reservation_id))
+
+    def _sync_slots(
+        self, db: Session, reservation: TableReservation, status: ReservationStatus
+    ) -> None:
+        """Claim or release slots before a reservation enters or leaves an active status.
+
+        Raises ReservationConflict, leaving the reservation unchanged, when
+        another booking holds the slots it would reclaim.
+        """
+        was_active = reservation.status in ACTIVE_STATUSES
+        is_active = status in ACTIVE_STATUSES
+        if was_active and not is_active:
+            self.release_slots(db, reservation.id)
+        elif is_active and not was_active:
+            try:
+                with db.begin_nested():
+                    self.claim_slots(db, reservation)
+            except IntegrityError:
+                raise ReservationConflict(reservation.id) from None
+
     def get_for_table(
         self,
         db: Session,
@@ -73,16 +182,25 @@ class CRUDReservation(CRUDBase[TableReservation, ReservationCreate, ReservationU
         return db.exec(statement).first() is not None
 
     def attach_order(
-        self, db: Session, *, reservation_id: int, order_id: int
+        self,
+        db: Session,
+        *,
+        reservation_id: int,
+        order_id: int,
+        commit: bool = True,
     ) -> TableReservation:
         reservation = db.get(TableReservation, reservation_id)
         if reservation:
+            self._sync_slots(db, reservation, ReservationStatus.ACTIVE)
             reservation.order_id = order_id
             reservation.status = ReservationStatus.ACTIVE
             reservation.updated_at = datetime.utcnow()
             db.add(reservation)
-            db.commit()
-            db.refresh(reservation)
+            statistics_cache.reservation_changed(db, reservation)
+            reservation_index.track(db, reservation)
+            if commit:
+                db.commit()
+                db.refresh(reservation)
         return reservation
 
     def update_status(
@@ -92,16 +210,21 @@ class CRUDReservation(CRUDBase[TableReservation, ReservationCreate, ReservationU
         reservation_id: int,
         status: ReservationStatus,
         clear_order: bool = False,
+        commit: bool = True,
     ) -> Optional[TableReservation]:
         reservation = db.get(TableReservation, reservation_id)
         if reservation:
+            self._sync_slots(db, reservation, status)
             reservation.status = status
             reservation.updated_at = datetime.utcnow()
             if clear_order:
                 reservation.order_id = None
             db.add(reservation)
-            db.commit()
-            db.refresh(reservation)
+            statistics_cache.reservation_changed(db, reservation)
+            reservation_index.track(db, reservation)
+            if commit:
+                db.commit()
+                db.refresh(reservation)
         return reservation
 
 
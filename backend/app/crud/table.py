@@ -1,5 +1,5 @@
 """CRUD operations for Table model."""
-from typing import Optional, List
+from typing import Optional, List, Tuple
 from sqlmodel import Session, select
 
 from app.crud.base import CRUDBase
@@ -29,20 +29,40 @@ class CRUDTable(CRUDBase[Table, TableCreate, TableUpdate]):
         )
         return db.exec(statement).all()
 
+    def get_page(
+        self,
+        db: Session,
+        *,
+        cursor: Optional[str] = None,
+        limit: int = 100,
+        status: Optional[TableStatus] = None,
+    ) -> Tuple[List[Table], Optional[str]]:
+        """Get a keyset page of tables by ID, optionally filtered by status."""
+        statement = select(Table)
+        if status is not None:
+            statement = statement.where(Table.status == status)
+        return self.paginate(db, statement, cursor=cursor, limit=limit)
+
+    def get_active(self, db: Session) -> List[Table]:
+        """Get all active tables."""
+        statement = select(Table).where(Table.is_active == True).order_by(Table.id)  # noqa: E712
+        return db.exec(statement).all()
+
     def get_available(self, db: Session, *, skip: int = 0, limit: int = 100) -> List[Table]:
         """Get available tables."""
         return self.get_by_status(db, status=TableStatus.AVAILABLE, skip=skip, limit=limit)
 
     def update_status(
-        self, db: Session, *, table_id: int, status: TableStatus
+        self, db: Session, *, table_id: int, status: TableStatus, commit: bool = True
     ) -> Optional[Table]:
         """Update table status."""
         table = db.get(Table, table_id)
         if table:
             table.status = status
             db.add(table)
-            db.commit()
-            db.refresh(table)
+            if commit:
+                db.commit()
+                db.refresh(table)
         return table
 
 
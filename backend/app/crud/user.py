@@ -6,6 +6,7 @@ from app.crud.base import CRUDBase
 from app.models.user import User
 from app.schemas.user import UserCreate, UserUpdate
 from app.core.security import get_password_hash, verify_password
+from app.services.user_state import CLAIM_FIELDS, user_state
 
 
 class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
@@ -46,15 +47,35 @@ class CRUDUser(CRUDBase[User, UserCreate, UserUpdate]):
     def update(
         self, db: Session, *, db_obj: User, obj_in: UserUpdate
     ) -> User:
-        """Update user."""
+        """Update user.
+
+        Changing the password or a field carried in token claims bumps
+        ``token_version``, which revokes the user's issued tokens.
+        """
         update_data = obj_in.model_dump(exclude_unset=True)
         
         if "password" in update_data:
             hashed_password = get_password_hash(update_data["password"])
             del update_data["password"]
             update_data["hashed_password"] = hashed_password
-        
-        return super().update(db, db_obj=db_obj, obj_in=update_data)
+
+        revoke = "hashed_password" in update_data or any(
+            field in update_data and update_data[field] != getattr(db_obj, field)
+            for field in CLAIM_FIELDS
+        )
+        if revoke:
+            update_data["token_version"] = db_obj.token_version + 1
+
+        db_obj = super().update(db, db_obj=db_obj, obj_in=update_data)
+        if revoke:
+            user_state.remember(db_obj)
+        return db_obj
+
+    def delete(self, db: Session, *, id: int) -> User:
+        """Delete user and forget its cached token state."""
+        obj = super().delete(db, id=id)
+        user_state.forget(id)
+        return obj
 
     def authenticate(
         self, db: Session, *, email: str, password: str
@@ -4,9 +4,11 @@ from app.models.user import User
 from app.models.category import Category
 from app.models.product import Product
 from app.models.table import Table
-from app.models.reservation import TableReservation
+from app.models.reservation import TableReservation, ReservationSlot
 from app.models.cart import Cart, CartItem
 from app.models.order import Order, OrderItem
+from app.models.email_outbox import EmailOutbox
+from app.models.daily_revenue import DailyRevenue
 
 __all__ = [
     "User",
@@ -14,8 +16,11 @@ __all__ = [
     "Product",
     "Table",
     "TableReservation",
+    "ReservationSlot",
     "Cart",
     "CartItem",
     "Order",
     "OrderItem",
+    "EmailOutbox",
+    "DailyRevenue",
 ]
@@ -1,5 +1,16 @@
-"""Database initialization."""
-from sqlmodel import SQLModel, Session, select
+"""Database initialization.
+
+Run once per deploy, before starting the workers:
+
+    python -m app.db.init_db
+
+It migrates the schema to the latest revision and creates the first
+superuser. Workers then start with DATABASE_STARTUP_MODE=check, which only
+verifies the schema revision.
+"""
+import logging
+
+from sqlmodel import Session, select
 
 from app.db.session import engine
 from app.core.security import get_password_hash
@@ -12,9 +23,6 @@ def init_db(db: Session) -> None:
     from app.models.user import User
     from app.utils.enums import UserRole
     
-    # Create tables
-    SQLModel.metadata.create_all(engine)
-    
     # Check if superuser exists
     statement = select(User).where(User.email == settings.FIRST_SUPERUSER_EMAIL)
     user = db.exec(statement).first()
@@ -34,3 +42,37 @@ def init_db(db: Session) -> None:
         print(f"Superuser created: {settings.FIRST_SUPERUSER_EMAIL}")
     else:
         print(f"Superuser already exists: {settings.FIRST_SUPERUSER_EMAIL}")
+
+
+def migrate_and_init() -> None:
+    """Migrate the schema to the latest revision, then create the first superuser."""
+    from app.db.migrations import upgrade
+
+    upgrade(engine)
+    with Session(engine) as db:
+        init_db(db)
+
+
+def prepare_database() -> None:
+    """
+    Startup step for DATABASE_STARTUP_MODE.
+
+    - migrate: migrate and create the superuser, as the init command does.
+      Fine for one process; concurrent workers would race on the DDL.
+    - check: no DDL, one or two queries; fails startup if the schema is behind.
+    - skip: nothing.
+    """
+    mode = settings.DATABASE_STARTUP_MODE
+    if mode == "migrate":
+        migrate_and_init()
+    elif mode == "check":
+        from app.db.migrations import check_schema
+
+        check_schema(engine)
+    elif mode != "skip":
+        raise ValueError(f"Unknown DATABASE_STARTUP_MODE: {mode!r} (expected migrate, check or skip)")
+
+
+if __name__ == "__main__":
+    logging.basicConfig(level=logging.INFO, format="%(levelname)s [%(name)s] %(message)s")
+    migrate_and_init()
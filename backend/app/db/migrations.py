@@ -0,0 +1,86 @@
+"""Schema migrations (Alembic) and the startup schema check."""
+import logging
+from pathlib import Path
+from typing import Optional
+
+from alembic import op
+from alembic.config import Config
+from alembic.runtime.migration import MigrationContext
+from alembic.script import ScriptDirectory
+from alembic.util import CommandError
+from sqlalchemy import inspect
+from sqlalchemy.engine import Connection, Engine
+
+logger = logging.getLogger(__name__)
+
+BACKEND_DIR = Path(__file__).resolve().parents[2]
+
+
+class SchemaOutOfDate(RuntimeError):
+    """The database has not been migrated to the revision this code expects."""
+
+
+def alembic_config(connection: Optional[Connection] = None) -> Config:
+    """Config for ``alembic.ini``; revisions run on ``connection`` when given."""
+    config = Config(str(BACKEND_DIR / "alembic.ini"))
+    config.set_main_option("script_location", str(BACKEND_DIR / "alembic"))
+    # Keep the app's logging configuration instead of alembic.ini's
+    config.attributes["configure_logger"] = False
+    if connection is not None:
+        config.attributes["connection"] = connection
+    return config
+
+
+def upgrade(engine: Engine, revision: str = "head") -> None:
+    """Migrate the database to ``revision`` in one transaction."""
+    # alembic.command pulls in autogenerate; workers that only check the revision skip it
+    from alembic import command
+
+    with engine.begin() as connection:
+        command.upgrade(alembic_config(connection), revision)
+
+
+def current_revision(connection: Connection) -> Optional[str]:
+    """The revision the database is at, or None if it was never migrated."""
+    return MigrationContext.configure(connection).get_current_revision()
+
+
+def check_schema(engine: Engine) -> None:
+    """
+    Make sure the database is at this code's head revision, without DDL.
+
+    Costs one or two queries. Raises SchemaOutOfDate when the database is
+    behind; a revision this code does not know (a newer deploy's) is only
+    logged, since older code usually runs on a schema that has been extended.
+    """
+    script = ScriptDirectory.from_config(alembic_config())
+    head = script.get_current_head()
+    with engine.connect() as connection:
+        current = current_revision(connection)
+    if current == head:
+        return
+    if current is not None:
+        try:
+            script.get_revision(current)
+        except CommandError:
+            logger.warning("Database is at revision %s, newer than this code's %s", current, head)
+            return
+    raise SchemaOutOfDate(
+        f"Database is at revision {current or '(none)'}, expected {head}. "
+        "Run `python -m app.db.init_db` before starting the app."
+    )
+
+
+# Helpers for revisions. Databases created before migrations may already have
+# some of the changes, so revisions check the live schema before altering it.
+
+def has_table(table: str) -> bool:
+    return inspect(op.get_bind()).has_table(table)
+
+
+def has_column(table: str, column: str) -> bool:
+    return any(c["name"] == column for c in inspect(op.get_bind()).get_columns(table))
+
+
+def has_index(table: str, index: str) -> bool:
+    return any(i["name"] == index for i in inspect(op.get_bind()).get_indexes(table))
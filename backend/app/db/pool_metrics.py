@@ -0,0 +1,144 @@
+"""Connection pool instrumentation."""
+import threading
+import time
+from typing import Any, Dict, Optional
+
+from sqlalchemy import event, exc
+from sqlalchemy.engine import Engine
+from sqlalchemy.pool import AsyncAdaptedQueuePool, QueuePool
+
+from app.core.metrics import Histogram
+
+# Milliseconds to get a connection; a warm pool with a free connection takes well under 1 ms
+CHECKOUT_WAIT_BUCKETS_MS = (0.5, 1, 2.5, 5, 10, 25, 50, 100, 250, 500, 1000, 2500, 5000, 10000, 30000)
+# Seconds a DBAPI connection stayed open, from connect to close
+CONNECTION_LIFETIME_BUCKETS_SECONDS = (1, 10, 60, 300, 900, 1800, 3600, 7200, 14400, 86400)
+
+
+class PoolMetrics:
+    """
+    Gauges and histograms for one engine's connection pool.
+
+    Checkout wait is the time ``Pool.connect`` takes: waiting for a
+    connection to be checked in once pool and overflow are exhausted,
+    opening a new one, and the pre-ping. It is only recorded by the
+    instrumented pool classes below. Connection lifetimes end on close,
+    whether by recycle, invalidation or dispose.
+    """
+
+    def __init__(self, name: str) -> None:
+        self.name = name
+        self.engine: Optional[Engine] = None
+        self.checkout_wait_ms = Histogram(CHECKOUT_WAIT_BUCKETS_MS)
+        self.connection_lifetime_seconds = Histogram(CONNECTION_LIFETIME_BUCKETS_SECONDS)
+        self._lock = threading.Lock()
+        self.checkouts = 0
+        self.checkout_timeouts = 0
+        self.peak_checked_out = 0
+        self.connections_opened = 0
+        self.connections_closed = 0
+        self.invalidations = 0
+
+    def attach(self, engine: Engine) -> None:
+        """Instrument the pool of ``engine`` (for an AsyncEngine, pass its ``sync_engine``)."""
+        self.engine = engine
+        engine.pool.metrics = self
+        event.listen(engine, "connect", self._on_connect)
+        event.listen(engine, "checkout", self._on_checkout)
+        event.listen(engine, "close", self._on_close)
+        event.listen(engine, "invalidate", self._on_invalidate)
+
+    def _on_connect(self, dbapi_connection: Any, connection_record: Any) -> None:
+        connection_record.info["opened_at"] = time.monotonic()
+        with self._lock:
+            self.connections_opened += 1
+
+    def _on_checkout(self, dbapi_connection: Any, connection_record: Any, connection_proxy: Any) -> None:
+        checked_out = self.engine.pool.checkedout() if isinstance(self.engine.pool, QueuePool) else 0
+        with self._lock:
+            self.checkouts += 1
+            self.peak_checked_out = max(self.peak_checked_out, checked_out)
+
+    def _on_close(self, dbapi_connection: Any, connection_record: Any) -> None:
+        opened_at = connection_record.info.pop("opened_at", None)
+        if opened_at is not None:
+            self.connection_lifetime_seconds.observe(time.monotonic() - opened_at)
+        with self._lock:
+            self.connections_closed += 1
+
+    def _on_invalidate(self, dbapi_connection: Any, connection_record: Any, exception: Any) -> None:
+        with self._lock:
+            self.invalidations += 1
+
+    def record_checkout(self, seconds: float, timed_out: bool = False) -> None:
+        self.checkout_wait_ms.observe(seconds * 1000)
+        if timed_out:
+            with self._lock:
+                self.checkout_timeouts += 1
+
+    def saturation(self) -> Optional[float]:
+        """Share of pool size plus overflow checked out, or None for other pool classes."""
+        pool = self.engine.pool if self.engine is not None else None
+        if not isinstance(pool, QueuePool):
+            return None
+        capacity = pool.size() + max(pool._max_overflow, 0)
+        return pool.checkedout() / capacity if capacity else None
+
+    def stats(self) -> Dict[str, Any]:
+        """Counters for monitoring."""
+        pool = self.engine.pool if self.engine is not None else None
+        with self._lock:
+            data: Dict[str, Any] = {
+                "name": self.name,
+                "pool_class": type(pool).__name__ if pool is not None else None,
+                "checkouts": self.checkouts,
+                "checkout_timeouts": self.checkout_timeouts,
+                "peak_checked_out": self.peak_checked_out,
+                "connections_opened": self.connections_opened,
+                "connections_closed": self.connections_closed,
+                "invalidations": self.invalidations,
+            }
+        if isinstance(pool, QueuePool):
+            data.update(
+                pool_size=pool.size(),
+                max_overflow=pool._max_overflow,
+                checked_in=pool.checkedin(),
+                checked_out=pool.checkedout(),
+                # QueuePool counts overflow from -pool_size; only connections beyond pool_size are overflow
+                overflow=max(pool.overflow(), 0),
+            )
+        data["checkout_wait_ms"] = self.checkout_wait_ms.snapshot()
+        data["connection_lifetime_seconds"] = self.connection_lifetime_seconds.snapshot()
+        return data
+
+
+class _TimedCheckout:
+    """Pool mixin recording how long each ``connect()`` takes in ``metrics``."""
+
+    metrics: Optional[PoolMetrics] = None
+
+    def connect(self):
+        if self.metrics is None:
+            return super().connect()
+        start = time.perf_counter()
+        try:
+            connection = super().connect()
+        except exc.TimeoutError:
+            self.metrics.record_checkout(time.perf_counter() - start, timed_out=True)
+            raise
+        self.metrics.record_checkout(time.perf_counter() - start)
+        return connection
+
+    def recreate(self):
+        # dispose() swaps in a recreated pool; keep reporting into the same metrics
+        pool = super().recreate()
+        pool.metrics = self.metrics
+        return pool
+
+
+class InstrumentedQueuePool(_TimedCheckout, QueuePool):
+    """QueuePool that reports checkout wait times."""
+
+
+class InstrumentedAsyncQueuePool(_TimedCheckout, AsyncAdaptedQueuePool):
+    """AsyncAdaptedQueuePool that reports checkout wait times."""
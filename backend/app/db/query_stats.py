@@ -0,0 +1,141 @@
+"""Per-request SQL statement counting and N+1 detection."""
+import re
+import threading
+import time
+from collections import Counter
+from contextlib import contextmanager
+from contextvars import ContextVar
+from typing import Any, Iterator, List, Optional, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.engine import Engine
+
+# "IN (?, ?, ?)" lists differ only by length; they count as one statement shape
+_IN_LIST = re.compile(r"\(\s*(?:\?|:\w+|%s)(?:\s*,\s*(?:\?|:\w+|%s))+\s*\)")
+
+_current: ContextVar[Optional["QueryStats"]] = ContextVar("query_stats", default=None)
+_observers: List["QueryStats"] = []
+_observers_lock = threading.Lock()
+
+
+class QueryStats:
+    """Statements executed and time spent in the database by one request (or block)."""
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.duration = 0.0
+        self.statements: Counter = Counter()
+
+    @property
+    def duration_ms(self) -> float:
+        return self.duration * 1000
+
+    def record(self, statement: str, seconds: float) -> None:
+        # A request runs its statements one after another, so no lock is needed
+        self.count += 1
+        self.duration += seconds
+        self.statements[statement] += 1
+
+    def merge(self, other: "QueryStats") -> None:
+        with _observers_lock:
+            self.count += other.count
+            self.duration += other.duration
+            self.statements.update(other.statements)
+
+    def repeated(self, threshold: int) -> List[Tuple[str, int]]:
+        """Statement shapes executed at least ``threshold`` times, most repeated first."""
+        shapes: Counter = Counter()
+        for statement, count in self.statements.items():
+            shapes[" ".join(_IN_LIST.sub("(?)", statement).split())] += count
+        return [(shape, count) for shape, count in shapes.most_common() if count >= threshold]
+
+    def describe(self, limit: int = 10) -> str:
+        """Multi-line summary of the most executed statement shapes."""
+        lines = [f"{self.count} queries, {self.duration_ms:.1f} ms in the database"]
+        for shape, count in self.repeated(1)[:limit]:
+            lines.append(f"  {count} x {shape}")
+        return "\n".join(lines)
+
+
+def current_stats() -> Optional[QueryStats]:
+    return _current.get()
+
+
+def _before_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    if _current.get() is not None:
+        conn.info.setdefault("query_started", []).append(time.perf_counter())
+
+
+def _after_cursor_execute(conn, cursor, statement, parameters, context, executemany) -> None:
+    stats = _current.get()
+    started = conn.info.get("query_started")
+    if stats is not None and started:
+        stats.record(statement, time.perf_counter() - started.pop())
+
+
+def _handle_error(exception_context: Any) -> None:
+    connection = exception_context.connection
+    if connection is not None and connection.info.get("query_started"):
+        connection.info["query_started"].pop()
+
+
+def track_engine(engine: Engine) -> None:
+    """Record the statements ``engine`` executes into the current QueryStats."""
+    event.listen(engine, "before_cursor_execute", _before_cursor_execute)
+    event.listen(engine, "after_cursor_execute", _after_cursor_execute)
+    event.listen(engine, "handle_error", _handle_error)
+
+
+@contextmanager
+def request_stats() -> Iterator[QueryStats]:
+    """Collect the statements of one request; used by QueryStatsMiddleware."""
+    stats = QueryStats()
+    token = _current.set(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+        if _observers:
+            with _observers_lock:
+                observers = list(_observers)
+            for observer in observers:
+                observer.merge(stats)
+
+
+@contextmanager
+def track_queries() -> Iterator[QueryStats]:
+    """
+    Count the statements run inside the block.
+
+    Covers code called directly in the block and every request that
+    finishes while it is open, including requests made through
+    ``TestClient``, which runs the app on another thread.
+    """
+    stats = QueryStats()
+    token = _current.set(stats)
+    with _observers_lock:
+        _observers.append(stats)
+    try:
+        yield stats
+    finally:
+        _current.reset(token)
+        with _observers_lock:
+            _observers.remove(stats)
+
+
+@contextmanager
+def assert_max_queries(max_count: int) -> Iterator[QueryStats]:
+    """
+    Fail with AssertionError if the block runs more than ``max_count`` statements.
+
+    For tests and scripts guarding an endpoint's query budget::
+
+        with assert_max_queries(3):
+            client.get("/api/v1/orders/?view=staff-board")
+    """
+    with track_queries() as stats:
+        yield stats
+    if stats.count > max_count:
+        raise AssertionError(
+            f"Expected at most {max_count} queries, got {stats.describe()}"
+        )
@@ -1,17 +1,43 @@
 """Database session configuration."""
+from abc import ABC, abstractmethod
+from typing import Any, AsyncIterator, Callable, Optional, TypeVar
+
 from sqlmodel import create_engine, Session
+from sqlmodel.ext.asyncio.session import AsyncSession
+from sqlalchemy.engine import make_url
+from sqlalchemy.ext.asyncio import AsyncEngine, async_sessionmaker, create_async_engine
 from sqlalchemy.orm import sessionmaker
+from starlette.concurrency import run_in_threadpool
 
 from app.core.config import settings
+from app.db.pool_metrics import InstrumentedAsyncQueuePool, InstrumentedQueuePool, PoolMetrics
+from app.db.query_stats import track_engine
+
+T = TypeVar("T")
+
+
+def _engine_options() -> dict:
+    """Pool and logging options shared by the sync and async engines."""
+    return dict(
+        echo=settings.DATABASE_ECHO,
+        pool_pre_ping=settings.DATABASE_POOL_PRE_PING,
+        pool_size=settings.DATABASE_POOL_SIZE,
+        max_overflow=settings.DATABASE_MAX_OVERFLOW,
+        pool_timeout=settings.DATABASE_POOL_TIMEOUT,
+        pool_recycle=settings.DATABASE_POOL_RECYCLE,
+    )
+
 
 # Create engine
 engine = create_engine(
     settings.DATABASE_URL,
-    echo=settings.DEBUG,
-    pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    poolclass=InstrumentedQueuePool,
+    **_engine_options(),
 )
+engine_metrics = PoolMetrics("sync")
+engine_metrics.attach(engine)
+if settings.QUERY_STATS_ENABLED:
+    track_engine(engine)
 
 # Create session factory
 SessionLocal = sessionmaker(
@@ -29,3 +55,103 @@ def get_db():
         yield db
     finally:
         db.close()
+
+
+# Async drivers standing in for the sync DBAPI of DATABASE_URL
+_ASYNC_DRIVERS = {
+    "sqlite": "aiosqlite",
+    "mssql": "aioodbc",
+}
+
+
+def async_database_url() -> str:
+    """ASYNC_DATABASE_URL, or DATABASE_URL switched to its async driver."""
+    if settings.ASYNC_DATABASE_URL:
+        return settings.ASYNC_DATABASE_URL
+    url = make_url(settings.DATABASE_URL)
+    driver = _ASYNC_DRIVERS.get(url.get_backend_name())
+    if driver is None:
+        raise ValueError(f"No async driver known for {url.get_backend_name()}; set ASYNC_DATABASE_URL")
+    return url.set(drivername=f"{url.get_backend_name()}+{driver}").render_as_string(hide_password=False)
+
+
+# The async engine is only created when enabled, so its driver stays optional
+async_engine: Optional[AsyncEngine] = None
+async_engine_metrics: Optional[PoolMetrics] = None
+AsyncSessionLocal: Optional[async_sessionmaker] = None
+
+if settings.DATABASE_ASYNC_ENABLED:
+    async_engine = create_async_engine(
+        async_database_url(),
+        poolclass=InstrumentedAsyncQueuePool,
+        **_engine_options(),
+    )
+    async_engine_metrics = PoolMetrics("async")
+    async_engine_metrics.attach(async_engine.sync_engine)
+    if settings.QUERY_STATS_ENABLED:
+        track_engine(async_engine.sync_engine)
+    AsyncSessionLocal = async_sessionmaker(
+        bind=async_engine,
+        class_=AsyncSession,
+        autoflush=False,
+        expire_on_commit=False,
+    )
+
+
+class DatabaseReader(ABC):
+    """
+    Runs sync CRUD code for an ``async def`` endpoint without blocking the event loop.
+
+    ``run(fn, *args, **kwargs)`` calls ``fn(session, *args, **kwargs)``
+    with a sync SQLModel session. Everything that touches the database,
+    including serializing relationships that load lazily, belongs inside
+    ``fn``.
+    """
+
+    @abstractmethod
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        """Return ``fn(session, *args, **kwargs)``."""
+
+
+class ThreadpoolReader(DatabaseReader):
+    """Calls ``fn`` on a sync engine session in the threadpool."""
+
+    def __init__(self, session: Session) -> None:
+        self.session = session
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        return await run_in_threadpool(fn, self.session, *args, **kwargs)
+
+
+class AsyncEngineReader(DatabaseReader):
+    """
+    Calls ``fn`` on the event loop through ``AsyncSession.run_sync``.
+
+    Its queries go through the async driver, so waiting on the database
+    does not hold a threadpool thread.
+    """
+
+    def __init__(self, session: AsyncSession) -> None:
+        self.session = session
+
+    async def run(self, fn: Callable[..., T], *args: Any, **kwargs: Any) -> T:
+        return await self.session.run_sync(fn, *args, **kwargs)
+
+
+async def get_db_reader() -> AsyncIterator[DatabaseReader]:
+    """
+    Dependency for the hot read endpoints.
+
+    Uses the async engine when DATABASE_ASYNC_ENABLED is set, otherwise the
+    sync engine through the threadpool.
+    """
+    if AsyncSessionLocal is not None:
+        async with AsyncSessionLocal() as session:
+            yield AsyncEngineReader(session)
+        return
+
+    db = SessionLocal()
+    try:
+        yield ThreadpoolReader(db)
+    finally:
+        await run_in_threadpool(db.close)
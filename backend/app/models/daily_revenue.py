@@ -0,0 +1,24 @@
+"""Daily revenue rollup model."""
+from datetime import date, datetime
+from typing import Optional
+from sqlmodel import SQLModel, Field
+
+from app.utils.enums import OrderStatus, PaymentMethod
+
+
+class DailyRevenue(SQLModel, table=True):
+    """Per-day order totals for finished orders, maintained incrementally.
+
+    Completed orders are bucketed by ``completed_at`` and cancelled orders by
+    the time they were cancelled (``updated_at``), both in UTC.
+    """
+    __tablename__ = "daily_revenue"
+    
+    revenue_date: date = Field(primary_key=True)
+    status: OrderStatus = Field(primary_key=True)
+    payment_method: PaymentMethod = Field(primary_key=True)
+    
+    order_count: int = Field(default=0)
+    revenue: float = Field(default=0)
+    
+    updated_at: Optional[datetime] = Field(default=None)
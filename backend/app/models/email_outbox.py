@@ -0,0 +1,46 @@
+"""Email outbox model."""
+from datetime import datetime
+from typing import Optional
+from sqlalchemy import Column, Unicode, UnicodeText
+from sqlmodel import SQLModel, Field
+
+from app.utils.enums import EmailStatus
+
+
+class EmailOutbox(SQLModel, table=True):
+    """Transactional email waiting to be delivered by the outbox worker."""
+    __tablename__ = "email_outbox"
+
+    id: Optional[int] = Field(default=None, primary_key=True)
+    to_email: str = Field(
+        sa_column=Column("to_email", Unicode(255), nullable=False),
+        max_length=255
+    )
+    subject: str = Field(
+        sa_column=Column("subject", Unicode(255), nullable=False),
+        max_length=255
+    )
+    text_body: Optional[str] = Field(
+        default=None,
+        sa_column=Column("text_body", UnicodeText, nullable=True)
+    )
+    html_body: str = Field(sa_column=Column("html_body", UnicodeText, nullable=False))
+
+    status: EmailStatus = Field(default=EmailStatus.PENDING, index=True)
+    attempts: int = Field(default=0)
+    last_error: Optional[str] = Field(
+        default=None,
+        sa_column=Column("last_error", Unicode(500), nullable=True),
+        max_length=500
+    )
+
+    # Delivery scheduling; claim_token marks rows leased by a worker
+    next_attempt_at: datetime = Field(default_factory=datetime.utcnow, index=True)
+    claim_token: Optional[str] = Field(
+        default=None,
+        sa_column=Column("claim_token", Unicode(32), nullable=True, index=True),
+        max_length=32
+    )
+
+    created_at: datetime = Field(default_factory=datetime.utcnow)
+    sent_at: Optional[datetime] = Field(default=None)
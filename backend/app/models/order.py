@@ -1,7 +1,7 @@
 """Order models."""
 from datetime import datetime
 from typing import Optional, List, TYPE_CHECKING
-from sqlalchemy import Column, Unicode
+from sqlalchemy import Column, Index, Unicode
 from sqlmodel import SQLModel, Field, Relationship
 
 from app.utils.enums import OrderStatus, PaymentStatus, PaymentMethod
@@ -16,6 +16,10 @@ if TYPE_CHECKING:
 class Order(SQLModel, table=True):
     """Order model - completed orders from carts."""
     __tablename__ = "orders"
+    __table_args__ = (
+        # Range scans on completed_at per status (statistics, rollup backfill)
+        Index("ix_orders_status_completed_at", "status", "completed_at"),
+    )
     
     id: Optional[int] = Field(default=None, primary_key=True)
     user_id: int = Field(foreign_key="users.id", index=True)
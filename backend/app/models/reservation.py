@@ -39,3 +39,16 @@ class TableReservation(SQLModel, table=True):
     table: "Table" = Relationship(back_populates="reservations")
     user: "User" = Relationship(back_populates="reservations")
     order: Optional["Order"] = Relationship(back_populates="reservation")
+
+
+class ReservationSlot(SQLModel, table=True):
+    """One fixed-size slot of a table's timeline held by an active reservation.
+
+    The primary key on ``(table_id, slot_start)`` makes the database reject
+    a second booking that claims any of the same slots.
+    """
+    __tablename__ = "reservation_slots"
+
+    table_id: int = Field(foreign_key="tables.id", primary_key=True)
+    slot_start: datetime = Field(primary_key=True)
+    reservation_id: int = Field(foreign_key="table_reservations.id", index=True)
@@ -63,6 +63,8 @@ class User(SQLModel, table=True):
     role: UserRole = Field(default=UserRole.STUDENT)
     is_active: bool = Field(default=True)
     is_superuser: bool = Field(default=False)
+    # Bumped on role, status or password changes to revoke issued tokens
+    token_version: int = Field(default=0)
     
     # Student-specific fields (optional)
     student_id: Optional[str] = Field(
@@ -123,3 +123,48 @@ class Order(OrderInDBBase):
     table: Optional[OrderTableInfo] = None
     user: Optional[OrderUserInfo] = None
     reservation: Optional[ReservationSummary] = None
+
+
+# Lean list views
+class OrderSummary(BaseModel):
+    """Order list row: just enough for history and admin tables."""
+    id: int
+    user_id: int
+    table_id: Optional[int] = None
+    status: OrderStatus
+    payment_status: PaymentStatus
+    total_amount: float
+    created_at: datetime
+
+    class Config:
+        from_attributes = True
+
+
+class OrderBoardProductInfo(BaseModel):
+    """Product name shown on the staff board."""
+    id: int
+    name: str
+
+    class Config:
+        from_attributes = True
+
+
+class OrderBoardItem(BaseModel):
+    """Order item as prepared by the kitchen."""
+    id: int
+    product_id: int
+    quantity: int
+    notes: Optional[str] = None
+    product: Optional[OrderBoardProductInfo] = None
+
+    class Config:
+        from_attributes = True
+
+
+class OrderBoard(OrderSummary):
+    """Order card on the staff board."""
+    delivery_type: Optional[str] = None
+    notes: Optional[str] = None
+    updated_at: Optional[datetime] = None
+    table: Optional[OrderTableInfo] = None
+    items: List[OrderBoardItem] = []
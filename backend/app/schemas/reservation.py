@@ -1,6 +1,6 @@
 """Reservation schemas."""
 from datetime import datetime, date
-from typing import Optional
+from typing import List, Optional
 
 from pydantic import BaseModel, Field
 
@@ -53,3 +53,18 @@ class ReservationSummary(BaseModel):
     end_time: datetime
     status: ReservationStatus
     is_owned: bool = False
+
+
+class TableAvailability(BaseModel):
+    """Free/busy slots of one table for a day."""
+    table_id: int
+    table_number: str
+    capacity: int
+    slots: str  # One character per slot: "0" free, "1" booked
+
+
+class AvailabilityGrid(BaseModel):
+    """Booking grid of every active table for a day."""
+    date: date
+    slot_minutes: int
+    tables: List[TableAvailability]
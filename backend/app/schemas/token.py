@@ -2,6 +2,8 @@
 from typing import Optional
 from pydantic import BaseModel
 
+from app.utils.enums import UserRole
+
 
 class Token(BaseModel):
     """Token response schema."""
@@ -14,3 +16,8 @@ class Token(BaseModel):
 class TokenPayload(BaseModel):
     """Token payload schema."""
     sub: Optional[str] = None
+    ver: int = 0
+    # User state claims, present on tokens issued for stateless auth
+    role: Optional[UserRole] = None
+    act: Optional[bool] = None
+    su: Optional[bool] = None
@@ -10,6 +10,7 @@ from app.crud.user import user as user_crud
 from app.models.user import User
 from app.schemas.user import UserCreate
 from app.schemas.token import Token
+from app.services.user_state import user_state
 
 
 class AuthService:
@@ -65,7 +66,9 @@ class AuthService:
             minutes=settings.ACCESS_TOKEN_EXPIRE_MINUTES
         )
         access_token = create_access_token(
-            subject=user.id, expires_delta=access_token_expires
+            subject=user.id,
+            expires_delta=access_token_expires,
+            claims=user_state.claims_for(user),
         )
         
         return Token(access_token=access_token, token_type="bearer")
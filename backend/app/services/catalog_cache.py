@@ -0,0 +1,125 @@
+"""Read-through cache for the public menu catalog (products and categories)."""
+import hashlib
+from typing import Any, Awaitable, Callable, Hashable, List, NamedTuple, Optional, Tuple
+
+from fastapi import Request, Response, status
+from pydantic import TypeAdapter
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.utils.pagination import NEXT_CURSOR_HEADER
+
+
+class CatalogEntry(NamedTuple):
+    """Pre-encoded JSON body, its ETag and, for list pages, the next cursor."""
+    body: bytes
+    etag: str
+    next_cursor: Optional[str] = None
+
+
+class CatalogCache:
+    """
+    Cache serialized catalog responses between menu edits.
+
+    Entries are invalidated explicitly by the product/category CRUD writes
+    and by stock changes; the TTL covers writes made by other workers.
+    """
+
+    def __init__(self) -> None:
+        self._cache = TTLCache(
+            "catalog",
+            ttl_seconds=settings.CATALOG_CACHE_TTL_SECONDS,
+            maxsize=settings.CATALOG_CACHE_MAX_ENTRIES,
+        )
+
+    def get_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Any],
+        adapter: TypeAdapter,
+    ) -> Optional[CatalogEntry]:
+        """Return the cached entry for ``key``, loading and encoding it on a miss."""
+        if not settings.CATALOG_CACHE_ENABLED:
+            return self._encode(loader(), adapter)
+        return self._cache.get_or_load(key, lambda: self._encode(loader(), adapter))
+
+    def get_or_load_page(
+        self,
+        key: Hashable,
+        loader: Callable[[], Tuple[List[Any], Optional[str]]],
+        adapter: TypeAdapter,
+    ) -> CatalogEntry:
+        """Like ``get_or_load`` for a keyset page loader returning ``(items, next_cursor)``."""
+        def load() -> CatalogEntry:
+            items, next_cursor = loader()
+            return self._encode(items, adapter, next_cursor=next_cursor)
+
+        if not settings.CATALOG_CACHE_ENABLED:
+            return load()
+        return self._cache.get_or_load(key, load)
+
+    async def aget_or_load(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Any]],
+        adapter: TypeAdapter,
+    ) -> Optional[CatalogEntry]:
+        """``get_or_load`` for a coroutine loader, e.g. one running on a DatabaseReader."""
+        async def load() -> Optional[CatalogEntry]:
+            return self._encode(await loader(), adapter)
+
+        if not settings.CATALOG_CACHE_ENABLED:
+            return await load()
+        return await self._cache.aget_or_load(key, load)
+
+    async def aget_or_load_page(
+        self,
+        key: Hashable,
+        loader: Callable[[], Awaitable[Tuple[List[Any], Optional[str]]]],
+        adapter: TypeAdapter,
+    ) -> CatalogEntry:
+        """``get_or_load_page`` for a coroutine loader."""
+        async def load() -> CatalogEntry:
+            items, next_cursor = await loader()
+            return self._encode(items, adapter, next_cursor=next_cursor)
+
+        if not settings.CATALOG_CACHE_ENABLED:
+            return await load()
+        return await self._cache.aget_or_load(key, load)
+
+    @staticmethod
+    def _encode(
+        data: Any, adapter: TypeAdapter, next_cursor: Optional[str] = None
+    ) -> Optional[CatalogEntry]:
+        if data is None:
+            return None
+        body = adapter.dump_json(adapter.validate_python(data, from_attributes=True))
+        etag = '"' + hashlib.sha1(body).hexdigest() + '"'
+        return CatalogEntry(body=body, etag=etag, next_cursor=next_cursor)
+
+    @staticmethod
+    def response(request: Request, entry: CatalogEntry) -> Response:
+        """Build a JSON response, or 304 when the client already has this version."""
+        headers = {"ETag": entry.etag, "Cache-Control": "no-cache"}
+        if entry.next_cursor:
+            headers[NEXT_CURSOR_HEADER] = entry.next_cursor
+        if_none_match = request.headers.get("if-none-match")
+        if if_none_match:
+            tags = {tag.strip().removeprefix("W/") for tag in if_none_match.split(",")}
+            if entry.etag in tags or "*" in tags:
+                return Response(status_code=status.HTTP_304_NOT_MODIFIED, headers=headers)
+        return Response(
+            content=entry.body,
+            media_type="application/json",
+            headers=headers,
+        )
+
+    def invalidate(self) -> None:
+        """Drop all cached catalog responses."""
+        self._cache.invalidate()
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+
+catalog_cache = CatalogCache()
@@ -0,0 +1,114 @@
+"""Background worker that delivers queued emails from the outbox."""
+import logging
+import threading
+from typing import Callable, Optional
+
+from sqlmodel import Session
+
+from app.core.config import settings
+from app.crud.email_outbox import email_outbox as email_outbox_crud
+from app.db.session import SessionLocal
+from app.services.email_service import EmailService, email_service
+
+logger = logging.getLogger(__name__)
+
+
+class EmailOutboxWorker:
+    """
+    Drain the email outbox on a daemon thread.
+
+    Messages are claimed in batches and sent over the email service's reused
+    SMTP connection. Failures are retried with exponential backoff until
+    EMAIL_OUTBOX_MAX_ATTEMPTS, after which the message is marked failed.
+    """
+
+    def __init__(
+        self,
+        session_factory: Callable[[], Session] = SessionLocal,
+        sender: EmailService = email_service,
+    ) -> None:
+        self._session_factory = session_factory
+        self._sender = sender
+        self._wakeup = threading.Event()
+        self._stopping = threading.Event()
+        self._thread: Optional[threading.Thread] = None
+
+    @property
+    def is_running(self) -> bool:
+        return self._thread is not None and self._thread.is_alive()
+
+    def start(self) -> None:
+        """Start the delivery thread if it is not running yet."""
+        if self.is_running:
+            return
+        self._stopping.clear()
+        self._thread = threading.Thread(
+            target=self._run, name="email-outbox-worker", daemon=True
+        )
+        self._thread.start()
+
+    def stop(self, timeout: float = 5.0) -> None:
+        """Stop the delivery thread and close the SMTP connection."""
+        self._stopping.set()
+        self._wakeup.set()
+        if self._thread is not None:
+            self._thread.join(timeout)
+            self._thread = None
+        self._sender.close()
+
+    def wake(self) -> None:
+        """Ask the worker to poll now instead of waiting for the next interval."""
+        self._wakeup.set()
+
+    def run_once(self) -> int:
+        """Deliver one batch of due messages. Returns the number processed."""
+        db = self._session_factory()
+        try:
+            messages = email_outbox_crud.claim_due(
+                db,
+                limit=settings.EMAIL_OUTBOX_BATCH_SIZE,
+                lease_seconds=settings.EMAIL_OUTBOX_LEASE_SECONDS,
+            )
+            for message in messages:
+                try:
+                    self._sender.deliver(
+                        subject=message.subject,
+                        to_email=message.to_email,
+                        html_body=message.html_body,
+                        text_body=message.text_body,
+                    )
+                except Exception as exc:  # noqa: BLE001
+                    logger.warning(
+                        "Email %s to %s failed (attempt %s): %s",
+                        message.id,
+                        message.to_email,
+                        message.attempts + 1,
+                        exc,
+                    )
+                    email_outbox_crud.mark_failed(
+                        db,
+                        message=message,
+                        error=str(exc),
+                        max_attempts=settings.EMAIL_OUTBOX_MAX_ATTEMPTS,
+                        backoff_seconds=settings.EMAIL_OUTBOX_BACKOFF_SECONDS,
+                    )
+                else:
+                    email_outbox_crud.mark_sent(db, message=message)
+                db.commit()
+            return len(messages)
+        finally:
+            db.close()
+
+    def _run(self) -> None:
+        while not self._stopping.is_set():
+            try:
+                while not self._stopping.is_set() and self.run_once():
+                    pass
+                self._sender.close_if_idle()
+            except Exception:  # noqa: BLE001
+                logger.exception("Email outbox worker iteration failed")
+            self._wakeup.wait(settings.EMAIL_OUTBOX_POLL_INTERVAL_SECONDS)
+            self._wakeup.clear()
+
+
+email_outbox_worker = EmailOutboxWorker()
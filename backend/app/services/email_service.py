@@ -1,18 +1,35 @@
 """Utility service for sending transactional emails via SMTP."""
 import logging
 import smtplib
+import threading
+import time
 from email.mime.multipart import MIMEMultipart
 from email.mime.text import MIMEText
 from email.utils import formataddr
 from typing import Optional
 
+from sqlmodel import Session
+
 from app.core.config import settings
+from app.crud.email_outbox import email_outbox as email_outbox_crud
+from app.models.email_outbox import EmailOutbox
 
 logger = logging.getLogger(__name__)
 
 
 class EmailService:
-    """Thin SMTP wrapper used for transactional emails."""
+    """
+    Thin SMTP wrapper used for transactional emails.
+
+    The SMTP connection is opened lazily and reused between messages. It is
+    re-established when the server drops it and closed after it has been idle
+    for SMTP_IDLE_TIMEOUT_SECONDS.
+    """
+
+    def __init__(self) -> None:
+        self._server: Optional[smtplib.SMTP] = None
+        self._last_used = 0.0
+        self._lock = threading.Lock()
 
     @staticmethod
     def is_configured() -> bool:
@@ -24,6 +41,99 @@ class EmailService:
             and settings.SMTP_PASSWORD
         )
 
+    @staticmethod
+    def _build_message(
+        subject: str, to_email: str, html_body: str, text_body: Optional[str]
+    ) -> MIMEMultipart:
+        message = MIMEMultipart("alternative")
+        message["Subject"] = subject
+        message["From"] = formataddr((settings.SMTP_FROM_NAME or "", settings.SMTP_FROM_EMAIL))
+        message["To"] = to_email
+
+        if text_body:
+            message.attach(MIMEText(text_body, "plain", "utf-8"))
+        message.attach(MIMEText(html_body, "html", "utf-8"))
+        return message
+
+    @staticmethod
+    def _open_connection() -> smtplib.SMTP:
+        if settings.SMTP_USE_SSL:
+            server = smtplib.SMTP_SSL(
+                settings.SMTP_HOST, settings.SMTP_PORT, timeout=settings.SMTP_TIMEOUT_SECONDS
+            )
+        else:
+            server = smtplib.SMTP(
+                settings.SMTP_HOST, settings.SMTP_PORT, timeout=settings.SMTP_TIMEOUT_SECONDS
+            )
+
+        try:
+            server.ehlo()
+            if settings.SMTP_STARTTLS and not settings.SMTP_USE_SSL:
+                server.starttls()
+                server.ehlo()
+            server.login(settings.SMTP_USERNAME, settings.SMTP_PASSWORD)
+        except Exception:
+            server.close()
+            raise
+        return server
+
+    def _drop_connection(self) -> None:
+        if self._server is None:
+            return
+        try:
+            self._server.quit()
+        except Exception:  # noqa: BLE001
+            self._server.close()
+        self._server = None
+
+    def close(self) -> None:
+        """Close the reused SMTP connection, if any."""
+        with self._lock:
+            self._drop_connection()
+
+    def close_if_idle(self) -> None:
+        """Close the reused connection once it exceeds the idle timeout."""
+        with self._lock:
+            idle = time.monotonic() - self._last_used
+            if self._server is not None and idle > settings.SMTP_IDLE_TIMEOUT_SECONDS:
+                self._drop_connection()
+
+    def deliver(
+        self,
+        *,
+        subject: str,
+        to_email: str,
+        html_body: str,
+        text_body: Optional[str] = None,
+    ) -> None:
+        """Send an email over the reused connection. Raises on failure."""
+        message = self._build_message(subject, to_email, html_body, text_body).as_string()
+
+        with self._lock:
+            if (
+                self._server is not None
+                and time.monotonic() - self._last_used > settings.SMTP_IDLE_TIMEOUT_SECONDS
+            ):
+                self._drop_connection()
+
+            for attempt in range(2):
+                if self._server is None:
+                    self._server = self._open_connection()
+                try:
+                    self._server.sendmail(settings.SMTP_FROM_EMAIL, [to_email], message)
+                    break
+                except smtplib.SMTPServerDisconnected:
+                    # Server closed the idle connection; reconnect once
+                    self._server = None
+                    if attempt:
+                        raise
+                except (smtplib.SMTPRecipientsRefused, smtplib.SMTPDataError):
+                    raise
+                except Exception:
+                    self._drop_connection()
+                    raise
+            self._last_used = time.monotonic()
+
     def send_email(
         self,
         *,
@@ -37,34 +147,46 @@ class EmailService:
             logger.warning("SMTP settings are not configured; skipping email send.")
             return False
 
-        message = MIMEMultipart("alternative")
-        message["Subject"] = subject
-        message["From"] = formataddr((settings.SMTP_FROM_NAME or "", settings.SMTP_FROM_EMAIL))
-        message["To"] = to_email
-
-        if text_body:
-            message.attach(MIMEText(text_body, "plain", "utf-8"))
-        message.attach(MIMEText(html_body, "html", "utf-8"))
-
         try:
-            if settings.SMTP_USE_SSL:
-                server = smtplib.SMTP_SSL(settings.SMTP_HOST, settings.SMTP_PORT)
-            else:
-                server = smtplib.SMTP(settings.SMTP_HOST, settings.SMTP_PORT)
-
-            with server:
-                server.ehlo()
-                if settings.SMTP_STARTTLS and not settings.SMTP_USE_SSL:
-                    server.starttls()
-                    server.ehlo()
-
-                server.login(settings.SMTP_USERNAME, settings.SMTP_PASSWORD)
-                server.sendmail(settings.SMTP_FROM_EMAIL, [to_email], message.as_string())
-
+            self.deliver(
+                subject=subject,
+                to_email=to_email,
+                html_body=html_body,
+                text_body=text_body,
+            )
             return True
         except Exception:  # noqa: BLE001
             logger.exception("Failed to send email to %s", to_email)
             return False
 
+    def queue_email(
+        self,
+        db: Session,
+        *,
+        subject: str,
+        to_email: str,
+        html_body: str,
+        text_body: Optional[str] = None,
+        commit: bool = True,
+    ) -> Optional[EmailOutbox]:
+        """
+        Store an email in the outbox for background delivery.
+
+        With ``commit=False`` the message joins the caller's transaction, so it
+        is only delivered if that transaction commits.
+        """
+        if not self.is_configured():
+            logger.warning("SMTP settings are not configured; skipping email send.")
+            return None
+
+        return email_outbox_crud.enqueue(
+            db,
+            to_email=to_email,
+            subject=subject,
+            html_body=html_body,
+            text_body=text_body,
+            commit=commit,
+        )
+
 
 email_service = EmailService()
@@ -0,0 +1,245 @@
+"""Precompiled templates for order status notification emails.
+
+Status-specific copy (badge, headline, intro, note, gradient) is baked into
+one template per status when this module is imported, so rendering an email
+only substitutes the per-order values.
+"""
+from string import Formatter
+from typing import Any, Dict, Iterable, List, Mapping, NamedTuple, Optional, Tuple
+
+from app.utils.enums import OrderStatus
+
+
+ORDER_STATUS_EMAIL_CONFIGS: Dict[OrderStatus, Dict[str, str]] = {
+    OrderStatus.PENDING: {
+        "badge": "CHỜ XÁC NHẬN",
+        "headline": "Đơn hàng #{order_id} đã được ghi nhận",
+        "intro": "Chúng tôi đã tiếp nhận yêu cầu và sẽ xác nhận sớm nhất.",
+        "note": "Bạn sẽ nhận thêm email khi đơn được xác nhận hoặc có cập nhật mới.",
+        "gradient": "linear-gradient(135deg,#312e81,#9333ea)",
+    },
+    OrderStatus.CONFIRMED: {
+        "badge": "ĐÃ XÁC NHẬN",
+        "headline": "Đơn hàng #{order_id} đã được xác nhận",
+        "intro": "Chúng tôi đã nhận đơn và đang chuẩn bị nguyên liệu.",
+        "note": "Bạn có thể tiếp tục theo dõi trạng thái tại trang Đơn hàng.",
+        "gradient": "linear-gradient(135deg,#1f1147,#5c164e)",
+    },
+    OrderStatus.PREPARING: {
+        "badge": "ĐANG CHUẨN BỊ",
+        "headline": "Chúng tôi đang chế biến đơn #{order_id}",
+        "intro": "Đội bếp đang thao tác, món ăn sẽ sẵn sàng trong ít phút nữa.",
+        "note": "Hãy giữ điện thoại bên mình, chúng tôi sẽ báo ngay khi món hoàn tất.",
+        "gradient": "linear-gradient(135deg,#3a0b52,#a83279)",
+    },
+    OrderStatus.READY: {
+        "badge": "SẴN SÀNG",
+        "headline": "Món ăn của bạn đã sẵn sàng!",
+        "intro": "Bàn và đơn #{order_id} đã sẵn sàng để phục vụ.",
+        "note": "Bạn có thể đến nhận tại quầy hoặc ra bàn theo thông tin bên dưới.",
+        "gradient": "linear-gradient(135deg,#0f766e,#22d3ee)",
+    },
+    OrderStatus.COMPLETED: {
+        "badge": "HOÀN THÀNH",
+        "headline": "Cảm ơn bạn đã dùng bữa!",
+        "intro": "Đơn hàng đã hoàn tất. Hy vọng bạn hài lòng với trải nghiệm hôm nay.",
+        "note": "Nếu có góp ý, hãy trả lời email này để chúng tôi phục vụ tốt hơn.",
+        "gradient": "linear-gradient(135deg,#1d4ed8,#7c3aed)",
+    },
+    OrderStatus.CANCELLED: {
+        "badge": "ĐÃ HỦY",
+        "headline": "Đơn hàng #{order_id} đã bị hủy",
+        "intro": "Đơn hàng đã được hủy theo yêu cầu hoặc do hệ thống.",
+        "note": "Nếu đây là nhầm lẫn, hãy liên hệ hotline để được hỗ trợ đặt lại.",
+        "gradient": "linear-gradient(135deg,#7f1d1d,#dc2626)",
+    },
+}
+
+_TEXT_LAYOUT = (
+    "Xin chào {user_name},\n\n"
+    "{headline}\n"
+    "- Trạng thái: {badge}\n"
+    "- Thời gian: {reservation_slot_text}\n"
+    "- Ngày: {reservation_date_text}\n"
+    "- Bàn: {table_text}\n"
+    "- Số món: {total_items}\n"
+    "- Tổng tiền: {formatted_total}\n\n"
+    "{intro}\n"
+    "{note}\n\n"
+    "Trân trọng,\nSchool Food Order"
+)
+
+_HTML_LAYOUT = """
+            <div style="font-family:'Segoe UI',Roboto,Helvetica,Arial,sans-serif;background:#f4f6fb;padding:0;margin:0;">
+                <table role="presentation" width="100%" cellspacing="0" cellpadding="0" style="background:#f4f6fb;padding:32px 0;">
+                    <tr>
+                        <td align="center">
+                            <table role="presentation" width="600" cellpadding="0" cellspacing="0" style="background:white;border-radius:24px;overflow:hidden;box-shadow:0 20px 60px rgba(15,23,42,0.18);">
+                                <tr>
+                                    <td style="background:{gradient};padding:32px 40px;color:white;">
+                                        <div style="opacity:0.8;font-size:13px;text-transform:uppercase;letter-spacing:0.1em;">{badge}</div>
+                                        <h1 style="margin:8px 0 0;font-size:26px;">{headline}</h1>
+                                        <p style="margin:8px 0 0;color:rgba(255,255,255,0.85);">
+                                            Xin chào {user_name}, {intro}
+                                        </p>
+                                    </td>
+                                </tr>
+                                <tr>
+                                    <td style="padding:32px 40px;">
+                                        <table role="presentation" width="100%" cellpadding="0" cellspacing="0" style="border-collapse:collapse;">
+                                            <tr>
+                                                <td style="width:50%;padding:12px 16px;background:#f8f9ff;border-radius:16px;">
+                                                    <div style="font-size:12px;text-transform:uppercase;color:#6366f1;letter-spacing:0.08em;">Thời gian đặt bàn</div>
+                                                    <div style="font-size:16px;font-weight:600;color:#111827;margin-top:6px;">{reservation_slot_text}</div>
+                                                    <div style="color:#6b7280;margin-top:2px;">{reservation_date_text}</div>
+                                                </td>
+                                                <td style="width:50%;padding:12px 16px;">
+                                                    <div style="font-size:12px;text-transform:uppercase;color:#6366f1;letter-spacing:0.08em;">Vị trí</div>
+                                                    <div style="font-size:16px;font-weight:600;color:#111827;margin-top:6px;">{table_text}</div>
+                                                </td>
+                                            </tr>
+                                            <tr>
+                                                <td style="width:50%;padding:12px 16px;">
+                                                    <div style="font-size:12px;text-transform:uppercase;color:#6366f1;letter-spacing:0.08em;">Số lượng món</div>
+                                                    <div style="font-size:20px;font-weight:700;color:#111827;margin-top:6px;">{total_items}</div>
+                                                </td>
+                                                <td style="width:50%;padding:12px 16px;">
+                                                    <div style="font-size:12px;text-transform:uppercase;color:#6366f1;letter-spacing:0.08em;">Tổng cộng</div>
+                                                    <div style="font-size:20px;font-weight:700;color:#e879f9;margin-top:6px;">{formatted_total}</div>
+                                                </td>
+                                            </tr>
+                                        </table>
+                                        <div style="margin:28px 0 12px;font-size:14px;text-transform:uppercase;letter-spacing:0.1em;color:#9ca3af;">Chi tiết món</div>
+                                        <table role="presentation" width="100%" cellpadding="0" cellspacing="0" style="border-collapse:collapse;">
+                                            <thead>
+                                                <tr style="color:#9ca3af;font-size:12px;text-transform:uppercase;letter-spacing:0.08em;">
+                                                    <th align="left" style="font-weight:600;padding-bottom:8px;">Món</th>
+                                                    <th align="center" style="font-weight:600;padding-bottom:8px;">Số lượng</th>
+                                                    <th align="right" style="font-weight:600;padding-bottom:8px;">Thành tiền</th>
+                                                </tr>
+                                            </thead>
+                                            <tbody>
+                                                {items_html}
+                                            </tbody>
+                                        </table>
+                                        <div style="margin-top:24px;font-size:14px;color:#6b7280;">
+                                            {note}
+                                        </div>
+                                        <div style="margin-top:32px;font-size:13px;color:#9ca3af;text-align:center;">
+                                            Trân trọng,<br/>Đội ngũ School Food Order
+                                        </div>
+                                    </td>
+                                </tr>
+                            </table>
+                        </td>
+                    </tr>
+                </table>
+            </div>
+        """
+
+
+class CompiledTemplate:
+    """
+    A ``str.format``-style template parsed once into literal chunks.
+
+    Rendering joins the literals with the substituted values, so the template
+    text is never re-scanned.
+    """
+
+    __slots__ = ("source", "_head", "_tail")
+
+    def __init__(self, source: str) -> None:
+        self.source = source
+        self._head = ""
+        self._tail: List[Tuple[str, str, str]] = []
+        for literal, field, spec, _ in Formatter().parse(source):
+            if not self._tail:
+                self._head += literal
+            else:
+                name, prev_spec, prev_literal = self._tail[-1]
+                self._tail[-1] = (name, prev_spec, prev_literal + literal)
+            if field is not None:
+                self._tail.append((field, spec or "", ""))
+
+    def render(self, values: Mapping[str, Any]) -> str:
+        parts = [self._head]
+        for field, spec, literal in self._tail:
+            parts.append(format(values[field], spec))
+            parts.append(literal)
+        return "".join(parts)
+
+
+class StatusEmailTemplate(NamedTuple):
+    """Compiled subject, plain-text and HTML templates for one status."""
+    subject: CompiledTemplate
+    text: CompiledTemplate
+    html: CompiledTemplate
+
+
+class _KeepPlaceholders(dict):
+    """Leave unknown ``{field}`` placeholders untouched during compilation."""
+
+    def __missing__(self, key: str) -> str:
+        return "{" + key + "}"
+
+
+def _compile(config: Dict[str, str]) -> StatusEmailTemplate:
+    values = _KeepPlaceholders(config)
+    return StatusEmailTemplate(
+        subject=CompiledTemplate(config["headline"]),
+        text=CompiledTemplate(_TEXT_LAYOUT.format_map(values)),
+        html=CompiledTemplate(_HTML_LAYOUT.format_map(values)),
+    )
+
+
+ORDER_STATUS_TEMPLATES: Dict[OrderStatus, StatusEmailTemplate] = {
+    status: _compile(config) for status, config in ORDER_STATUS_EMAIL_CONFIGS.items()
+}
+
+
+def render_items_html(items: Iterable[Any]) -> str:
+    """Render the item rows for order items (``product``, ``quantity``, ``subtotal``)."""
+    return "".join([
+        f"""
+            <tr>
+                <td style="padding:8px 0;color:#1f1f1f;">{item.product.name if item.product else 'Món ăn'}</td>
+                <td style="padding:8px 0;color:#1f1f1f;text-align:center;">x{item.quantity}</td>
+                <td style="padding:8px 0;color:#1f1f1f;text-align:right;">{item.subtotal:,.0f} đ</td>
+            </tr>
+            """
+        for item in items
+    ])
+
+
+def render_order_status_email(
+    status: OrderStatus,
+    *,
+    order_id: int,
+    user_name: str,
+    reservation_slot_text: str,
+    reservation_date_text: str,
+    table_text: str,
+    total_items: int,
+    formatted_total: str,
+    items_html: str,
+) -> Optional[Dict[str, str]]:
+    """Render subject, text and HTML bodies for an order status email."""
+    template = ORDER_STATUS_TEMPLATES.get(status)
+    if not template:
+        return None
+
+    values = {
+        "order_id": order_id,
+        "user_name": user_name,
+        "reservation_slot_text": reservation_slot_text,
+        "reservation_date_text": reservation_date_text,
+        "table_text": table_text,
+        "total_items": total_items,
+        "formatted_total": formatted_total,
+        "items_html": items_html,
+    }
+    return {
+        "subject": template.subject.render(values),
+        "text": template.text.render(values),
+        "html": template.html.render(values),
+    }
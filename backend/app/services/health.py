@@ -0,0 +1,162 @@
+"""Readiness checks of the app's dependencies."""
+import asyncio
+import logging
+import time
+from datetime import datetime
+from typing import Any, Dict, Optional
+
+from sqlalchemy import create_engine, text
+from sqlmodel import Session
+from starlette.concurrency import run_in_threadpool
+
+from app.core.config import settings
+from app.crud.email_outbox import email_outbox as email_outbox_crud
+from app.db.session import async_engine_metrics, engine_metrics
+from app.services.email_outbox_worker import email_outbox_worker
+from app.services.email_service import EmailService
+
+logger = logging.getLogger(__name__)
+
+PASS, WARN, FAIL = "pass", "warn", "fail"
+
+
+class ReadinessProbe:
+    """
+    Checks whether this worker can serve requests.
+
+    - database: ``SELECT 1`` within READINESS_DB_TIMEOUT_SECONDS, on a
+      one-connection engine of its own, so an exhausted app pool is
+      reported as such instead of making the probe hang
+    - pool: fails when READINESS_POOL_SATURATION of pool plus overflow
+      is checked out
+    - email outbox: warns when the backlog or its oldest message exceeds
+      the limits or the delivery worker is down
+
+    A failing database or pool makes the worker unready; outbox warnings
+    only mark it degraded, since requests are still served. Results are
+    cached for READINESS_CACHE_SECONDS and concurrent probes share one
+    check, so frequent probing does not add database load.
+    """
+
+    def __init__(self) -> None:
+        self._engine = None
+        self._result: Optional[Dict[str, Any]] = None
+        self._checked_at = 0.0
+        self._lock = asyncio.Lock()
+
+    def _probe_engine(self):
+        if self._engine is None:
+            self._engine = create_engine(
+                settings.DATABASE_URL,
+                pool_size=1,
+                max_overflow=0,
+                pool_timeout=settings.READINESS_DB_TIMEOUT_SECONDS,
+                pool_pre_ping=True,
+                pool_recycle=settings.DATABASE_POOL_RECYCLE,
+            )
+        return self._engine
+
+    async def check(self) -> Dict[str, Any]:
+        """The cached readiness report, refreshed when older than READINESS_CACHE_SECONDS."""
+        if self._result is not None and time.monotonic() - self._checked_at < settings.READINESS_CACHE_SECONDS:
+            return self._result
+        async with self._lock:
+            if self._result is None or time.monotonic() - self._checked_at >= settings.READINESS_CACHE_SECONDS:
+                self._result = await self._run_checks()
+                self._checked_at = time.monotonic()
+        return self._result
+
+    async def _run_checks(self) -> Dict[str, Any]:
+        checks: Dict[str, Dict[str, Any]] = {}
+        backlog = None
+        started = time.perf_counter()
+        try:
+            # A timed-out query keeps its threadpool thread until the driver gives up;
+            # the probe engine's single connection bounds how many can pile up
+            ping_ms, backlog = await asyncio.wait_for(
+                run_in_threadpool(self._query_database),
+                timeout=settings.READINESS_DB_TIMEOUT_SECONDS,
+            )
+            checks["database"] = {"status": PASS, "latency_ms": ping_ms}
+        except asyncio.TimeoutError:
+            checks["database"] = self._result_of(
+                FAIL, started, error=f"No response within {settings.READINESS_DB_TIMEOUT_SECONDS}s"
+            )
+        except Exception as exc:  # noqa: BLE001
+            logger.warning("Readiness database check failed: %s", exc)
+            checks["database"] = self._result_of(FAIL, started, error=type(exc).__name__)
+
+        checks["pool"] = self._check_pools()
+        checks["email_outbox"] = self._check_outbox(backlog)
+
+        if any(check["status"] == FAIL for name, check in checks.items() if name != "email_outbox"):
+            status = "unready"
+        elif any(check["status"] != PASS for check in checks.values()):
+            status = "degraded"
+        else:
+            status = "ready"
+        return {"status": status, "checked_at": datetime.utcnow().isoformat() + "Z", "checks": checks}
+
+    @staticmethod
+    def _result_of(status: str, started: float, **details: Any) -> Dict[str, Any]:
+        return {"status": status, "latency_ms": round((time.perf_counter() - started) * 1000, 2), **details}
+
+    def _query_database(self):
+        """Runs in the threadpool: ping the database, then read the outbox backlog."""
+        started = time.perf_counter()
+        with self._probe_engine().connect() as connection:
+            connection.execute(text("SELECT 1"))
+            ping_ms = round((time.perf_counter() - started) * 1000, 2)
+            started = time.perf_counter()
+            with Session(bind=connection) as db:
+                count, oldest = email_outbox_crud.pending_backlog(db)
+        return ping_ms, (count, oldest, round((time.perf_counter() - started) * 1000, 2))
+
+    def dispose(self) -> None:
+        if self._engine is not None:
+            self._engine.dispose()
+
+    @staticmethod
+    def _check_pools() -> Dict[str, Any]:
+        started = time.perf_counter()
+        saturation = {
+            metrics.name: metrics.saturation()
+            for metrics in (engine_metrics, async_engine_metrics)
+            if metrics is not None and metrics.saturation() is not None
+        }
+        saturated = [name for name, value in saturation.items() if value >= settings.READINESS_POOL_SATURATION]
+        result = ReadinessProbe._result_of(
+            FAIL if saturated else PASS,
+            started,
+            saturation={name: round(value, 3) for name, value in saturation.items()},
+        )
+        if saturated:
+            result["error"] = f"Pool nearly exhausted: {', '.join(saturated)}"
+        return result
+
+    @staticmethod
+    def _check_outbox(backlog) -> Dict[str, Any]:
+        if backlog is None:
+            return {"status": WARN, "latency_ms": None, "error": "Database unavailable"}
+        pending, oldest, latency_ms = backlog
+        oldest_age = (datetime.utcnow() - oldest).total_seconds() if oldest else 0.0
+        problems = []
+        if pending > settings.READINESS_OUTBOX_MAX_PENDING:
+            problems.append(f"{pending} emails pending")
+        if oldest_age > settings.READINESS_OUTBOX_MAX_AGE_SECONDS:
+            problems.append(f"oldest pending email queued {oldest_age:.0f}s ago")
+        if settings.EMAIL_OUTBOX_ENABLED and not email_outbox_worker.is_running:
+            problems.append("delivery worker not running")
+        result = {
+            "status": WARN if problems else PASS,
+            "latency_ms": latency_ms,
+            "pending": pending,
+            "oldest_pending_age_seconds": round(oldest_age, 1),
+            "smtp_configured": EmailService.is_configured(),
+        }
+        if problems:
+            result["error"] = "; ".join(problems)
+        return result
+
+
+readiness_probe = ReadinessProbe()
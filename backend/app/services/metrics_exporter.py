@@ -0,0 +1,136 @@
+"""Prometheus exposition of the in-process metrics of this worker."""
+import logging
+from typing import Optional
+
+from sqlalchemy.exc import SQLAlchemyError
+
+from app.core.cache import TTLCache
+from app.core.metrics import PrometheusText, request_metrics
+from app.core.security import password_hasher
+from app.crud.email_outbox import email_outbox as email_outbox_crud
+from app.db.session import SessionLocal, async_engine_metrics, engine_metrics
+from app.services.rate_limiter import rate_limiter
+
+logger = logging.getLogger(__name__)
+
+
+def _write_requests(out: PrometheusText) -> None:
+    routes = request_metrics.snapshot()
+    out.declare("http_requests_in_progress", "gauge", "Requests being handled by this worker.")
+    out.sample("http_requests_in_progress", request_metrics.in_progress)
+    out.declare("http_requests_total", "counter", "Requests handled, by route template and status.")
+    for method, route, statuses, _, _ in routes:
+        for status_code, count in sorted(statuses.items()):
+            out.sample("http_requests_total", count, {"method": method, "route": route, "status": status_code})
+    out.declare(
+        "http_request_duration_seconds", "histogram", "Time from request to response start, by route template."
+    )
+    for method, route, _, buckets, total in routes:
+        out.histogram(
+            "http_request_duration_seconds",
+            request_metrics.bounds,
+            buckets,
+            total,
+            {"method": method, "route": route},
+        )
+
+
+def _write_pools(out: PrometheusText) -> None:
+    pools = [metrics.stats() for metrics in (engine_metrics, async_engine_metrics) if metrics is not None]
+    gauges = (
+        ("db_pool_size", "pool_size", "Connections the pool keeps open."),
+        ("db_pool_checked_out", "checked_out", "Connections in use."),
+        ("db_pool_checked_in", "checked_in", "Idle connections in the pool."),
+        ("db_pool_overflow", "overflow", "Connections open beyond the pool size."),
+        ("db_pool_peak_checked_out", "peak_checked_out", "Most connections in use at once."),
+    )
+    for name, key, help_text in gauges:
+        out.declare(name, "gauge", help_text)
+        for stats in pools:
+            if key in stats:
+                out.sample(name, stats[key], {"engine": stats["name"]})
+    counters = (
+        ("db_pool_checkouts_total", "checkouts", "Connections handed out."),
+        ("db_pool_checkout_timeouts_total", "checkout_timeouts", "Checkouts that timed out waiting."),
+        ("db_pool_connections_opened_total", "connections_opened", "DBAPI connections opened."),
+        ("db_pool_connections_closed_total", "connections_closed", "DBAPI connections closed."),
+        ("db_pool_invalidations_total", "invalidations", "Connections invalidated."),
+    )
+    for name, key, help_text in counters:
+        out.declare(name, "counter", help_text)
+        for stats in pools:
+            out.sample(name, stats[key], {"engine": stats["name"]})
+    out.declare("db_pool_checkout_wait_seconds", "histogram", "Time to get a connection from the pool.")
+    for stats in pools:
+        out.histogram_snapshot(
+            "db_pool_checkout_wait_seconds", stats["checkout_wait_ms"], scale=0.001, labels={"engine": stats["name"]}
+        )
+    out.declare("db_pool_connection_lifetime_seconds", "histogram", "Age of DBAPI connections when closed.")
+    for stats in pools:
+        out.histogram_snapshot(
+            "db_pool_connection_lifetime_seconds", stats["connection_lifetime_seconds"], labels={"engine": stats["name"]}
+        )
+
+
+def _write_caches(out: PrometheusText) -> None:
+    caches = [cache.stats() for cache in TTLCache.instances()]
+    families = (
+        ("cache_hits_total", "counter", "hits", "Cache lookups that found a live entry."),
+        ("cache_misses_total", "counter", "misses", "Cache lookups that did not."),
+        ("cache_evictions_total", "counter", "evictions", "Entries dropped to stay within maxsize."),
+        ("cache_invalidations_total", "counter", "invalidations", "Full invalidations."),
+        ("cache_entries", "gauge", "size", "Entries held."),
+        ("cache_hit_ratio", "gauge", "hit_ratio", "Hits over lookups since start."),
+    )
+    for name, kind, key, help_text in families:
+        out.declare(name, kind, help_text)
+        for stats in caches:
+            out.sample(name, stats[key], {"cache": stats["name"]})
+
+
+def _write_auth(out: PrometheusText) -> None:
+    hasher = password_hasher.stats()
+    out.declare("password_hash_queued", "gauge", "Password checks waiting for a hasher thread.")
+    out.sample("password_hash_queued", hasher["queued"])
+    out.declare("password_hash_running", "gauge", "Password checks running.")
+    out.sample("password_hash_running", hasher["running"])
+    out.declare("password_hash_rejected_total", "counter", "Password checks rejected with a full queue.")
+    out.sample("password_hash_rejected_total", hasher["rejected"])
+    limits = rate_limiter.stats()["scopes"]
+    out.declare("rate_limit_allowed_total", "counter", "Sign-in attempts within the rate limits.")
+    for scope, counts in limits.items():
+        out.sample("rate_limit_allowed_total", counts["allowed"], {"scope": scope})
+    out.declare("rate_limit_limited_total", "counter", "Sign-in attempts rejected by the rate limits.")
+    for scope, counts in limits.items():
+        out.sample("rate_limit_limited_total", counts["limited"], {"scope": scope})
+
+
+def count_pending_emails() -> Optional[int]:
+    """Outbox depth, or None if the database cannot be reached (the scrape still succeeds)."""
+    db = SessionLocal()
+    try:
+        return email_outbox_crud.count_pending(db)
+    except SQLAlchemyError as exc:
+        logger.warning("Could not count pending emails for /metrics: %s", exc)
+        return None
+    finally:
+        db.close()
+
+
+def render_metrics(pending_emails: Optional[int] = None) -> str:
+    """
+    All metrics of this worker in the Prometheus text format.
+
+    ``pending_emails`` is the outbox depth, counted by the caller since it
+    takes a query; it is omitted when None. Reads ``request_metrics``, so
+    call this on the event loop thread.
+    """
+    out = PrometheusText()
+    _write_requests(out)
+    _write_pools(out)
+    _write_caches(out)
+    _write_auth(out)
+    if pending_emails is not None:
+        out.declare("email_outbox_pending", "gauge", "Emails waiting in the outbox for delivery.")
+        out.sample("email_outbox_pending", pending_emails)
+    return out.render()
@@ -0,0 +1,187 @@
+"""In-process pub/sub hub that pushes order events to live order boards."""
+import asyncio
+import json
+import threading
+import time
+from collections import deque
+from datetime import datetime
+from typing import Any, AsyncIterator, Deque, List, NamedTuple, Optional, Set, Tuple
+
+from app.core.config import settings
+from app.models.order import Order
+from app.utils.enums import OrderStatus
+
+
+def _json_default(value: Any) -> str:
+    if isinstance(value, datetime):
+        return value.isoformat()
+    return str(value)
+
+
+class OrderEvent(NamedTuple):
+    """A published event; ``data`` is the JSON payload, encoded once."""
+    id: int
+    type: str
+    data: str
+
+    def to_sse(self) -> str:
+        return f"id: {self.id}\nevent: {self.type}\ndata: {self.data}\n\n"
+
+
+class _Subscriber:
+    """One connected board: a bounded queue fed from any thread."""
+
+    def __init__(self, loop: asyncio.AbstractEventLoop, maxsize: int) -> None:
+        self.loop = loop
+        self.queue: "asyncio.Queue[Optional[OrderEvent]]" = asyncio.Queue(maxsize=maxsize)
+        self.closed = False
+
+    def offer(self, event: OrderEvent) -> bool:
+        """Queue ``event`` on the subscriber's loop; returns False if it fell behind."""
+        if self.closed:
+            return False
+        try:
+            self.queue.put_nowait(event)
+            return True
+        except asyncio.QueueFull:
+            # Too slow: end the stream, the client reconnects with its cursor
+            self.closed = True
+            while not self.queue.empty():
+                self.queue.get_nowait()
+            self.queue.put_nowait(None)
+            return False
+
+
+class OrderEventHub:
+    """
+    Fan out order events to Server-Sent Events subscribers.
+
+    Events get increasing IDs (seeded from the clock, so IDs keep growing
+    across restarts) and the last ORDER_EVENTS_BUFFER_SIZE are kept for
+    replay. A client that reconnects with ``Last-Event-ID`` receives what it
+    missed, or a ``reset`` event telling it to reload the board if the
+    cursor is no longer buffered. Each subscriber has a bounded queue; a
+    subscriber that falls ORDER_EVENTS_QUEUE_SIZE events behind is
+    disconnected instead of slowing publishers down.
+
+    The hub is per worker process: boards only see events from orders
+    changed by the process they are connected to.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self._buffer: Deque[OrderEvent] = deque(maxlen=settings.ORDER_EVENTS_BUFFER_SIZE)
+        self._subscribers: Set[_Subscriber] = set()
+        self._next_id = int(time.time() * 1000)
+        self.published = 0
+        self.dropped_subscribers = 0
+
+    def publish(self, event_type: str, payload: dict) -> OrderEvent:
+        """Record an event and push it to every subscriber. Safe from any thread."""
+        data = json.dumps(payload, default=_json_default, separators=(",", ":"))
+        with self._lock:
+            self._next_id += 1
+            event = OrderEvent(id=self._next_id, type=event_type, data=data)
+            self._buffer.append(event)
+            self.published += 1
+            subscribers = list(self._subscribers)
+        for subscriber in subscribers:
+            try:
+                subscriber.loop.call_soon_threadsafe(self._deliver, subscriber, event)
+            except RuntimeError:  # Event loop already closed
+                self._remove(subscriber)
+        return event
+
+    def publish_order(
+        self, event_type: str, order: Order, previous_status: Optional[OrderStatus] = None
+    ) -> OrderEvent:
+        """Publish the board-relevant fields of ``order``."""
+        payload = {
+            "id": order.id,
+            "status": order.status,
+            "previous_status": previous_status,
+            "table_id": order.table_id,
+            "user_id": order.user_id,
+            "total_amount": order.total_amount,
+            "payment_status": order.payment_status,
+            "delivery_type": order.delivery_type,
+            "created_at": order.created_at,
+            "updated_at": order.updated_at,
+        }
+        return self.publish(event_type, payload)
+
+    def _deliver(self, subscriber: _Subscriber, event: OrderEvent) -> None:
+        if not subscriber.offer(event) and subscriber.closed:
+            self._remove(subscriber)
+
+    def _remove(self, subscriber: _Subscriber) -> None:
+        with self._lock:
+            if subscriber in self._subscribers:
+                self._subscribers.discard(subscriber)
+                if subscriber.closed:
+                    self.dropped_subscribers += 1
+
+    def replay(self, cursor: Optional[int]) -> Tuple[List[OrderEvent], bool, int]:
+        """
+        Buffered events after ``cursor``, whether events were lost before
+        them, and the ID live events must follow.
+
+        A cursor beyond the last issued ID came from another worker or an
+        earlier process; it counts as lost and live events resume from this
+        hub's current ID.
+        """
+        with self._lock:
+            events = list(self._buffer)
+            latest = self._next_id
+        if cursor is None:
+            return [], False, 0
+        if cursor > latest:
+            return [], True, latest
+        if not events:
+            return [], cursor < latest, cursor
+        if cursor < events[0].id - 1:
+            return [], True, cursor
+        return [event for event in events if event.id > cursor], False, cursor
+
+    async def stream(self, cursor: Optional[int] = None) -> AsyncIterator[str]:
+        """Yield SSE frames: missed events after ``cursor``, then live events."""
+        subscriber = _Subscriber(asyncio.get_running_loop(), settings.ORDER_EVENTS_QUEUE_SIZE)
+        with self._lock:
+            self._subscribers.add(subscriber)
+        try:
+            yield f"retry: {settings.ORDER_EVENTS_RETRY_MILLISECONDS}\n\n"
+            events, lost, last_id = self.replay(cursor)
+            if lost:
+                yield "event: reset\ndata: {}\n\n"
+            for event in events:
+                last_id = event.id
+                yield event.to_sse()
+
+            while True:
+                try:
+                    event = await asyncio.wait_for(
+                        subscriber.queue.get(), settings.ORDER_EVENTS_KEEPALIVE_SECONDS
+                    )
+                except asyncio.TimeoutError:
+                    yield ": keepalive\n\n"
+                    continue
+                if event is None:
+                    break
+                if event.id <= last_id:  # Already sent during replay
+                    continue
+                last_id = event.id
+                yield event.to_sse()
+        finally:
+            self._remove(subscriber)
+
+    def stats(self) -> dict:
+        with self._lock:
+            return {
+                "subscribers": len(self._subscribers),
+                "buffered": len(self._buffer),
+                "published": self.published,
+                "dropped_subscribers": self.dropped_subscribers,
+            }
+
+
+order_event_hub = OrderEventHub()
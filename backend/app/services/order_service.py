@@ -7,11 +7,20 @@ from fastapi import HTTPException, status
 from app.crud.order import order as order_crud
 from app.crud.cart import cart as cart_crud
 from app.crud.table import table as table_crud
-from app.crud.reservation import reservation as reservation_crud
+from app.crud.reservation import ReservationConflict, reservation as reservation_crud
 from app.crud.product import product as product_crud
+from app.crud.daily_revenue import daily_revenue as daily_revenue_crud
 from app.models.order import Order
 from app.schemas.order import OrderCreate
+from app.services.catalog_cache import catalog_cache
 from app.services.email_service import email_service
+from app.services.email_outbox_worker import email_outbox_worker
+from app.services.order_events import order_event_hub
+from app.services.email_templates import (
+    ORDER_STATUS_TEMPLATES,
+    render_items_html,
+    render_order_status_email,
+)
 from app.utils.enums import OrderStatus, PaymentStatus, TableStatus, ReservationStatus, PaymentMethod
 
 
@@ -23,6 +32,8 @@ class OrderService:
         """Build email content for each order status."""
         if not order or not order.user or not order.user.email:
             return None
+        if status not in ORDER_STATUS_TEMPLATES:
+            return None
 
         user_name = order.user.full_name or order.user.email
 
@@ -49,161 +60,40 @@ class OrderService:
         order_total = order.total_amount or 0
         formatted_total = f"{order_total:,.0f} đ".replace(",", ".")
 
-        items_html = "".join(
-            f"""
-            <tr>
-                <td style="padding:8px 0;color:#1f1f1f;">{item.product.name if item.product else 'Món ăn'}</td>
-                <td style="padding:8px 0;color:#1f1f1f;text-align:center;">x{item.quantity}</td>
-                <td style="padding:8px 0;color:#1f1f1f;text-align:right;">{item.subtotal:,.0f} đ</td>
-            </tr>
-            """
-            for item in order.items
-        )
-
-        status_configs: Dict[OrderStatus, Dict[str, str]] = {
-            OrderStatus.PENDING: {
-                "badge": "CHỜ XÁC NHẬN",
-                "headline": f"Đơn hàng #{order.id} đã được ghi nhận",
-                "intro": "Chúng tôi đã tiếp nhận yêu cầu và sẽ xác nhận sớm nhất.",
-                "note": "Bạn sẽ nhận thêm email khi đơn được xác nhận hoặc có cập nhật mới.",
-                "gradient": "linear-gradient(135deg,#312e81,#9333ea)",
-            },
-            OrderStatus.CONFIRMED: {
-                "badge": "ĐÃ XÁC NHẬN",
-                "headline": f"Đơn hàng #{order.id} đã được xác nhận",
-                "intro": "Chúng tôi đã nhận đơn và đang chuẩn bị nguyên liệu.",
-                "note": "Bạn có thể tiếp tục theo dõi trạng thái tại trang Đơn hàng.",
-                "gradient": "linear-gradient(135deg,#1f1147,#5c164e)",
-            },
-            OrderStatus.PREPARING: {
-                "badge": "ĐANG CHUẨN BỊ",
-                "headline": f"Chúng tôi đang chế biến đơn #{order.id}",
-                "intro": "Đội bếp đang thao tác, món ăn sẽ sẵn sàng trong ít phút nữa.",
-                "note": "Hãy giữ điện thoại bên mình, chúng tôi sẽ báo ngay khi món hoàn tất.",
-                "gradient": "linear-gradient(135deg,#3a0b52,#a83279)",
-            },
-            OrderStatus.READY: {
-                "badge": "SẴN SÀNG",
-                "headline": f"Món ăn của bạn đã sẵn sàng!",
-                "intro": "Bàn và đơn #{order.id} đã sẵn sàng để phục vụ.",
-                "note": "Bạn có thể đến nhận tại quầy hoặc ra bàn theo thông tin bên dưới.",
-                "gradient": "linear-gradient(135deg,#0f766e,#22d3ee)",
-            },
-            OrderStatus.COMPLETED: {
-                "badge": "HOÀN THÀNH",
-                "headline": "Cảm ơn bạn đã dùng bữa!",
-                "intro": "Đơn hàng đã hoàn tất. Hy vọng bạn hài lòng với trải nghiệm hôm nay.",
-                "note": "Nếu có góp ý, hãy trả lời email này để chúng tôi phục vụ tốt hơn.",
-                "gradient": "linear-gradient(135deg,#1d4ed8,#7c3aed)",
-            },
-            OrderStatus.CANCELLED: {
-                "badge": "ĐÃ HỦY",
-                "headline": f"Đơn hàng #{order.id} đã bị hủy",
-                "intro": "Đơn hàng đã được hủy theo yêu cầu hoặc do hệ thống.",
-                "note": "Nếu đây là nhầm lẫn, hãy liên hệ hotline để được hỗ trợ đặt lại.",
-                "gradient": "linear-gradient(135deg,#7f1d1d,#dc2626)",
-            },
-        }
-
-        config = status_configs.get(status)
-        if not config:
-            return None
 
-        reservation_date_text = reservation_date or order.created_at.strftime("%d/%m/%Y")
-        reservation_slot_text = reservation_slot or "Không đặt bàn"
-        table_text = table_label or "Không đặt bàn"
-
-        text_body = (
-            f"Xin chào {user_name},\n\n"
-            f"{config['headline']}\n"
-            f"- Trạng thái: {config['badge']}\n"
-            f"- Thời gian: {reservation_slot_text}\n"
-            f"- Ngày: {reservation_date_text}\n"
-            f"- Bàn: {table_text}\n"
-            f"- Số món: {total_items}\n"
-            f"- Tổng tiền: {formatted_total}\n\n"
-            f"{config['intro']}\n"
-            f"{config['note']}\n\n"
-            "Trân trọng,\nSchool Food Order"
+        return render_order_status_email(
+            status,
+            order_id=order.id,
+            user_name=user_name,
+            reservation_slot_text=reservation_slot or "Không đặt bàn",
+            reservation_date_text=reservation_date or order.created_at.strftime("%d/%m/%Y"),
+            table_text=table_label or "Không đặt bàn",
+            total_items=total_items,
+            formatted_total=formatted_total,
+            items_html=render_items_html(order.items),
         )
 
-        html_body = f"""
-            <div style="font-family:'Segoe UI',Roboto,Helvetica,Arial,sans-serif;background:#f4f6fb;padding:0;margin:0;">
-                <table role="presentation" width="100%" cellspacing="0" cellpadding="0" style="background:#f4f6fb;padding:32px 0;">
-                    <tr>
-                        <td align="center">
-                            <table role="presentation" width="600" cellpadding="0" cellspacing="0" style="background:white;border-radius:24px;overflow:hidden;box-shadow:0 20px 60px rgba(15,23,42,0.18);">
-                                <tr>
-                                    <td style="background:{config['gradient']};padding:32px 40px;color:white;">
-                                        <div style="opacity:0.8;font-size:13px;text-transform:uppercase;letter-spacing:0.1em;">{config['badge']}</div>
-                                        <h1 style="margin:8px 0 0;font-size:26px;">{config['headline']}</h1>
-                                        <p style="margin:8px 0 0;color:rgba(255,255,255,0.85);">
-                                            Xin chào {user_name}, {config['intro']}
-                                        </p>
-                                    </td>
-                                </tr>
-                                <tr>
-                                    <td style="padding:32px 40px;">
-                                        <table role="presentation" width="100%" cellpadding="0" cellspacing="0" style="border-collapse:collapse;">
-                                            <tr>
-                                                <td style="width:50%;padding:12px 16px;background:#f8f9ff;border-radius:16px;">
-                                                    <div style="font-size:12px;text-transform:uppercase;color:#6366f1;letter-spacing:0.08em;">Thời gian đặt bàn</div>
-                                                    <div style="font-size:16px;font-weight:600;color:#111827;margin-top:6px;">{reservation_slot_text}</div>
-                                                    <div style="color:#6b7280;margin-top:2px;">{reservation_date_text}</div>
-                                                </td>
-                                                <td style="width:50%;padding:12px 16px;">
-                                                    <div style="font-size:12px;text-transform:uppercase;color:#6366f1;letter-spacing:0.08em;">Vị trí</div>
-                                                    <div style="font-size:16px;font-weight:600;color:#111827;margin-top:6px;">{table_text}</div>
-                                                </td>
-                                            </tr>
-                                            <tr>
-                                                <td style="width:50%;padding:12px 16px;">
-                                                    <div style="font-size:12px;text-transform:uppercase;color:#6366f1;letter-spacing:0.08em;">Số lượng món</div>
-                                                    <div style="font-size:20px;font-weight:700;color:#111827;margin-top:6px;">{total_items}</div>
-                                                </td>
-                                                <td style="width:50%;padding:12px 16px;">
-                                                    <div style="font-size:12px;text-transform:uppercase;color:#6366f1;letter-spacing:0.08em;">Tổng cộng</div>
-                                                    <div style="font-size:20px;font-weight:700;color:#e879f9;margin-top:6px;">{formatted_total}</div>
-                                                </td>
-                                            </tr>
-                                        </table>
-                                        <div style="margin:28px 0 12px;font-size:14px;text-transform:uppercase;letter-spacing:0.1em;color:#9ca3af;">Chi tiết món</div>
-                                        <table role="presentation" width="100%" cellpadding="0" cellspacing="0" style="border-collapse:collapse;">
-                                            <thead>
-                                                <tr style="color:#9ca3af;font-size:12px;text-transform:uppercase;letter-spacing:0.08em;">
-                                                    <th align="left" style="font-weight:600;padding-bottom:8px;">Món</th>
-                                                    <th align="center" style="font-weight:600;padding-bottom:8px;">Số lượng</th>
-                                                    <th align="right" style="font-weight:600;padding-bottom:8px;">Thành tiền</th>
-                                                </tr>
-                                            </thead>
-                                            <tbody>
-                                                {items_html}
-                                            </tbody>
-                                        </table>
-                                        <div style="margin-top:24px;font-size:14px;color:#6b7280;">
-                                            {config['note']}
-                                        </div>
-                                        <div style="margin-top:32px;font-size:13px;color:#9ca3af;text-align:center;">
-                                            Trân trọng,<br/>Đội ngũ School Food Order
-                                        </div>
-                                    </td>
-                                </tr>
-                            </table>
-                        </td>
-                    </tr>
-                </table>
-            </div>
-        """
-
-        return {
-            "subject": config["headline"],
-            "text": text_body,
-            "html": html_body,
-        }
+    @staticmethod
+    def _queue_status_email(
+        db: Session, order: Optional[Order], status: OrderStatus, commit: bool = True
+    ) -> bool:
+        """Queue the status notification email in the outbox."""
+        email_payload = OrderService._build_status_email_payload(order, status)
+        if not email_payload:
+            return False
+        message = email_service.queue_email(
+            db,
+            subject=email_payload["subject"],
+            to_email=order.user.email,
+            text_body=email_payload["text"],
+            html_body=email_payload["html"],
+            commit=commit,
+        )
+        return message is not None
 
     @staticmethod
     def _sync_table_and_reservation(
-        db: Session, order: Optional[Order], status: OrderStatus
+        db: Session, order: Optional[Order], status: OrderStatus, commit: bool = True
     ) -> None:
         """Keep table/reservation status in sync with order state."""
         if not order or not order.table_id:
@@ -226,7 +116,9 @@ class OrderService:
             reservation_status = ReservationStatus.COMPLETED
 
         if table_status:
-            table_crud.update_status(db, table_id=order.table_id, status=table_status)
+            table_crud.update_status(
+                db, table_id=order.table_id, status=table_status, commit=commit
+            )
 
         if order.reservation and reservation_status:
             reservation_crud.update_status(
@@ -234,13 +126,19 @@ class OrderService:
                 reservation_id=order.reservation.id,
                 status=reservation_status,
                 clear_order=False,
+                commit=commit,
             )
 
     @staticmethod
     def create_order_from_cart(
         db: Session, user_id: int, order_in: OrderCreate
     ) -> Order:
-        """Create order from user's cart."""
+        """Create order from user's cart.
+
+        Products are loaded in one query, stock is decremented with a single
+        conditional UPDATE and the order, its items, the reservation/table
+        updates and the cart clean-up are all committed together.
+        """
         # Get user's cart
         cart = cart_crud.get_by_user(db, user_id=user_id)
         if not cart or not cart.items:
@@ -248,24 +146,30 @@ class OrderService:
                 status_code=status.HTTP_400_BAD_REQUEST,
                 detail="Cart is empty",
             )
-        
+
         # Validate all products are still available
+        products = product_crud.get_by_ids(
+            db, ids=[cart_item.product_id for cart_item in cart.items]
+        )
+        stock_quantities: Dict[int, int] = {}
         for cart_item in cart.items:
-            product = product_crud.get(db, id=cart_item.product_id)
+            product = products.get(cart_item.product_id)
             if not product or not product.is_available:
                 raise HTTPException(
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail=f"Product {cart_item.product_id} is no longer available",
                 )
-            
+
             # Check stock
             if product.stock_quantity is not None:
-                if product.stock_quantity < cart_item.quantity:
+                requested = stock_quantities.get(product.id, 0) + cart_item.quantity
+                if product.stock_quantity < requested:
                     raise HTTPException(
                         status_code=status.HTTP_400_BAD_REQUEST,
                         detail=f"Not enough stock for {product.name}. Available: {product.stock_quantity}",
                     )
-        
+                stock_quantities[product.id] = requested
+
         # Validate table if dine-in
         reservation = None
         if order_in.table_id:
@@ -302,15 +206,15 @@ class OrderService:
                     status_code=status.HTTP_400_BAD_REQUEST,
                     detail="Reservation is not in a valid state",
                 )
-        
+
         # Calculate total and prepare order items
         total_amount = 0.0
         order_items = []
-        
+
         for cart_item in cart.items:
             subtotal = cart_item.price_at_time * cart_item.quantity
             total_amount += subtotal
-            
+
             order_items.append({
                 "product_id": cart_item.product_id,
                 "quantity": cart_item.quantity,
@@ -318,7 +222,16 @@ class OrderService:
                 "subtotal": subtotal,
                 "notes": None,
             })
-        
+
+        # Reserve stock; a short row count means another checkout won the race
+        updated = product_crud.decrement_stock(db, quantities=stock_quantities)
+        if updated != len(stock_quantities):
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="Stock changed while placing the order, please try again",
+            )
+
         # Create order
         order = order_crud.create_with_items(
             db,
@@ -326,39 +239,32 @@ class OrderService:
             obj_in=order_in,
             items=order_items,
             total_amount=total_amount,
+            commit=False,
         )
         if reservation:
-            reservation_crud.attach_order(db, reservation_id=reservation.id, order_id=order.id)
-            table_crud.update_status(
-                db, table_id=order_in.table_id, status=TableStatus.RESERVED
-            )
-        
-        # Update stock quantities
-        for cart_item in cart.items:
-            product = product_crud.get(db, id=cart_item.product_id)
-            if product.stock_quantity is not None:
-                product.stock_quantity -= cart_item.quantity
-                db.add(product)
-        
-        db.commit()
-        
-        # Reload order with relationships for notifications
-        full_order = order_crud.get(db, id=order.id)
-
-        OrderService._sync_table_and_reservation(db, full_order, OrderStatus.PENDING)
-
-        email_payload = OrderService._build_status_email_payload(full_order, OrderStatus.PENDING)
-        if email_payload:
-            email_service.send_email(
-                subject=email_payload["subject"],
-                to_email=full_order.user.email,
-                text_body=email_payload["text"],
-                html_body=email_payload["html"],
+            reservation_crud.attach_order(
+                db, reservation_id=reservation.id, order_id=order.id, commit=False
             )
-        
+            order.reservation = reservation
+
+        OrderService._sync_table_and_reservation(
+            db, order, OrderStatus.PENDING, commit=False
+        )
+
         # Clear cart
-        cart_crud.clear_cart(db, cart_id=cart.id)
-        
+        cart_crud.clear_cart(db, cart_id=cart.id, commit=False)
+
+        # Queue the confirmation in the same transaction as the order
+        OrderService._queue_status_email(db, order, OrderStatus.PENDING, commit=False)
+
+        db.commit()
+        email_outbox_worker.wake()
+        if stock_quantities:
+            catalog_cache.invalidate()
+
+        # Reload order with relationships for the response
+        order = order_crud.get(db, id=order.id)
+        order_event_hub.publish_order("order.created", order)
         return order
 
     @staticmethod
@@ -373,20 +279,57 @@ class OrderService:
                 detail="Order not found",
             )
         
-        # Update status
-        order_crud.update_status(db, order_id=order_id, status=new_status)
-        order = order_crud.get(db, id=order_id)
+        previous_status = order.status
+        if previous_status == new_status:
+            return order
+        previous_completed_at = order.completed_at
+        previous_updated_at = order.updated_at
+
+        # Update status, the revenue rollup, table and reservation in one transaction.
+        # The UPDATE is conditional on the status read above: a concurrent
+        # identical transition (a double-clicked button) must not move the
+        # order between rollup buckets twice.
+        if not order_crud.update_status(
+            db,
+            order_id=order_id,
+            status=new_status,
+            previous_status=previous_status,
+            commit=False,
+        ):
+            db.rollback()
+            return order_crud.get(db, id=order_id)
+        daily_revenue_crud.record_transition(
+            db,
+            order=order,
+            previous_status=previous_status,
+            previous_completed_at=previous_completed_at,
+            previous_updated_at=previous_updated_at,
+        )
+        try:
+            OrderService._sync_table_and_reservation(db, order, new_status, commit=False)
+        except ReservationConflict:
+            db.rollback()
+            raise HTTPException(
+                status_code=status.HTTP_409_CONFLICT,
+                detail="The reservation's time slot has been booked by someone else",
+            )
 
-        OrderService._sync_table_and_reservation(db, order, new_status)
+        # Cancelling gives the stock back in the same transaction
+        stock_restored = False
+        if new_status == OrderStatus.CANCELLED:
+            quantities: Dict[int, int] = {}
+            for order_item in order.items:
+                quantities[order_item.product_id] = (
+                    quantities.get(order_item.product_id, 0) + order_item.quantity
+                )
+            stock_restored = product_crud.restore_stock(db, quantities=quantities) > 0
+        db.commit()
+        if stock_restored:
+            catalog_cache.invalidate()
+        order = order_crud.get(db, id=order_id)
         
-        email_payload = OrderService._build_status_email_payload(order, new_status)
-        if email_payload:
-            email_service.send_email(
-                subject=email_payload["subject"],
-                to_email=order.user.email,
-                text_body=email_payload["text"],
-                html_body=email_payload["html"],
-            )
+        if OrderService._queue_status_email(db, order, new_status):
+            email_outbox_worker.wake()
         
         # If completed, release table and update payment
         if new_status == OrderStatus.COMPLETED:
@@ -398,18 +341,9 @@ class OrderService:
             db.commit()
             db.refresh(order)
         
-        # If cancelled, release table and restore stock
-        elif new_status == OrderStatus.CANCELLED:
-            # Restore stock
-            for order_item in order.items:
-                product = product_crud.get(db, id=order_item.product_id)
-                if product and product.stock_quantity is not None:
-                    product.stock_quantity += order_item.quantity
-                    db.add(product)
-            
-            db.commit()
-        
-        return order_crud.get(db, id=order_id)
+        order = order_crud.get(db, id=order_id)
+        order_event_hub.publish_order("order.status_changed", order, previous_status)
+        return order
 
     @staticmethod
     def get_user_orders(
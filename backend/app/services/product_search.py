@@ -0,0 +1,216 @@
+"""In-memory, accent-insensitive product search index."""
+import heapq
+import threading
+import time
+import unicodedata
+from collections import defaultdict
+from typing import Dict, Iterable, List, Optional, Set, Tuple
+
+from sqlmodel import Session, select
+
+from app.core.config import settings
+from app.models.product import Product
+
+
+def fold(text: Optional[str]) -> str:
+    """Lowercase and strip Vietnamese diacritics ("Phở Đặc Biệt" -> "pho dac biet")."""
+    if not text:
+        return ""
+    text = text.replace("đ", "d").replace("Đ", "D")
+    decomposed = unicodedata.normalize("NFD", text)
+    stripped = "".join(ch for ch in decomposed if not unicodedata.combining(ch))
+    return " ".join(stripped.lower().split())
+
+
+def trigrams(folded: str) -> Set[str]:
+    """Word trigrams padded like pg_trgm ("pho" -> "  p", " ph", "pho", "ho ")."""
+    grams: Set[str] = set()
+    for word in folded.split():
+        padded = f"  {word} "
+        grams.update(padded[i:i + 3] for i in range(len(padded) - 2))
+    return grams
+
+
+def similarity(left: Set[str], right: Set[str]) -> float:
+    """Trigram similarity of two words (shared / union), as in pg_trgm."""
+    shared = len(left & right)
+    return shared / (len(left) + len(right) - shared) if shared else 0.0
+
+
+class ProductSearchIndex:
+    """
+    Accent-folded word index over product names and descriptions.
+
+    Query words are matched against the menu vocabulary by trigram
+    similarity, which gives typo tolerance ("phoo" finds "phở") and prefix
+    matching for partially typed words. Products are ranked by how well
+    every query word matches their name; description matches count less,
+    and substring/prefix matches on the whole name get a bonus.
+
+    The index is built from the database on startup, updated in place by the
+    product CRUD writes, and rebuilt lazily once it is older than
+    SEARCH_INDEX_REFRESH_SECONDS so writes made by other workers show up.
+    """
+
+    MIN_WORD_SIMILARITY = 0.45
+    PREFIX_SIMILARITY = 0.8
+    MIN_SCORE = 0.45
+    DESCRIPTION_WEIGHT = 0.6
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._names: Dict[int, str] = {}
+        self._doc_words: Dict[int, Tuple[Set[str], Set[str]]] = {}
+        self._name_postings: Dict[str, Set[int]] = defaultdict(set)
+        self._desc_postings: Dict[str, Set[int]] = defaultdict(set)
+        self._word_grams: Dict[str, Set[str]] = {}
+        self._gram_words: Dict[str, Set[str]] = defaultdict(set)
+        self._built_at: Optional[float] = None
+
+    @property
+    def is_built(self) -> bool:
+        return self._built_at is not None
+
+    def __len__(self) -> int:
+        return len(self._names)
+
+    def build(self, db: Session) -> None:
+        """(Re)build the whole index from the products table."""
+        rows = db.exec(select(Product.id, Product.name, Product.description)).all()
+        self.build_from(rows)
+
+    def build_from(self, rows: Iterable[Tuple[int, str, Optional[str]]]) -> None:
+        """Build the index from ``(id, name, description)`` rows."""
+        fresh = ProductSearchIndex()
+        for product_id, name, description in rows:
+            fresh._add(product_id, name, description)
+        with self._lock:
+            self._names = fresh._names
+            self._doc_words = fresh._doc_words
+            self._name_postings = fresh._name_postings
+            self._desc_postings = fresh._desc_postings
+            self._word_grams = fresh._word_grams
+            self._gram_words = fresh._gram_words
+            self._built_at = time.monotonic()
+
+    def ensure_fresh(self, db: Session) -> None:
+        """Build the index if missing or older than the refresh interval."""
+        built_at = self._built_at
+        if built_at is None or time.monotonic() - built_at > settings.SEARCH_INDEX_REFRESH_SECONDS:
+            self.build(db)
+
+    def _add_word(self, word: str) -> None:
+        if word not in self._word_grams:
+            grams = trigrams(word)
+            self._word_grams[word] = grams
+            for gram in grams:
+                self._gram_words[gram].add(word)
+
+    def _add(self, product_id: int, name: str, description: Optional[str]) -> None:
+        folded_name = fold(name)
+        name_words = set(folded_name.split())
+        desc_words = set(fold(description).split())
+        self._names[product_id] = folded_name
+        self._doc_words[product_id] = (name_words, desc_words)
+        for word in name_words:
+            self._add_word(word)
+            self._name_postings[word].add(product_id)
+        for word in desc_words:
+            self._add_word(word)
+            self._desc_postings[word].add(product_id)
+
+    def _remove(self, product_id: int) -> None:
+        words = self._doc_words.pop(product_id, None)
+        self._names.pop(product_id, None)
+        if not words:
+            return
+        name_words, desc_words = words
+        for word in name_words:
+            self._name_postings[word].discard(product_id)
+        for word in desc_words:
+            self._desc_postings[word].discard(product_id)
+
+    def upsert(self, product: Product) -> None:
+        """Add or refresh a single product."""
+        with self._lock:
+            self._remove(product.id)
+            self._add(product.id, product.name, product.description)
+
+    def remove(self, product_id: int) -> None:
+        """Drop a single product from the index."""
+        with self._lock:
+            self._remove(product_id)
+
+    def _similar_words(self, word: str) -> Dict[str, float]:
+        """Vocabulary words close enough to ``word``, with their similarity."""
+        grams = trigrams(word)
+        candidates: Set[str] = set()
+        for gram in grams:
+            candidates.update(self._gram_words.get(gram, ()))
+        matches: Dict[str, float] = {}
+        for candidate in candidates:
+            score = similarity(grams, self._word_grams[candidate])
+            if candidate.startswith(word):
+                score = max(score, self.PREFIX_SIMILARITY)
+            if score >= self.MIN_WORD_SIMILARITY:
+                matches[candidate] = score
+        return matches
+
+    def _word_matches(self, word: str) -> List[Tuple[float, Set[int]]]:
+        """Posting sets matching one query word, as ``(score, ids)`` pairs."""
+        matches = []
+        for candidate, score in self._similar_words(word).items():
+            name_ids = self._name_postings.get(candidate)
+            if name_ids:
+                matches.append((score, name_ids))
+            desc_ids = self._desc_postings.get(candidate)
+            if desc_ids:
+                matches.append((score * self.DESCRIPTION_WEIGHT, desc_ids))
+        matches.sort(key=lambda match: match[0], reverse=True)
+        return matches
+
+    def search(self, query: str, *, limit: Optional[int] = None) -> List[int]:
+        """Return product IDs matching ``query``, best match first."""
+        folded_query = fold(query)
+        query_words = folded_query.split()
+        if not query_words:
+            return []
+
+        with self._lock:
+            per_word = [self._word_matches(word) for word in query_words]
+            matched = [set().union(*(ids for _, ids in matches)) for matches in per_word]
+
+            # Prefer products matching every word; fall back to any word
+            candidates = set.intersection(*matched) or set.union(*matched)
+            totals: Dict[int, float] = dict.fromkeys(candidates, 0.0)
+            for matches in per_word:
+                remaining = set(candidates)
+                for score, ids in matches:
+                    hit = remaining & ids
+                    if not hit:
+                        continue
+                    remaining -= hit
+                    for product_id in hit:
+                        totals[product_id] += score
+                    if not remaining:
+                        break
+
+            scored = []
+            word_count = len(query_words)
+            for product_id, total in totals.items():
+                score = total / word_count
+                if score < self.MIN_SCORE:
+                    continue
+                name = self._names[product_id]
+                if folded_query in name:
+                    score += 1.0
+                    if name.startswith(folded_query):
+                        score += 0.5
+                scored.append((-score, product_id))
+
+        if limit is not None:
+            return [product_id for _, product_id in heapq.nsmallest(limit, scored)]
+        scored.sort()
+        return [product_id for _, product_id in scored]
+
+product_search_index = ProductSearchIndex()
@@ -0,0 +1,200 @@
+"""Token bucket rate limiting for sign-in attempts."""
+import sqlite3
+import threading
+import time
+from collections import OrderedDict, defaultdict
+from typing import Any, Dict, NamedTuple, Optional, Tuple
+
+from app.core.config import settings
+
+
+class RateRule(NamedTuple):
+    """A bucket holding up to ``capacity`` attempts, refilled at ``per_minute``."""
+    capacity: int
+    per_minute: float
+
+    @property
+    def per_second(self) -> float:
+        return self.per_minute / 60.0
+
+
+def _refill(tokens: float, updated: float, now: float, rule: RateRule) -> float:
+    return min(float(rule.capacity), tokens + (now - updated) * rule.per_second)
+
+
+def _retry_after(tokens: float, rule: RateRule) -> float:
+    return (1.0 - tokens) / rule.per_second if rule.per_second > 0 else float("inf")
+
+
+class MemoryBucketStore:
+    """Buckets in a dict of this process; the least recently used are dropped beyond ``max_entries``."""
+
+    def __init__(self, max_entries: int) -> None:
+        self.max_entries = max_entries
+        self._buckets: "OrderedDict[str, Tuple[float, float]]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def take(self, key: str, rule: RateRule, now: float) -> float:
+        """Take one token; returns 0 if allowed, else seconds until one is available."""
+        with self._lock:
+            tokens, updated = self._buckets.pop(key, (float(rule.capacity), now))
+            tokens = _refill(tokens, updated, now, rule)
+            allowed = tokens >= 1.0
+            if allowed:
+                tokens -= 1.0
+            self._buckets[key] = (tokens, now)
+            while len(self._buckets) > self.max_entries:
+                self._buckets.popitem(last=False)
+        return 0.0 if allowed else _retry_after(tokens, rule)
+
+    def reset(self, key: str) -> None:
+        with self._lock:
+            self._buckets.pop(key, None)
+
+    def __len__(self) -> int:
+        return len(self._buckets)
+
+
+class SQLiteBucketStore:
+    """
+    Buckets in a SQLite file shared by every worker process on the host.
+
+    Stands in for a shared store such as Redis: all workers draw from the
+    same buckets, so the limits hold however many workers run. Each take is
+    one IMMEDIATE transaction.
+    """
+
+    def __init__(self, path: str) -> None:
+        self.path = path
+        self._local = threading.local()
+        with self._connect() as conn:
+            conn.execute(
+                "CREATE TABLE IF NOT EXISTS rate_limit_buckets ("
+                "key TEXT PRIMARY KEY, tokens REAL NOT NULL, updated REAL NOT NULL)"
+            )
+
+    def _connect(self) -> sqlite3.Connection:
+        conn = getattr(self._local, "conn", None)
+        if conn is None:
+            conn = sqlite3.connect(self.path, timeout=5.0, isolation_level=None)
+            conn.execute("PRAGMA journal_mode=WAL")
+            self._local.conn = conn
+        return conn
+
+    def take(self, key: str, rule: RateRule, now: float) -> float:
+        conn = self._connect()
+        conn.execute("BEGIN IMMEDIATE")
+        try:
+            row = conn.execute(
+                "SELECT tokens, updated FROM rate_limit_buckets WHERE key = ?", (key,)
+            ).fetchone()
+            tokens = _refill(*row, now, rule) if row else float(rule.capacity)
+            allowed = tokens >= 1.0
+            if allowed:
+                tokens -= 1.0
+            conn.execute(
+                "INSERT OR REPLACE INTO rate_limit_buckets (key, tokens, updated) VALUES (?, ?, ?)",
+                (key, tokens, now),
+            )
+            conn.execute("COMMIT")
+        except Exception:
+            conn.execute("ROLLBACK")
+            raise
+        return 0.0 if allowed else _retry_after(tokens, rule)
+
+    def reset(self, key: str) -> None:
+        self._connect().execute("DELETE FROM rate_limit_buckets WHERE key = ?", (key,))
+
+    def __len__(self) -> int:
+        return self._connect().execute("SELECT COUNT(*) FROM rate_limit_buckets").fetchone()[0]
+
+
+class RateLimiter:
+    """
+    Token buckets per (scope, key), e.g. ("login:ip", "10.0.0.7").
+
+    Callers check every bucket of an attempt before doing any expensive
+    work (bcrypt, TOTP) and reject the attempt when one is empty.
+    """
+
+    def __init__(self, store) -> None:
+        self.store = store
+        self._lock = threading.Lock()
+        self.allowed: Dict[str, int] = defaultdict(int)
+        self.limited: Dict[str, int] = defaultdict(int)
+
+    def hit(self, scope: str, key: str, rule: RateRule) -> float:
+        """Consume one attempt; returns 0 if allowed, else the Retry-After in seconds."""
+        retry_after = self.store.take(f"{scope}:{key}", rule, time.time())
+        with self._lock:
+            if retry_after:
+                self.limited[scope] += 1
+            else:
+                self.allowed[scope] += 1
+        return retry_after
+
+    def reset(self, scope: str, key: str) -> None:
+        """Refill a bucket, e.g. an account's after a successful sign-in."""
+        self.store.reset(f"{scope}:{key}")
+
+    def stats(self) -> dict:
+        with self._lock:
+            scopes = sorted(set(self.allowed) | set(self.limited))
+            return {
+                "storage": type(self.store).__name__,
+                "buckets": len(self.store),
+                "scopes": {
+                    scope: {"allowed": self.allowed[scope], "limited": self.limited[scope]}
+                    for scope in scopes
+                },
+            }
+
+
+def _create_store():
+    if settings.RATE_LIMIT_STORAGE == "sqlite":
+        return SQLiteBucketStore(settings.RATE_LIMIT_SQLITE_PATH)
+    return MemoryBucketStore(settings.RATE_LIMIT_MAX_BUCKETS)
+
+
+# Attempt kinds: each charges one bucket per client IP and one per account
+LOGIN = "login"
+TWO_FACTOR = "2fa"
+
+_RULES = {
+    LOGIN: (
+        RateRule(settings.LOGIN_RATE_LIMIT_IP_CAPACITY, settings.LOGIN_RATE_LIMIT_IP_PER_MINUTE),
+        RateRule(settings.LOGIN_RATE_LIMIT_ACCOUNT_CAPACITY, settings.LOGIN_RATE_LIMIT_ACCOUNT_PER_MINUTE),
+    ),
+    TWO_FACTOR: (
+        RateRule(settings.LOGIN_RATE_LIMIT_IP_CAPACITY, settings.LOGIN_RATE_LIMIT_IP_PER_MINUTE),
+        RateRule(settings.TWO_FACTOR_RATE_LIMIT_CAPACITY, settings.TWO_FACTOR_RATE_LIMIT_PER_MINUTE),
+    ),
+}
+
+rate_limiter = RateLimiter(_create_store())
+
+
+def check_attempt(kind: str, ip: Optional[str], account: Any) -> float:
+    """
+    Charge a sign-in attempt of ``kind`` to the client's IP and to the account.
+
+    Returns 0 when the attempt may proceed, else the seconds to wait. An
+    account whose bucket is empty is locked out until it refills; a
+    successful attempt refills it (see ``attempt_succeeded``).
+    """
+    if not settings.RATE_LIMIT_ENABLED:
+        return 0.0
+    ip_rule, account_rule = _RULES[kind]
+    retry_after = rate_limiter.hit(f"{kind}:ip", ip or "unknown", ip_rule)
+    if retry_after:
+        return retry_after
+    return rate_limiter.hit(f"{kind}:account", _account_key(account), account_rule)
+
+
+def attempt_succeeded(kind: str, account: Any) -> None:
+    if settings.RATE_LIMIT_ENABLED:
+        rate_limiter.reset(f"{kind}:account", _account_key(account))
+
+
+def _account_key(account: Any) -> str:
+    return str(account).strip().lower()
@@ -0,0 +1,192 @@
+"""In-memory per-table index of active reservations."""
+import threading
+import time
+from bisect import bisect_left, insort
+from collections import defaultdict
+from datetime import datetime, timedelta
+from typing import Any, Dict, Iterable, List, NamedTuple, Optional
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+from sqlmodel import select
+
+from app.core.config import settings
+from app.models.reservation import TableReservation
+from app.utils.enums import ReservationStatus
+
+ACTIVE_STATUSES = (
+    ReservationStatus.PENDING,
+    ReservationStatus.CONFIRMED,
+    ReservationStatus.ACTIVE,
+)
+
+_PENDING_KEY = "reservation_index_pending"
+
+
+class IndexedReservation(NamedTuple):
+    """The reservation fields needed for overlap and availability lookups."""
+    start_time: datetime
+    end_time: datetime
+    id: int
+    table_id: int
+    user_id: int
+    status: ReservationStatus
+
+    @classmethod
+    def from_model(cls, reservation: TableReservation) -> "IndexedReservation":
+        return cls(
+            start_time=reservation.start_time,
+            end_time=reservation.end_time,
+            id=reservation.id,
+            table_id=reservation.table_id,
+            user_id=reservation.user_id,
+            status=reservation.status,
+        )
+
+
+class _TableIntervals:
+    """Reservations of one table sorted by start time.
+
+    Overlap queries only scan entries starting in
+    ``[start - longest_duration, end)``, which keeps lookups at
+    O(log n + k) because reservations are bounded in length.
+    """
+
+    __slots__ = ("entries", "longest")
+
+    def __init__(self) -> None:
+        self.entries: List[IndexedReservation] = []
+        self.longest = timedelta(0)
+
+    def add(self, entry: IndexedReservation) -> None:
+        insort(self.entries, entry)
+        self.longest = max(self.longest, entry.end_time - entry.start_time)
+
+    def remove(self, entry: IndexedReservation) -> None:
+        position = bisect_left(self.entries, entry)
+        if position < len(self.entries) and self.entries[position] == entry:
+            del self.entries[position]
+
+    def overlapping(self, start: datetime, end: datetime) -> List[IndexedReservation]:
+        # Near datetime.min the lower key would underflow; every entry qualifies
+        lower = start - self.longest if start - datetime.min > self.longest else datetime.min
+        lo = bisect_left(self.entries, (lower,))
+        hi = bisect_left(self.entries, (end,))
+        return [entry for entry in self.entries[lo:hi] if entry.end_time > start]
+
+
+class ReservationIndex:
+    """
+    Active (pending, confirmed, in-progress) reservations grouped by table.
+
+    Used to answer conflict checks, availability lookups and table status
+    annotation without querying the database. The database stays
+    authoritative: bookings are still written with a guarded insert, so a
+    stale index can only cause an extra round-trip, never a double booking.
+
+    Reservation CRUD writes register changed rows on their session and the
+    index is updated once that session commits. The whole index is rebuilt
+    lazily after RESERVATION_INDEX_REFRESH_SECONDS so changes made by other
+    workers show up.
+    """
+
+    def __init__(self) -> None:
+        self._lock = threading.RLock()
+        self._tables: Dict[int, _TableIntervals] = defaultdict(_TableIntervals)
+        self._by_id: Dict[int, IndexedReservation] = {}
+        self._built_at: Optional[float] = None
+
+    @property
+    def is_built(self) -> bool:
+        return self._built_at is not None
+
+    def __len__(self) -> int:
+        return len(self._by_id)
+
+    def build(self, db: Session) -> None:
+        """(Re)build the index from the reservations table."""
+        reservations = db.exec(
+            select(TableReservation).where(TableReservation.status.in_(ACTIVE_STATUSES))
+        ).all()
+        self.build_from(IndexedReservation.from_model(r) for r in reservations)
+
+    def build_from(self, entries: Iterable[IndexedReservation]) -> None:
+        tables: Dict[int, _TableIntervals] = defaultdict(_TableIntervals)
+        by_id: Dict[int, IndexedReservation] = {}
+        for entry in sorted(entries):
+            tables[entry.table_id].entries.append(entry)
+            tables[entry.table_id].longest = max(
+                tables[entry.table_id].longest, entry.end_time - entry.start_time
+            )
+            by_id[entry.id] = entry
+        with self._lock:
+            self._tables = tables
+            self._by_id = by_id
+            self._built_at = time.monotonic()
+
+    def ensure_fresh(self, db: Session) -> None:
+        """Build the index if missing or older than the refresh interval."""
+        built_at = self._built_at
+        if built_at is None or time.monotonic() - built_at > settings.RESERVATION_INDEX_REFRESH_SECONDS:
+            self.build(db)
+
+    def upsert(self, entry: IndexedReservation) -> None:
+        """Add, move or drop a reservation according to its current status."""
+        with self._lock:
+            previous = self._by_id.pop(entry.id, None)
+            if previous is not None:
+                self._tables[previous.table_id].remove(previous)
+            if entry.status in ACTIVE_STATUSES:
+                self._tables[entry.table_id].add(entry)
+                self._by_id[entry.id] = entry
+
+    def remove(self, reservation_id: int) -> None:
+        with self._lock:
+            previous = self._by_id.pop(reservation_id, None)
+            if previous is not None:
+                self._tables[previous.table_id].remove(previous)
+
+    def overlapping(
+        self, table_id: int, start: datetime, end: datetime
+    ) -> List[IndexedReservation]:
+        """Active reservations of a table intersecting ``[start, end)``."""
+        with self._lock:
+            intervals = self._tables.get(table_id)
+            return intervals.overlapping(start, end) if intervals else []
+
+    def has_conflict(self, table_id: int, start: datetime, end: datetime) -> bool:
+        return bool(self.overlapping(table_id, start, end))
+
+    def busy_slots(
+        self, table_id: int, start: datetime, step: timedelta, count: int
+    ) -> str:
+        """Free/busy bitmap of ``count`` slots from ``start``: "1" where booked."""
+        end = start + step * count
+        bitmap = bytearray(b"0" * count)
+        for entry in self.overlapping(table_id, start, end):
+            first = max(0, (entry.start_time - start) // step)
+            last = min(count, -((start - entry.end_time) // step))
+            bitmap[first:last] = b"1" * (last - first)
+        return bitmap.decode("ascii")
+
+    def track(self, db: Session, reservation: TableReservation) -> None:
+        """Apply the reservation's current state to the index once ``db`` commits."""
+        pending = db.info.setdefault(_PENDING_KEY, {})
+        pending[reservation.id] = IndexedReservation.from_model(reservation)
+
+
+reservation_index = ReservationIndex()
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending_changes(session: Session) -> None:
+    pending = session.info.pop(_PENDING_KEY, None)
+    if pending:
+        for entry in pending.values():
+            reservation_index.upsert(entry)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending_changes(session: Session, previous_transaction: Any) -> None:
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
@@ -0,0 +1,127 @@
+"""Result cache for the admin statistics endpoints."""
+from datetime import datetime
+from typing import Any, Callable, Dict, Hashable, Iterable, Optional, Set, Tuple
+
+from sqlalchemy import event
+from sqlalchemy.orm import Session
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+
+_PENDING_KEY = "statistics_cache_pending"
+
+PeriodKey = Tuple[str, int, Optional[int]]
+
+
+def is_closed_period(year: int, month: Optional[int] = None) -> bool:
+    """Whether the year (or month of that year) has already ended."""
+    now = datetime.utcnow()
+    if month is None:
+        return year < now.year
+    return (year, month) < (now.year, now.month)
+
+
+def _periods(moment: Optional[datetime]) -> Iterable[Tuple[int, Optional[int]]]:
+    """Year and month keys a timestamp falls into."""
+    if moment is None:
+        return ()
+    return ((moment.year, moment.month), (moment.year, None))
+
+
+class StatisticsCache:
+    """
+    Cache statistics responses per ``(endpoint, year, month)``.
+
+    Periods that have already ended are kept for STATISTICS_CACHE_CLOSED_TTL_SECONDS,
+    the current period and the all-time overview for STATISTICS_CACHE_TTL_SECONDS.
+    Order and reservation writes register the periods they touch on the
+    session; the matching entries are dropped once that session commits, so
+    a rolled-back write never invalidates anything and a reader cannot cache
+    data from before the commit.
+    """
+
+    ENDPOINTS = ("overview", "orders", "reservations")
+
+    def __init__(self) -> None:
+        self._caches: Dict[str, TTLCache] = {
+            endpoint: TTLCache(
+                f"statistics:{endpoint}",
+                ttl_seconds=settings.STATISTICS_CACHE_TTL_SECONDS,
+                maxsize=settings.STATISTICS_CACHE_MAX_ENTRIES,
+            )
+            for endpoint in self.ENDPOINTS
+        }
+
+    def get_or_load(
+        self,
+        endpoint: str,
+        key: Hashable,
+        loader: Callable[[], Any],
+        *,
+        year: Optional[int] = None,
+        month: Optional[int] = None,
+    ) -> Any:
+        """Return the cached result for ``key``, computing it on a miss.
+
+        ``year``/``month`` describe the period the result covers; results for
+        closed periods are cached for the long TTL.
+        """
+        if not settings.STATISTICS_CACHE_ENABLED:
+            return loader()
+        ttl = None
+        if year is not None and is_closed_period(year, month):
+            ttl = settings.STATISTICS_CACHE_CLOSED_TTL_SECONDS
+        return self._caches[endpoint].get_or_load(key, loader, ttl_seconds=ttl)
+
+    def order_changed(self, db: Session, order: Any) -> None:
+        """Invalidate the statistics an order contributes to after ``db`` commits."""
+        keys: Set[PeriodKey] = {
+            ("orders", year, month) for year, month in _periods(order.created_at)
+        }
+        self._defer(db, keys, overview=True)
+
+    def reservation_changed(self, db: Session, reservation: Any) -> None:
+        """Invalidate the statistics a reservation contributes to after ``db`` commits."""
+        keys: Set[PeriodKey] = set()
+        for moment in (reservation.created_at, reservation.start_time):
+            keys.update(("reservations", year, month) for year, month in _periods(moment))
+        self._defer(db, keys, overview=True)
+
+    def _defer(self, db: Session, keys: Set[PeriodKey], *, overview: bool) -> None:
+        pending = db.info.setdefault(_PENDING_KEY, set())
+        pending.update(keys)
+        if overview:
+            pending.add(("overview", None, None))
+
+    def invalidate_periods(self, keys: Iterable[PeriodKey]) -> None:
+        """Drop cached results for the given ``(endpoint, year, month)`` periods."""
+        for endpoint, year, month in keys:
+            cache = self._caches[endpoint]
+            if year is None:
+                cache.invalidate()
+            else:
+                cache.delete((year, month))
+
+    def invalidate(self) -> None:
+        """Drop every cached statistics result."""
+        for cache in self._caches.values():
+            cache.invalidate()
+
+    def stats(self) -> Dict[str, dict]:
+        return {endpoint: cache.stats() for endpoint, cache in self._caches.items()}
+
+
+statistics_cache = StatisticsCache()
+
+
+@event.listens_for(Session, "after_commit")
+def _apply_pending_invalidations(session: Session) -> None:
+    keys = session.info.pop(_PENDING_KEY, None)
+    if keys:
+        statistics_cache.invalidate_periods(keys)
+
+
+@event.listens_for(Session, "after_soft_rollback")
+def _discard_pending_invalidations(session: Session, previous_transaction: Any) -> None:
+    if previous_transaction.parent is None:
+        session.info.pop(_PENDING_KEY, None)
@@ -4,19 +4,13 @@ from datetime import datetime, timezone, timedelta
 from typing import Iterable, List, Optional
 from zoneinfo import ZoneInfo, ZoneInfoNotFoundError
 
-from sqlmodel import Session, select
+from sqlmodel import Session
 
-from app.models.reservation import TableReservation
 from app.models.table import Table
-from app.utils.enums import ReservationStatus, TableStatus
+from app.services.reservation_index import IndexedReservation, reservation_index
+from app.utils.enums import TableStatus
 
 
-ACTIVE_RESERVATION_STATUSES = (
-    ReservationStatus.PENDING,
-    ReservationStatus.CONFIRMED,
-    ReservationStatus.ACTIVE,
-)
-
 try:
     VIETNAM_TZ = ZoneInfo("Asia/Ho_Chi_Minh")
 except ZoneInfoNotFoundError:
@@ -34,7 +28,7 @@ def _ensure_vietnam_time(dt: Optional[datetime]) -> Optional[datetime]:
 
 def _apply_status_for_window(
     tables: List[Table],
-    reservations: List[TableReservation],
+    reservations: List[IndexedReservation],
     target_start: datetime,
     target_end: datetime,
 ) -> List[Table]:
@@ -79,18 +73,14 @@ def annotate_tables_with_reservations(
         return list(tables)
 
     target_window = target_start and target_end
+    reservation_index.ensure_fresh(db)
 
     if target_window:
-        target_start_naive = target_start
-        target_end_naive = target_end
-        reservations = db.exec(
-            select(TableReservation).where(
-                TableReservation.table_id.in_(table_ids),
-                TableReservation.status.in_(ACTIVE_RESERVATION_STATUSES),
-                TableReservation.start_time < target_end_naive,
-                TableReservation.end_time > target_start_naive,
-            )
-        ).all()
+        reservations = [
+            reservation
+            for table_id in table_ids
+            for reservation in reservation_index.overlapping(table_id, target_start, target_end)
+        ]
         return _apply_status_for_window(
             tables,
             reservations,
@@ -101,13 +91,13 @@ def annotate_tables_with_reservations(
     now_utc = datetime.utcnow().replace(tzinfo=timezone.utc)
     now_local = now_utc.astimezone(VIETNAM_TZ)
 
-    reservations = db.exec(
-        select(TableReservation).where(
-            TableReservation.table_id.in_(table_ids),
-            TableReservation.status.in_(ACTIVE_RESERVATION_STATUSES),
-            TableReservation.end_time >= now_utc.replace(tzinfo=None),
+    reservations = [
+        reservation
+        for table_id in table_ids
+        for reservation in reservation_index.overlapping(
+            table_id, now_utc.replace(tzinfo=None), datetime.max
         )
-    ).all()
+    ]
 
     current_map = defaultdict(list)
     future_map = defaultdict(list)
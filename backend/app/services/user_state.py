@@ -0,0 +1,88 @@
+"""Per-process cache of the user state that signed token claims stand in for."""
+from typing import Any, Dict, NamedTuple, Optional
+
+from sqlmodel import Session, select
+
+from app.core.cache import TTLCache
+from app.core.config import settings
+from app.models.user import User
+from app.utils.enums import UserRole
+
+# User fields carried as token claims; changing any of them revokes tokens
+CLAIM_FIELDS = ("role", "is_active", "is_superuser")
+
+
+class UserState(NamedTuple):
+    """What a token is checked against: its version and the claimed fields."""
+    token_version: int
+    is_active: bool
+    role: UserRole
+    is_superuser: bool
+
+    @classmethod
+    def from_user(cls, user: User) -> "UserState":
+        return cls(
+            token_version=user.token_version,
+            is_active=user.is_active,
+            role=user.role,
+            is_superuser=user.is_superuser,
+        )
+
+
+class UserStateCache:
+    """
+    Token versions of recently seen users.
+
+    Access tokens carry the user's role, status and ``token_version`` as
+    signed claims. With AUTH_STATELESS enabled, a token is accepted when
+    its version matches the cached one, so authenticated requests do not
+    load the user. User writes that change a claimed field or the password
+    bump the version (see CRUDUser.update), which revokes every token
+    issued before. This process sees the new version immediately; other
+    workers re-read it within AUTH_USER_STATE_TTL_SECONDS.
+    """
+
+    def __init__(self) -> None:
+        self._cache = TTLCache(
+            "user_state",
+            ttl_seconds=settings.AUTH_USER_STATE_TTL_SECONDS,
+            maxsize=settings.AUTH_USER_STATE_MAX_ENTRIES,
+        )
+
+    def get(self, db: Session, user_id: int) -> Optional[UserState]:
+        """Cached state of ``user_id``, loading it on a miss; None if the user is gone."""
+        return self._cache.get_or_load(user_id, lambda: self._load(db, user_id))
+
+    @staticmethod
+    def _load(db: Session, user_id: int) -> Optional[UserState]:
+        statement = select(
+            User.token_version, User.is_active, User.role, User.is_superuser
+        ).where(User.id == user_id)
+        row = db.exec(statement).first()
+        return UserState(*row) if row else None
+
+    @staticmethod
+    def claims_for(user: User) -> Dict[str, Any]:
+        """Access token claims describing ``user``."""
+        return {
+            "ver": user.token_version,
+            "role": user.role.value if isinstance(user.role, UserRole) else user.role,
+            "act": user.is_active,
+            "su": user.is_superuser,
+        }
+
+    def remember(self, user: User) -> None:
+        """Store the committed state of ``user``."""
+        # delete() bumps the cache version, so a lookup racing with this
+        # write cannot store the state it read before the change
+        self._cache.delete(user.id)
+        self._cache.set(user.id, UserState.from_user(user))
+
+    def forget(self, user_id: int) -> None:
+        self._cache.delete(user_id)
+
+    def stats(self) -> dict:
+        return self._cache.stats()
+
+
+user_state = UserStateCache()
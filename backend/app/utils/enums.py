@@ -46,3 +46,17 @@ class ReservationStatus(str, Enum):
     ACTIVE = "active"
     COMPLETED = "completed"
     CANCELLED = "cancelled"
+
+
+class EmailStatus(str, Enum):
+    """Outbox email delivery status types."""
+    PENDING = "pending"
+    SENT = "sent"
+    FAILED = "failed"
+
+
+class OrderView(str, Enum):
+    """Order list projections."""
+    SUMMARY = "summary"
+    STAFF_BOARD = "staff-board"
+    FULL = "full"
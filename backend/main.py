@@ -1,11 +1,23 @@
 """FastAPI application entry point."""
-from fastapi import FastAPI
+import hmac
+
+from fastapi import FastAPI, HTTPException, Request, Response, status
+from fastapi.responses import JSONResponse
 from fastapi.middleware.cors import CORSMiddleware
+from starlette.concurrency import run_in_threadpool
 
 from app.core.config import settings
+from app.api.middleware import MetricsMiddleware, QueryStatsMiddleware
 from app.api.v1.router import api_router
-from app.db.session import SessionLocal
-from app.db.init_db import init_db
+from app.db.session import SessionLocal, async_engine
+from app.core.metrics import PrometheusText
+from app.db.init_db import prepare_database
+from app.services.email_outbox_worker import email_outbox_worker
+from app.services.health import readiness_probe
+from app.services.metrics_exporter import count_pending_emails, render_metrics
+from app.services.product_search import product_search_index
+from app.services.reservation_index import reservation_index
+from app.utils.pagination import NEXT_CURSOR_HEADER
 
 # Create FastAPI app
 app = FastAPI(
@@ -23,18 +35,44 @@ if settings.BACKEND_CORS_ORIGINS:
         allow_credentials=True,
         allow_methods=["*"],
         allow_headers=["*"],
+        expose_headers=[NEXT_CURSOR_HEADER],
     )
 
+if settings.QUERY_STATS_ENABLED:
+    app.add_middleware(QueryStatsMiddleware)
+
+if settings.METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 
 @app.on_event("startup")
 def on_startup():
-    """Initialize database on startup."""
+    """Prepare the database and load the in-process indexes."""
+    prepare_database()
     db = SessionLocal()
     try:
-        init_db(db)
+        product_search_index.build(db)
+        reservation_index.build(db)
     finally:
         db.close()
 
+    if settings.EMAIL_OUTBOX_ENABLED:
+        email_outbox_worker.start()
+
+
+@app.on_event("shutdown")
+def on_shutdown():
+    """Stop background workers."""
+    email_outbox_worker.stop()
+    readiness_probe.dispose()
+
+
+@app.on_event("shutdown")
+async def dispose_async_engine():
+    """Close the async engine's pooled connections."""
+    if async_engine is not None:
+        await async_engine.dispose()
+
 
 @app.get("/")
 def root():
@@ -52,6 +90,39 @@ def health_check():
     return {"status": "healthy"}
 
 
+@app.get("/health/live")
+async def liveness_check():
+    """Liveness probe: the worker's event loop is responsive. Checks no dependencies."""
+    return {"status": "alive"}
+
+
+@app.get("/health/ready")
+async def readiness_check():
+    """
+    Readiness probe: database, connection pool and email outbox, with each
+    check's latency. 503 when the database or pool fails; "degraded" (200)
+    when only the outbox needs attention.
+    """
+    report = await readiness_probe.check()
+    return JSONResponse(
+        report,
+        status_code=status.HTTP_503_SERVICE_UNAVAILABLE if report["status"] == "unready" else status.HTTP_200_OK,
+    )
+
+
+@app.get("/metrics", include_in_schema=False)
+async def metrics(request: Request):
+    """Prometheus metrics of this worker process."""
+    if not settings.METRICS_ENABLED:
+        raise HTTPException(status_code=status.HTTP_404_NOT_FOUND)
+    if settings.METRICS_BEARER_TOKEN and not hmac.compare_digest(
+        request.headers.get("authorization", ""), f"Bearer {settings.METRICS_BEARER_TOKEN}"
+    ):
+        raise HTTPException(status_code=status.HTTP_401_UNAUTHORIZED)
+    pending_emails = await run_in_threadpool(count_pending_emails)
+    return Response(render_metrics(pending_emails), media_type=PrometheusText.CONTENT_TYPE)
+
+
 @app.middleware("http")
 async def add_charset_header(request, call_next):
     response = await call_next(request)
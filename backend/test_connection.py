@@ -7,7 +7,7 @@ sys.path.insert(0, str(Path(__file__).parent))
 
 from app.db.session import SessionLocal, engine
 from app.db.init_db import init_db
-from sqlmodel import SQLModel
+from app.db.migrations import upgrade
 
 
 def test_connection():
@@ -19,10 +19,10 @@ def test_connection():
         with engine.connect() as conn:
             print("✓ Database connection successful!")
         
-        # Create tables
-        print("\nCreating database tables...")
-        SQLModel.metadata.create_all(engine)
-        print("✓ Tables created successfully!")
+        # Migrate the schema
+        print("\nApplying migrations...")
+        upgrade(engine)
+        print("✓ Schema is up to date!")
         
         # Initialize database with default data
         print("\nInitializing database with default data...")
@@ -0,0 +1,134 @@
+"""
+Shared fixtures. The app runs against a throwaway SQLite database.
+
+Settings are read when ``app`` is first imported, so the environment is set
+up here before any test module imports it.
+"""
+import os
+import shutil
+import socketserver
+import tempfile
+import threading
+from typing import Dict, Iterator, List
+
+import pytest
+
+_DB_DIR = tempfile.mkdtemp(prefix="weborder-tests-")
+os.environ["DATABASE_URL"] = f"sqlite:///{_DB_DIR}/test.db"
+os.environ["DATABASE_STARTUP_MODE"] = "migrate"
+os.environ["EMAIL_OUTBOX_ENABLED"] = "false"  # Tests drive the outbox worker themselves
+os.environ.setdefault("SECRET_KEY", "test-secret-key")
+os.environ.setdefault("DEBUG", "false")
+
+from fastapi.testclient import TestClient  # noqa: E402
+
+from app.core.config import settings  # noqa: E402
+from main import app  # noqa: E402
+
+
+@pytest.fixture(scope="session")
+def client() -> Iterator[TestClient]:
+    """Test client; startup migrates the database and creates the superuser."""
+    with TestClient(app) as test_client:
+        yield test_client
+    shutil.rmtree(_DB_DIR, ignore_errors=True)
+
+
+@pytest.fixture(scope="session")
+def admin_headers(client: TestClient) -> Dict[str, str]:
+    response = client.post(
+        "/api/v1/auth/login",
+        data={
+            "username": settings.FIRST_SUPERUSER_EMAIL,
+            "password": settings.FIRST_SUPERUSER_PASSWORD,
+        },
+    )
+    assert response.status_code == 200, response.text
+    return {"Authorization": f"Bearer {response.json()['access_token']}"}
+
+
+class _SMTPHandler(socketserver.StreamRequestHandler):
+    """Just enough SMTP for smtplib: EHLO, AUTH, MAIL, RCPT, DATA, RSET, NOOP, QUIT."""
+
+    def reply(self, line: str) -> None:
+        self.wfile.write(f"{line}\r\n".encode())
+
+    def handle(self) -> None:
+        server: "FakeSMTPServer" = self.server
+        with server.lock:
+            server.connections += 1
+        self.reply("220 fake-smtp ready")
+        recipients: List[str] = []
+        for raw in self.rfile:
+            command = raw.decode().strip()
+            verb = command.split(" ", 1)[0].upper()
+            if verb == "EHLO":
+                self.reply("250-fake-smtp")
+                self.reply("250 AUTH PLAIN LOGIN")
+            elif verb == "AUTH":
+                self.reply("235 Authentication succeeded")
+            elif verb == "MAIL":
+                recipients = []
+                self.reply("250 OK")
+            elif verb == "RCPT":
+                address = command.split(":", 1)[1].strip(" <>")
+                if address in server.rejected:
+                    self.reply("450 Mailbox unavailable, try again later")
+                else:
+                    recipients.append(address)
+                    self.reply("250 OK")
+            elif verb == "DATA":
+                self.reply("354 End data with <CR><LF>.<CR><LF>")
+                lines = []
+                for data in self.rfile:
+                    if data == b".\r\n":
+                        break
+                    lines.append(data)
+                with server.lock:
+                    server.messages.append((recipients, b"".join(lines).decode()))
+                self.reply("250 Queued")
+            elif verb in ("RSET", "NOOP"):
+                self.reply("250 OK")
+            elif verb == "QUIT":
+                self.reply("221 Bye")
+                return
+            else:
+                self.reply("502 Command not implemented")
+
+
+class FakeSMTPServer(socketserver.ThreadingTCPServer):
+    """Local SMTP server recording delivered messages; recipients in ``rejected`` get a 450."""
+
+    daemon_threads = True
+
+    def __init__(self) -> None:
+        super().__init__(("127.0.0.1", 0), _SMTPHandler)
+        self.lock = threading.Lock()
+        self.connections = 0
+        self.messages: List[tuple] = []
+        self.rejected: set = set()
+
+    @property
+    def port(self) -> int:
+        return self.server_address[1]
+
+
+@pytest.fixture
+def smtp_server(monkeypatch: pytest.MonkeyPatch) -> Iterator[FakeSMTPServer]:
+    """A fake SMTP server with the SMTP settings pointed at it."""
+    server = FakeSMTPServer()
+    thread = threading.Thread(target=server.serve_forever, daemon=True)
+    thread.start()
+    for name, value in {
+        "SMTP_HOST": "127.0.0.1",
+        "SMTP_PORT": server.port,
+        "SMTP_USERNAME": "outbox",
+        "SMTP_PASSWORD": "secret",
+        "SMTP_FROM_EMAIL": "noreply@weborder.test",
+        "SMTP_STARTTLS": False,
+        "SMTP_USE_SSL": False,
+    }.items():
+        monkeypatch.setattr(settings, name, value)
+    yield server
+    server.shutdown()
+    server.server_close()
@@ -0,0 +1,112 @@
+"""Outbox delivery against the local fake SMTP server."""
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import delete
+from sqlmodel import Session, select
+
+from app.core.config import settings
+from app.db.session import SessionLocal, engine
+from app.models.email_outbox import EmailOutbox
+from app.services.email_outbox_worker import EmailOutboxWorker
+from app.services.email_service import EmailService, email_service
+from app.utils.enums import EmailStatus
+
+
+@pytest.fixture
+def outbox_worker(client: TestClient, smtp_server) -> Iterator[EmailOutboxWorker]:
+    """A worker with its own SMTP connection, on an empty outbox."""
+    with Session(engine) as db:
+        db.execute(delete(EmailOutbox))
+        db.commit()
+    sender = EmailService()
+    yield EmailOutboxWorker(session_factory=SessionLocal, sender=sender)
+    sender.close()
+
+
+def _queue(*recipients: str) -> None:
+    with Session(engine) as db:
+        for number, to_email in enumerate(recipients):
+            message = email_service.queue_email(
+                db,
+                subject=f"Message {number}",
+                to_email=to_email,
+                html_body=f"<p>Message {number}</p>",
+                text_body=f"Message {number}",
+            )
+            assert message is not None
+
+
+def _outbox() -> List[EmailOutbox]:
+    with Session(engine) as db:
+        return db.exec(select(EmailOutbox).order_by(EmailOutbox.id)).all()
+
+
+def test_batch_is_sent_over_one_connection(outbox_worker, smtp_server):
+    _queue("a@example.com", "b@example.com", "c@example.com")
+
+    assert outbox_worker.run_once() == 3
+
+    assert [recipients for recipients, _ in smtp_server.messages] == [
+        ["a@example.com"], ["b@example.com"], ["c@example.com"]
+    ]
+    assert smtp_server.connections == 1
+    assert all(m.status == EmailStatus.SENT and m.attempts == 1 for m in _outbox())
+    assert outbox_worker.run_once() == 0
+
+
+def test_refused_message_is_retried_with_backoff_then_failed(
+    outbox_worker, smtp_server, monkeypatch: pytest.MonkeyPatch
+):
+    monkeypatch.setattr(settings, "EMAIL_OUTBOX_MAX_ATTEMPTS", 2)
+    smtp_server.rejected.add("later@example.com")
+    _queue("ok@example.com", "later@example.com")
+
+    before = datetime.utcnow()
+    assert outbox_worker.run_once() == 2
+
+    sent, refused = _outbox()
+    assert sent.status == EmailStatus.SENT
+    assert refused.status == EmailStatus.PENDING
+    assert refused.attempts == 1
+    assert "450" in refused.last_error
+    assert refused.next_attempt_at >= before + timedelta(seconds=settings.EMAIL_OUTBOX_BACKOFF_SECONDS)
+    assert outbox_worker.run_once() == 0  # Not due yet
+
+    with Session(engine) as db:
+        message = db.get(EmailOutbox, refused.id)
+        message.next_attempt_at = datetime.utcnow()
+        db.add(message)
+        db.commit()
+    assert outbox_worker.run_once() == 1
+
+    refused = _outbox()[1]
+    assert refused.status == EmailStatus.FAILED
+    assert refused.attempts == 2
+    assert smtp_server.connections == 1
+
+
+def test_order_endpoints_queue_mail_without_contacting_smtp(
+    client: TestClient, admin_headers: Dict[str, str], outbox_worker, smtp_server
+):
+    category = client.post("/api/v1/categories/", json={"name": "Outbox"}, headers=admin_headers).json()
+    product = client.post(
+        "/api/v1/products/",
+        json={"name": "Outbox dish", "price": 25000, "category_id": category["id"]},
+        headers=admin_headers,
+    ).json()
+    client.post("/api/v1/carts/items", json={"product_id": product["id"], "quantity": 1}, headers=admin_headers)
+    order = client.post("/api/v1/orders/", json={"delivery_type": "takeaway"}, headers=admin_headers)
+    assert order.status_code == 201, order.text
+    response = client.patch(
+        f"/api/v1/orders/{order.json()['id']}/status", json={"status": "confirmed"}, headers=admin_headers
+    )
+    assert response.status_code == 200, response.text
+
+    assert smtp_server.connections == 0
+    assert [m.status for m in _outbox()] == [EmailStatus.PENDING, EmailStatus.PENDING]
+
+    assert outbox_worker.run_once() == 2
+    assert [recipients for recipients, _ in smtp_server.messages] == [[settings.FIRST_SUPERUSER_EMAIL]] * 2
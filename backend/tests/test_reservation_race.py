@@ -0,0 +1,107 @@
+"""
+Concurrency stress test for reservation booking.
+
+Hundreds of bookings are fired at once from a thread pool through the test
+client; the slot rows must let exactly one of any set of overlapping
+bookings through.
+"""
+import random
+import time
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
+from datetime import datetime, timedelta
+from typing import Dict, List
+
+from fastapi.testclient import TestClient
+from sqlmodel import Session, select
+
+from app.crud.reservation import ACTIVE_STATUSES
+from app.db.session import engine
+from app.models.reservation import ReservationSlot, TableReservation
+
+WORKERS = 32
+
+
+def _create_tables(client: TestClient, headers: Dict[str, str], prefix: str, count: int) -> List[int]:
+    ids = []
+    for number in range(count):
+        response = client.post(
+            "/api/v1/tables/",
+            json={"table_number": f"{prefix}{number}", "capacity": 4},
+            headers=headers,
+        )
+        assert response.status_code == 201, response.text
+        ids.append(response.json()["id"])
+    return ids
+
+
+def _book_all(client: TestClient, headers: Dict[str, str], bookings: List[dict]) -> List[int]:
+    def book(body: dict) -> int:
+        return client.post("/api/v1/reservations/", json=body, headers=headers).status_code
+
+    with ThreadPoolExecutor(WORKERS) as pool:
+        return list(pool.map(book, bookings))
+
+
+def _active_reservations(table_ids: List[int]) -> List[TableReservation]:
+    with Session(engine) as db:
+        return db.exec(
+            select(TableReservation).where(
+                TableReservation.table_id.in_(table_ids),
+                TableReservation.status.in_(ACTIVE_STATUSES),
+            )
+        ).all()
+
+
+def _booking_day() -> datetime:
+    return (datetime.utcnow() + timedelta(days=3)).replace(hour=8, minute=0, second=0, microsecond=0)
+
+
+def test_same_slot_is_booked_once(client: TestClient, admin_headers: Dict[str, str]):
+    (table_id,) = _create_tables(client, admin_headers, "RACE-SAME-", 1)
+    start = _booking_day()
+    body = {
+        "table_id": table_id,
+        "start_time": start.isoformat(),
+        "end_time": (start + timedelta(hours=1)).isoformat(),
+    }
+
+    codes = Counter(_book_all(client, admin_headers, [body] * 200))
+
+    assert codes == {201: 1, 409: 199}
+    assert len(_active_reservations([table_id])) == 1
+
+
+def test_concurrent_bookings_never_overlap(client: TestClient, admin_headers: Dict[str, str]):
+    table_ids = _create_tables(client, admin_headers, "RACE-MIX-", 5)
+    day = _booking_day()
+    rng = random.Random(20261017)
+    bookings = []
+    for _ in range(400):
+        start = day + timedelta(minutes=30 * rng.randint(0, 20))
+        bookings.append({
+            "table_id": rng.choice(table_ids),
+            "start_time": start.isoformat(),
+            "end_time": (start + timedelta(minutes=30 * rng.randint(1, 4))).isoformat(),
+        })
+
+    started = time.perf_counter()
+    codes = Counter(_book_all(client, admin_headers, bookings))
+    elapsed = time.perf_counter() - started
+    print(f"{len(bookings)} bookings in {elapsed:.2f}s ({len(bookings) / elapsed:.0f}/s): {dict(codes)}")
+
+    assert set(codes) <= {201, 409}
+    reservations = _active_reservations(table_ids)
+    assert len(reservations) == codes[201]
+    for table_id in table_ids:
+        booked = sorted(
+            (r.start_time, r.end_time) for r in reservations if r.table_id == table_id
+        )
+        for (_, previous_end), (next_start, _) in zip(booked, booked[1:]):
+            assert previous_end <= next_start, f"double booking on table {table_id}"
+
+    with Session(engine) as db:
+        slots = db.exec(
+            select(ReservationSlot).where(ReservationSlot.table_id.in_(table_ids))
+        ).all()
+    assert {slot.reservation_id for slot in slots} == {r.id for r in reservations}
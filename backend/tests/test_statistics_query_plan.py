@@ -0,0 +1,108 @@
+"""
+Query-plan regression test for the statistics queries.
+
+The statements the statistics endpoints and the rollup rebuild run on a
+seeded database are captured and explained; ``orders`` and
+``daily_revenue`` must be read through an index seek (SQLite ``SEARCH``),
+never a full ``SCAN``.
+"""
+import random
+import re
+from contextlib import contextmanager
+from datetime import datetime, timedelta
+from typing import Dict, Iterator, List, Tuple
+
+import pytest
+from fastapi.testclient import TestClient
+from sqlalchemy import event
+from sqlmodel import Session
+
+from app.crud.daily_revenue import daily_revenue as daily_revenue_crud
+from app.db.session import engine
+from app.models.order import Order
+from app.services.statistics_cache import statistics_cache
+from app.utils.enums import OrderStatus, PaymentMethod
+
+CHECKED_TABLES = ("orders", "daily_revenue")
+SEED_YEARS = (2031, 2032)
+
+
+@pytest.fixture(scope="module")
+def seeded_orders(client: TestClient) -> None:
+    rng = random.Random(7)
+    statuses = list(OrderStatus)
+    with Session(engine) as db:
+        for _ in range(600):
+            created_at = datetime(rng.choice(SEED_YEARS), rng.randint(1, 12), rng.randint(1, 28), rng.randint(8, 20))
+            status = rng.choice(statuses)
+            db.add(
+                Order(
+                    user_id=1,
+                    total_amount=rng.randint(10, 200) * 1000,
+                    status=status,
+                    payment_method=rng.choice(list(PaymentMethod)),
+                    created_at=created_at,
+                    updated_at=created_at + timedelta(minutes=30),
+                    completed_at=created_at + timedelta(minutes=45) if status == OrderStatus.COMPLETED else None,
+                )
+            )
+        db.commit()
+        daily_revenue_crud.rebuild(db)
+
+
+@contextmanager
+def captured_selects() -> Iterator[List[Tuple[str, tuple]]]:
+    statements: List[Tuple[str, tuple]] = []
+
+    def capture(conn, cursor, statement, parameters, context, executemany):
+        if statement.lstrip().upper().startswith("SELECT"):
+            statements.append((statement, parameters))
+
+    event.listen(engine, "before_cursor_execute", capture)
+    try:
+        yield statements
+    finally:
+        event.remove(engine, "before_cursor_execute", capture)
+
+
+def full_scans(statements: List[Tuple[str, tuple]]) -> List[str]:
+    """Plan lines that scan a checked table instead of seeking an index."""
+    scans = []
+    with engine.connect() as connection:
+        raw = connection.connection.dbapi_connection
+        for statement, parameters in statements:
+            if not any(re.search(rf"\b{table}\b", statement) for table in CHECKED_TABLES):
+                continue
+            for row in raw.execute(f"EXPLAIN QUERY PLAN {statement}", parameters):
+                detail = row[-1]
+                if any(re.match(rf"SCAN {table}\b", detail) for table in CHECKED_TABLES):
+                    scans.append(f"{detail}\n    in: {' '.join(statement.split())}")
+    return scans
+
+
+@pytest.mark.parametrize(
+    "path, params",
+    [
+        ("/api/v1/statistics/overview", {"date_from": "2031-03-01", "date_to": "2031-03-31"}),
+        ("/api/v1/statistics/revenue", {"year": 2031}),
+        ("/api/v1/statistics/revenue", {"year": 2031, "month": 12}),
+        ("/api/v1/statistics/revenue-by-month", {"year": 2032}),
+        ("/api/v1/statistics/orders", {"year": 2032}),
+        ("/api/v1/statistics/orders", {"year": 2032, "month": 2}),
+    ],
+)
+def test_statistics_queries_seek_indexes(
+    client: TestClient, admin_headers: Dict[str, str], seeded_orders, path: str, params: dict
+):
+    statistics_cache.invalidate()
+    with captured_selects() as statements:
+        response = client.get(path, params=params, headers=admin_headers)
+    assert response.status_code == 200, response.text
+    assert any("orders" in s or "daily_revenue" in s for s, _ in statements)
+    assert full_scans(statements) == []
+
+
+def test_rollup_rebuild_seeks_status_index(seeded_orders):
+    with captured_selects() as statements, Session(engine) as db:
+        daily_revenue_crud.rebuild(db)
+    assert full_scans(statements) == []
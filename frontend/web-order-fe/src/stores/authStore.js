@@ -223,7 +223,7 @@ export const useAuthStore = create((set, get) => ({
         }
 
         try {
-            await axios.post(
+            const response = await axios.post(
                 `${API_URL}/users/${currentUser.id}/change-password`,
                 {
                     current_password: currentPassword,
@@ -237,6 +237,13 @@ export const useAuthStore = create((set, get) => ({
                 }
             );
 
+            // Changing the password revokes the old token; keep the session with the new one
+            const { access_token } = response.data;
+            if (access_token) {
+                localStorage.setItem('access_token', access_token);
+                set({ token: access_token });
+            }
+
             return { success: true };
         } catch (error) {
             console.error('Change password failed:', error);